@@ -0,0 +1,187 @@
+"""
+Benchmarks comparing basedata.ops column cleansing methods against the
+per-value implementations they replace
+
+Usage::
+
+    python benchmarks/benchmark_cols.py --rows 1000000
+"""
+import argparse
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from basedata.ops import BaseDataOps
+from basedata.ops.base import regex_sub_value, regex_replace_value
+
+
+def make_benchmark_dataframe(rows, seed=0):
+    """
+    builds dataframe with dirty string ID, integer ID, dirty code, and float
+    ID columns, codes have only 1000 distinct values
+    """
+    rng = np.random.default_rng(seed)
+    ids = rng.integers(10000000, 99999999, rows).astype(str).astype(object)
+    dirty = rng.random(rows)
+    ids[dirty < 0.2] = np.char.add(ids[dirty < 0.2].astype(str), '-A')
+    ids[dirty > 0.95] = np.nan
+    int_ids = rng.integers(1000000, 99999999, rows)
+    codes = ids[rng.integers(0, min(rows, 1000), rows)]
+    float_ids = np.where(dirty > 0.95, np.nan, int_ids)
+    return pd.DataFrame({'id': ids, 'int_id': int_ids, 'code': codes,
+                         'float_id': float_ids})
+
+
+def substitute_chars_per_value(dataframe, column, pattern, val_sub):
+    """substitute_chars implementation calling re.sub once per value"""
+    return dataframe[column].astype(str).apply(
+        lambda x: regex_sub_value(val=x, pattern=pattern, val_sub=val_sub)
+    )
+
+
+def substitute_chars_vectorized(dataframe, column, pattern, val_sub):
+    """current BaseDataOps.substitute_chars implementation"""
+    return BaseDataOps(dataframe, False).substitute_chars(
+        column, pattern, val_sub, inplace=False, return_series=True,
+    )
+
+
+def strip_nonnumeric_vectorized(dataframe, column, pattern, val_sub):
+    """current BaseDataOps.strip_nonnumeric implementation"""
+    return BaseDataOps(dataframe, False).strip_nonnumeric(
+        column, pattern, val_sub, inplace=False, return_series=True,
+    )
+
+
+def remove_offlenIDs_per_value(dataframe, column, target_len):
+    """remove_offlenIDs implementation calling re.match once per value"""
+    return dataframe[column].astype(str).apply(
+        lambda x: regex_replace_value(
+            val=x,
+            val_new=np.nan,
+            pattern='[0-9]{{{0}}}$'.format(target_len),
+        )
+    )
+
+
+def remove_offlenIDs_vectorized(dataframe, column, target_len):
+    """current BaseDataOps.remove_offlenIDs implementation"""
+    return BaseDataOps(dataframe, False).remove_offlenIDs(
+        column, target_len, inplace=False, return_series=True,
+    )
+
+
+def replace_blankIDs_per_row(dataframe, column, replace_col):
+    """replace_blankIDs implementation calling a function once per row"""
+    return dataframe.apply(
+        lambda row:
+        row[replace_col] if pd.isnull(row[column])
+        else row[column],
+        axis=1,
+    )
+
+
+def replace_blankIDs_vectorized(dataframe, column, replace_col):
+    """current BaseDataOps.replace_blankIDs implementation"""
+    return BaseDataOps(dataframe, False).replace_blankIDs(
+        column, replace_col, inplace=False, return_series=True,
+    )
+
+
+def make_benchmark_mapping(rows, seed=0):
+    """builds two column mapping table of integer IDs to string codes"""
+    rng = np.random.default_rng(seed)
+    keys = rng.integers(1000000, 99999999, rows)
+    return pd.DataFrame({'key': keys, 'code': keys.astype(str)})
+
+
+MAPPING = make_benchmark_mapping(1000000)
+
+
+def map_values_dict(dataframe, column, mapping):
+    """map_values implementation mapping a dict built from the mapping"""
+    map_dict = dict(zip(mapping['key'], mapping['code']))
+    return dataframe[column].map(map_dict).fillna(dataframe[column])
+
+
+def map_values_join(dataframe, column, mapping):
+    """current BaseDataOps.map_values implementation"""
+    return BaseDataOps(dataframe, False).map_values(
+        column, mapping, inplace=False, return_series=True,
+    )
+
+
+BENCHMARKS = {
+    'substitute_chars': (
+        substitute_chars_per_value,
+        substitute_chars_vectorized,
+        ('id', '[-]', ''),
+    ),
+    'strip_nonnumeric': (
+        substitute_chars_per_value,
+        strip_nonnumeric_vectorized,
+        ('id', '[^0-9]', ''),
+    ),
+    'strip_nonnumeric code': (
+        substitute_chars_per_value,
+        strip_nonnumeric_vectorized,
+        ('code', '[^0-9]', ''),
+    ),
+    'remove_offlenIDs': (
+        remove_offlenIDs_per_value,
+        remove_offlenIDs_vectorized,
+        ('id', 8),
+    ),
+    'remove_offlenIDs int': (
+        remove_offlenIDs_per_value,
+        remove_offlenIDs_vectorized,
+        ('int_id', 8),
+    ),
+    'remove_offlenIDs float': (
+        remove_offlenIDs_per_value,
+        remove_offlenIDs_vectorized,
+        ('float_id', 8),
+    ),
+    'replace_blankIDs': (
+        replace_blankIDs_per_row,
+        replace_blankIDs_vectorized,
+        ('id', 'int_id'),
+    ),
+    'map_values': (
+        map_values_dict,
+        map_values_join,
+        ('int_id', MAPPING),
+    ),
+}
+
+
+def run_benchmarks(rows, repeat):
+    """times each benchmark and prints the speedup of the current method"""
+    dataframe = make_benchmark_dataframe(rows)
+    print('{0:<24}{1:>12}{2:>12}{3:>10}'.format(
+        'method', 'before (s)', 'after (s)', 'speedup'
+    ))
+    for name, (before, after, args) in BENCHMARKS.items():
+        pd.testing.assert_series_equal(
+            before(dataframe, *args),
+            after(dataframe, *args),
+            check_names=False,
+        )
+        time_before = min(timeit.repeat(
+            lambda: before(dataframe, *args), number=1, repeat=repeat
+        ))
+        time_after = min(timeit.repeat(
+            lambda: after(dataframe, *args), number=1, repeat=repeat
+        ))
+        print('{0:<24}{1:>12.3f}{2:>12.3f}{3:>9.1f}x'.format(
+            name, time_before, time_after, time_before / time_after
+        ))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=3)
+    arguments = parser.parse_args()
+    run_benchmarks(arguments.rows, arguments.repeat)
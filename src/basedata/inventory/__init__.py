@@ -141,3 +141,25 @@ def make_datafile_dataframe(directory, columns=('directory', 'filename'),
         datafile_df.to_csv(to_file, index=False, **kwargs)
     if return_df:
         return datafile_df
+
+
+def list_datafile_paths(datafile_df, directory,
+                        columns=('directory', 'filename')):
+    """
+    Generates a list of datafile paths from a dataframe generated by
+    make_datafile_dataframe
+
+    :param datafile_df: pandas.DataFrame of subdirectory names and associated
+        datafiles, as returned by make_datafile_dataframe
+    :param directory: str pathname of the target parent directory for which
+        datafile_df was generated
+    :param columns: tuple specifying the name of the subdirectory and
+        filename columns, default=('directory', 'filename')
+    :return: list of paths for each datafile in datafile_df
+    """
+    dir_col, file_col = columns
+    datafile_paths = [
+        os.path.join(directory, subdir, filename)
+        for subdir, filename in zip(datafile_df[dir_col], datafile_df[file_col])
+    ]
+    return datafile_paths
@@ -0,0 +1,183 @@
+"""
+This submodule, basedata.log, contains the OperationLog class for recording
+structured log records of the data transformations performed by basedata.ops
+class methods.
+"""
+import json
+import math
+import time
+import tracemalloc
+from datetime import datetime
+
+import pandas as pd
+
+
+LOG_COLUMNS = [
+    'operation',
+    'parameters',
+    'started',
+    'wall_time',
+    'cpu_time',
+    'rows_before',
+    'rows_after',
+    'columns_before',
+    'columns_after',
+    'bytes_before',
+    'bytes_after',
+    'peak_memory',
+]
+
+
+def summarize_value(value, max_len=80):
+    """
+    Generates a compact, JSON serializable version of a parameter value
+
+    Strings, finite numbers, booleans, and None are returned unchanged, all
+    other values, including nan and inf, which are not valid JSON, are
+    returned as their repr, truncated to max_len characters.
+
+    :param value: object to summarize
+    :param max_len: int maximum length of repr strings, default=80
+    :return: str, int, float, bool, or None
+    """
+    if value is None or isinstance(value, (str, int, bool)):
+        return value
+    if isinstance(value, float) and math.isfinite(value):
+        return float(value)
+    text = repr(value)
+    if len(text) > max_len:
+        text = text[:max_len - 3] + '...'
+    return text
+
+
+def frame_stats(dataframe, deep=False):
+    """
+    Generates the shape and memory usage of a dataframe
+
+    :param dataframe: pandas.DataFrame
+    :param deep: bool whether to include the memory used by the values of
+        object columns, default=False
+    :return: tuple of int rows, columns, and bytes
+    """
+    rows, columns = dataframe.shape
+    n_bytes = int(dataframe.memory_usage(index=True, deep=deep).sum())
+    return rows, columns, n_bytes
+
+
+class OperationLog(object):
+    """
+    OperationLog records the operation name, parameters, wall and CPU time,
+    rows and columns before and after, and memory use of each basedata.ops
+    method call made against a class instance whose log is started
+
+    Memory is reported as the size of self.df before and after each call.
+    When deep_memory=True, the size includes the values of object columns,
+    which are measured one value at a time before and after every call. When
+    trace_memory=True, the peak memory allocated during each call, relative
+    to the memory allocated when the call started, is also recorded using
+    tracemalloc, which slows down all allocations while it is tracing.
+
+    :param trace_memory: bool whether to record peak memory with tracemalloc,
+        default=False
+    :param deep_memory: bool whether to measure the values of object
+        columns, default=False
+    """
+
+    def __init__(self, trace_memory=False, deep_memory=False):
+        self.trace_memory = trace_memory
+        self.deep_memory = deep_memory
+        self.records = []
+        self._depth = 0
+
+    def record(self, name, arguments, get_frame, operation):
+        """
+        Calls an operation and appends a log record describing the call,
+        nested calls made by the operation itself are not recorded
+
+        :param name: str name of the operation
+        :param arguments: dict of the operation's parameters
+        :param get_frame: function returning the dataframe transformed by the
+            operation
+        :param operation: function that performs the operation
+        :return: result of the operation
+        """
+        if self._depth:
+            return operation()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        rows_before, columns_before, bytes_before = frame_stats(
+            get_frame(), self.deep_memory,
+        )
+        if self.trace_memory:
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+            memory_start, _ = tracemalloc.get_traced_memory()
+        started = datetime.now().isoformat()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        self._depth += 1
+        try:
+            result = operation()
+        finally:
+            self._depth -= 1
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+        peak_memory = None
+        if self.trace_memory:
+            _, memory_peak = tracemalloc.get_traced_memory()
+            peak_memory = max(memory_peak - memory_start, 0)
+        rows_after, columns_after, bytes_after = frame_stats(
+            get_frame(), self.deep_memory,
+        )
+        self.records.append({
+            'operation': name,
+            'parameters': {
+                key: summarize_value(value)
+                for key, value in arguments.items()
+            },
+            'started': started,
+            'wall_time': wall_time,
+            'cpu_time': cpu_time,
+            'rows_before': rows_before,
+            'rows_after': rows_after,
+            'columns_before': columns_before,
+            'columns_after': columns_after,
+            'bytes_before': bytes_before,
+            'bytes_after': bytes_after,
+            'peak_memory': peak_memory,
+        })
+        return result
+
+    def copy(self):
+        """
+        Generates a copy of the log that records operations independently
+
+        :return: OperationLog
+        """
+        log = OperationLog(self.trace_memory, self.deep_memory)
+        log.records = [dict(record) for record in self.records]
+        return log
+
+    def to_dataframe(self):
+        """
+        Generates a dataframe with one row per log record
+
+        :return: pandas.DataFrame
+        """
+        return pd.DataFrame.from_records(self.records, columns=LOG_COLUMNS)
+
+    def to_json(self, filename=None):
+        """
+        Generates the log records in JSON lines format, one JSON object per
+        line, and saves them to file if specified
+
+        :param filename: str optional filename to which the JSON lines are
+            saved, default=None
+        :return: str JSON lines, returned only if filename is None
+        """
+        lines = '\n'.join(
+            json.dumps(record, allow_nan=False) for record in self.records
+        )
+        if filename is None:
+            return lines
+        with open(filename, 'w') as f:
+            f.write(lines + '\n' if lines else '')
@@ -2,18 +2,25 @@
 This submodule contains the BaseDataOps class, which aggregates basedata.ops
 mixin classes and BaseDataClass functionality.
 """
-from .base import BaseDataClass
+from .base import BaseDataClass, instrument_operations
 from .cols import ColumnConversionsMixin
 from .ids import DedupeMixin, ValidIDsMixin
+from .memory import MemoryMixin
+from .profile import ProfileMixin
+from .shared import SharedMemoryMixin
 
 
 Mixins = [
     ColumnConversionsMixin,
     DedupeMixin,
     ValidIDsMixin,
+    MemoryMixin,
+    ProfileMixin,
+    SharedMemoryMixin,
 ]
 
 
+@instrument_operations
 class BaseDataOps(*Mixins, BaseDataClass):
     """
     The BaseDataOps class inherits core class functionality from the
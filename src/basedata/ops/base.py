@@ -2,12 +2,43 @@
 This module contains the BaseDataClass parent class and common functions that
 are that are reused across basedata.ops submodules.
 """
+import inspect
+import operator
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial, wraps
 
 import numpy as np
 import pandas as pd
 
+from ..inventory import list_datafile_paths
+from ..log import OperationLog
+from .cache import LoadCache
+from .memory import downcast_dataframe
+from .plan import LazyDataOps, describe_call
+from .stream import ChunkedPipeline
+from .tracking import ChangeTracker
+from .unique import apply_unique
+from .writers import COMPRESSION_EXTENSIONS, infer_compression,\
+    is_block_compression, write_csv_blocks
+
+
+# file extensions read and written with pyarrow
+COLUMNAR_EXTENSIONS = ('.parquet', '.feather', '.arrow', '.ipc')
+
+FILTER_OPERATORS = {
+    '==': operator.eq,
+    '=': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'in': lambda series, value: series.isin(value),
+    'not in': lambda series, value: ~series.isin(value),
+}
+
 
 def inplace_return_series(dataframe, column, series,
                           inplace, return_series, target_column=None):
@@ -31,6 +62,151 @@ def inplace_return_series(dataframe, column, series,
         return series
 
 
+def failure_counts(original, converted, dropna=False, **kwargs):
+    """
+    helper function returning a value_counts series of the original values
+    of a column that were converted to null values
+
+    :param original: pandas.Series before conversion
+    :param converted: pandas.Series after conversion, with the same length
+    :param dropna: bool whether to drop na values from resulting value_count
+        series, default=False
+    :param kwargs: additional arguments for pandas value_counts method
+    :return: pandas.Series
+    """
+    return original[converted.isnull().to_numpy()].value_counts(
+        dropna=dropna, **kwargs
+    )
+
+
+def inplace_return_failures(dataframe, column, series, failures,
+                            inplace, return_series, target_column=None):
+    """
+    helper function extending inplace_return_series for conversions that
+    optionally report the values that could not be converted
+
+    :param failures: pandas.Series value_counts of failed values, or None if
+        failures were not requested
+    :return: pandas.Series if only one of return_series or failures is
+        requested, tuple of the modified pandas.Series and failures if both
+        are requested
+    """
+    result = inplace_return_series(dataframe, column, series,
+                                   inplace, return_series, target_column)
+    if failures is None:
+        return result
+    return (result, failures) if return_series else failures
+
+
+def is_column_list(column):
+    """
+    Determines whether a column argument names a list of columns
+
+    :param column: str name of a column, or list or tuple of str names
+    :return: bool
+    """
+    return isinstance(column, (list, tuple))
+
+
+def convert_columns(dataframe, columns, function, jobs=1, processes=False):
+    """
+    helper function applying a conversion function to each of a list of
+    columns, in a pool of jobs worker threads, or processes, when jobs > 1
+
+    With processes=True each column is pickled and sent to a worker process,
+    so function must be picklable, i.e. a module-level function or a
+    functools.partial of one.
+
+    :param dataframe: pandas.DataFrame holding the columns
+    :param columns: list of str names of columns to convert
+    :param function: function converting a pandas.Series
+    :param jobs: int number of columns converted in parallel, default=1
+        converts columns one after another in the current thread
+    :param processes: bool whether to convert columns in worker processes
+        rather than threads, default=False
+    :return: list of the results of function for each column, in the order
+        of columns
+    """
+    series_list = [dataframe[column] for column in columns]
+    if jobs > 1 and len(series_list) > 1:
+        Executor = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        with Executor(max_workers=min(jobs, len(series_list))) as executor:
+            return list(executor.map(function, series_list))
+    return [function(series) for series in series_list]
+
+
+def assign_columns(dataframe, columns, series_list):
+    """
+    helper function assigning a list of series to columns of a dataframe
+    once all of them have been converted, so that self.df is not changed
+    while conversions are still running
+
+    Each series is assigned with dataframe[column] = series, which replaces
+    existing columns along with their data types. pandas assigns a list of
+    columns one column at a time as well, i.e. dataframe[columns] = frame,
+    so the columns are not assigned in a single operation.
+
+    :param dataframe: pandas.DataFrame to modify in place
+    :param columns: list of str names of the columns to assign
+    :param series_list: list of pandas.Series in the order of columns
+    """
+    for column, series in zip(columns, series_list):
+        dataframe[column] = series
+
+
+def inplace_return_columns(dataframe, columns, series_list, failures,
+                           inplace, return_series, target_column=None):
+    """
+    helper function extending inplace_return_failures to conversions of a
+    list of columns
+
+    :param columns: list of str names of the converted columns
+    :param series_list: list of converted pandas.Series in the order of
+        columns
+    :param failures: list of pandas.Series value_counts of failed values in
+        the order of columns, or None if failures were not requested
+    :param target_column: None or list of str names of new columns created,
+        in the order of columns, default=None
+    :return: pandas.DataFrame of the modified columns if return_series is
+        True, dict of failures by column if failures are requested, or a
+        tuple of both if both are requested
+    """
+    targets = list(target_column) if target_column else list(columns)
+    if len(targets) != len(columns):
+        raise ValueError(
+            'target_column must name one target column for each column.'
+        )
+    if inplace:
+        assign_columns(dataframe, targets, series_list)
+    result = None
+    if return_series:
+        result = pd.concat(series_list, axis=1, keys=targets)
+    if failures is None:
+        return result
+    failures = dict(zip(columns, failures))
+    return (result, failures) if return_series else failures
+
+
+# maximum number of compiled regex patterns kept by compile_pattern
+REGEX_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=REGEX_CACHE_SIZE)
+def compile_pattern(pattern):
+    """
+    Compiles a regex pattern, keeping the REGEX_CACHE_SIZE most recently used
+    patterns so that they are compiled only once. Unlike re's own cache, this
+    cache is used only by basedata.ops, so patterns are not evicted by other
+    code that uses re.
+
+    Hits and misses are reported by compile_pattern.cache_info().
+
+    :param pattern: str regex pattern or compiled pattern
+    :return: re.Pattern compiled pattern
+    """
+    return re.compile(pattern)
+
+
 def regex_sub_value(val, pattern, val_sub='',
                     val_exception=np.nan, val_none=np.nan):
     """
@@ -46,7 +222,7 @@ def regex_sub_value(val, pattern, val_sub='',
     :return: str value based on input parameters
     """
     try:
-        stripped = re.sub(pattern, val_sub, val)
+        stripped = compile_pattern(pattern).sub(val_sub, val)
         new_val = val_none if stripped == '' else stripped
         return new_val
     except:
@@ -68,7 +244,7 @@ def regex_replace_value(val, val_new, pattern,
     :return: str output value based on input parameters
     """
     try:
-        if not bool(re.match(pattern, val)):
+        if not bool(compile_pattern(pattern).match(val)):
             return val_new
         else:
             return val
@@ -76,71 +252,879 @@ def regex_replace_value(val, val_new, pattern,
         return val_exception
 
 
+# character class patterns stripped with str methods by strip_char_class
+DIGIT_PATTERNS = ('[^0-9]', '[^\\d]')
+ALNUM_PATTERNS = ('[^a-zA-Z0-9]', '[^A-Za-z0-9]', '[^0-9a-zA-Z]',
+                  '[^0-9A-Za-z]')
+WHITESPACE_PATTERNS = ('\\s', '\\s+', '[\\s]', '[\\s]+')
+
+# pattern syntax matching ASCII control characters differently in re and RE2
+ARROW_CONTROL_PATTERNS = re.compile(r'\\[sS]|\$')
+
+# pattern syntax read differently by re and RE2: POSIX classes, i.e.
+# '[[:alpha:]]', repetitions without a lower bound, i.e. '{,2}', which RE2
+# reads literally, and the U flag, which makes RE2 repetitions non-greedy
+ARROW_SYNTAX_PATTERNS = re.compile(r'\[[:.=]|\{,|\(\?[a-zA-Z-]*U')
+
+# patterns matching IDs of n digits, i.e. '[0-9]{8}$'
+FIXED_LENGTH_DIGITS = re.compile(r'(?:\[0-9\]|\\d|\[\\d\])\{(\d+)\}\$')
+
+
+def strip_char_class(values, pattern):
+    """
+    Strips the characters matched by a common character class pattern from
+    str values using str methods instead of a regex substitution per value,
+    the result is identical to re.sub(pattern, '', val) for each value
+
+    Values containing only ASCII digits or ASCII letters and digits are
+    returned unchanged without being searched, and whitespace is stripped by
+    splitting on it, which matches the same characters as regex \\s.
+
+    :param values: iterable of str values
+    :param pattern: str regex pattern, one of DIGIT_PATTERNS,
+        ALNUM_PATTERNS, or WHITESPACE_PATTERNS
+    :return: list of str values, or None if the pattern is not supported
+    """
+    if pattern in WHITESPACE_PATTERNS:
+        return [''.join(val.split()) for val in values]
+    if (pattern not in DIGIT_PATTERNS + ALNUM_PATTERNS
+            or not hasattr(str, 'isascii')):  # python < 3.7
+        return None
+    sub = compile_pattern(pattern).sub
+    if pattern in DIGIT_PATTERNS:
+        return [
+            val if val.isascii() and val.isdigit() else sub('', val)
+            for val in values
+        ]
+    return [
+        val if val.isascii() and val.isalnum() else sub('', val)
+        for val in values
+    ]
+
+
+def arrow_regex_sub(values, pattern, val_sub):
+    """
+    Replaces characters in an array of str values with a single
+    pyarrow.compute.replace_substring_regex call over the whole array
+
+    pyarrow matches patterns with RE2 rather than re. The substitution is
+    made only where both engines give the same result: when the values are
+    ASCII, when patterns matching whitespace or line ends are applied to
+    values without control characters, when val_sub contains no backslash
+    escapes, when the pattern cannot match an empty string, and when the
+    pattern contains no syntax read differently by RE2, see
+    ARROW_SYNTAX_PATTERNS.
+
+    :param values: numpy.ndarray of str values
+    :param pattern: str regex pattern used to identify characters to subsitute
+    :param val_sub: str value to substitute for specified input characters
+    :return: numpy.ndarray of str values, or None if pyarrow is not installed
+        or the substitution cannot be made with pyarrow
+    """
+    try:
+        import pyarrow
+        from pyarrow import compute
+    except ImportError:
+        return None
+    if (
+        '\\' in val_sub
+        or ARROW_SYNTAX_PATTERNS.search(pattern)
+        or compile_pattern(pattern).search('') is not None
+    ):
+        return None
+    try:
+        array = pyarrow.array(values, type=pyarrow.string())
+        if not compute.all(compute.string_is_ascii(array)).as_py():
+            return None
+        if ARROW_CONTROL_PATTERNS.search(pattern) and compute.any(
+            compute.match_substring_regex(array, '[[:cntrl:]]')
+        ).as_py():
+            return None
+        return compute.replace_substring_regex(
+            array, pattern, val_sub,
+        ).to_numpy(zero_copy_only=False)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError,
+            pyarrow.ArrowNotImplementedError):
+        return None
+
+
+def regex_sub_array(values, pattern, val_sub='',
+                    val_exception=np.nan, val_none=np.nan):
+    """
+    Replaces characters in an array of string values based on specified
+    Regex pattern, returning the same values as regex_sub_value applied to
+    each value
+
+    Arrays of str values are substituted by a single pyarrow call over the
+    whole array where it gives the same result as re, see arrow_regex_sub.
+    Otherwise common character class patterns are stripped with str methods,
+    see strip_char_class, and other patterns are compiled once and
+    substituted value by value, which is faster than
+    pandas.Series.str.replace on object arrays. If the substitution raises an
+    exception, each value is substituted separately so that val_exception is
+    returned only for the values that raise it.
+
+    :param values: numpy.ndarray or pandas.Series of str values
+    :param pattern: str regex pattern used to identify characters to subsitute
+    :param val_sub: str value to substitute for specified input characters
+    :param val_exception: str or np.nan value to return for values that
+        raise an exception (default=np.nan)
+    :param val_none: str or np.nan value to return for values that are empty
+        after substitution (default=np.nan)
+    :return: numpy.ndarray of object values
+    """
+    values = np.asarray(values, dtype=object)
+    try:
+        is_str = pd.api.types.infer_dtype(values, skipna=False) == 'string'
+        stripped = arrow_regex_sub(values, pattern, val_sub) if is_str \
+            else None
+        if stripped is None and val_sub == '':
+            stripped = strip_char_class(values, pattern)
+        if stripped is None:
+            sub = compile_pattern(pattern).sub
+            stripped = [sub(val_sub, val) for val in values]
+    except Exception:
+        result = np.empty(len(values), dtype=object)
+        result[:] = [
+            regex_sub_value(val, pattern, val_sub, val_exception, val_none)
+            for val in values
+        ]
+        return result
+    result = np.empty(len(values), dtype=object)
+    result[:] = stripped
+    result[result == ''] = val_none
+    return result
+
+
+def regex_sub_series(series, pattern, val_sub='',
+                     val_exception=np.nan, val_none=np.nan):
+    """
+    Replaces characters in the string values of a series, see
+    regex_sub_array, once per distinct value when the series qualifies for
+    basedata.ops.unique.apply_unique
+
+    :param series: pandas.Series of values, converted to str
+    :return: pandas.Series
+    """
+    return apply_unique(
+        series,
+        lambda values: regex_sub_array(
+            values=values.astype(str),
+            pattern=pattern,
+            val_sub=val_sub,
+            val_exception=val_exception,
+            val_none=val_none,
+        ),
+    )
+
+
+def regex_replace_array(values, val_new, pattern, val_exception=np.nan):
+    """
+    Replaces string values in an array if Regex pattern is not satisfied by
+    the value, returning the same values as regex_replace_value applied to
+    each value
+
+    The pattern is compiled once for all values. For patterns of the form
+    '[0-9]{n}$', values of n ASCII digits are accepted without being
+    matched. If matching raises an exception, each value is matched
+    separately so that val_exception is returned only for the values that
+    raise it.
+
+    :param values: numpy.ndarray or pandas.Series of str values
+    :param val_new: str replacement value if input pattern is not satisfied
+    :param pattern: str regex pattern used to identify values to replace
+    :param val_exception: str or np.nan value to return for values that
+        raise an exception (default=np.nan)
+    :return: numpy.ndarray of object values
+    """
+    values = np.asarray(values, dtype=object)
+    fixed_len = None
+    if isinstance(pattern, str) and hasattr(str, 'isascii'):
+        fixed_len = FIXED_LENGTH_DIGITS.fullmatch(pattern)
+    try:
+        match = compile_pattern(pattern).match
+        if fixed_len is None:
+            replaced = [val if match(val) else val_new for val in values]
+        else:
+            n = int(fixed_len.group(1))
+            replaced = [
+                val if (len(val) == n and val.isascii() and val.isdigit())
+                or match(val) else val_new
+                for val in values
+            ]
+    except Exception:
+        replaced = [
+            regex_replace_value(val, val_new, pattern, val_exception)
+            for val in values
+        ]
+    result = np.empty(len(values), dtype=object)
+    result[:] = replaced
+    return result
+
+
+def share_columns(dataframe):
+    """
+    Generates a new pandas.DataFrame that shares the underlying data of each
+    column of the input dataframe without copying it
+
+    Each column of the new dataframe is stored as its own block, so that
+    assigning a new series to one column replaces only that column and never
+    copies, or writes to, the data of the input dataframe's other columns.
+    Methods that modify column values in place (i.e. with .loc assignments or
+    inplace=True pandas methods) will modify the input dataframe as well.
+
+    :param dataframe: pandas.DataFrame whose columns are shared
+    :return: pandas.DataFrame
+    """
+    shared_df = pd.DataFrame(
+        {i: dataframe.iloc[:, i] for i in range(dataframe.shape[1])},
+        index=dataframe.index,
+        copy=False,
+    )
+    shared_df.columns = dataframe.columns
+    return shared_df
+
+
+def import_pyarrow():
+    """
+    Imports the optional pyarrow dependency required to read and write
+    columnar file formats
+
+    :return: pyarrow module
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            'pyarrow is required to read and write .parquet, .feather, and '
+            'Arrow IPC files. Install it with "pip install basedata[arrow]".'
+        )
+    return pyarrow
+
+
+def normalize_filters(filters):
+    """
+    Converts row filters to disjunctive normal form, a list of lists of
+    (column, operator, value) tuples
+
+    :param filters: list of (column, operator, value) tuples, all of which
+        must be satisfied, or list of such lists, any of which must be
+        satisfied
+    :return: list of lists of (column, operator, value) tuples
+    """
+    if filters and not isinstance(filters[0], list):
+        return [filters]
+    return filters
+
+
+def filter_columns(filters):
+    """
+    Lists the names of all columns referenced by row filters
+
+    :param filters: row filters in the form accepted by normalize_filters
+    :return: list of str column names
+    """
+    return list(dict.fromkeys(
+        column
+        for conjunction in normalize_filters(filters)
+        for column, _, _ in conjunction
+    ))
+
+
+def filter_expression(filters, schema):
+    """
+    Converts row filters to a pyarrow compute expression, comparing integer
+    columns to float values as float64 values, as pandas compares them
+
+    :param filters: row filters in the form accepted by normalize_filters
+    :param schema: pyarrow.Schema of the filtered columns
+    :return: pyarrow.compute.Expression
+    """
+    pyarrow = import_pyarrow()
+    from pyarrow import compute
+    expression = None
+    for conjunction in normalize_filters(filters):
+        conjunction_expression = None
+        for column, op, value in conjunction:
+            field = compute.field(column)
+            values = value if op in ('in', 'not in') else [value]
+            if (
+                pyarrow.types.is_integer(schema.field(column).type)
+                and any(isinstance(val, float) for val in values)
+            ):
+                field = field.cast(pyarrow.float64())
+            term = FILTER_OPERATORS[op](field, value)
+            conjunction_expression = term if conjunction_expression is None \
+                else conjunction_expression & term
+        expression = conjunction_expression if expression is None \
+            else expression | conjunction_expression
+    return expression
+
+
+def filter_rows(dataframe, filters):
+    """
+    Selects the rows of a dataframe that satisfy row filters, the
+    dataframe index is reset to contiguous values 0-n
+
+    :param dataframe: pandas.DataFrame to filter
+    :param filters: row filters in the form accepted by normalize_filters,
+        supported operators are ==, =, !=, <, <=, >, >=, in, and not in
+    :return: pandas.DataFrame of rows satisfying the filters
+    """
+    mask = np.zeros(len(dataframe), dtype=bool)
+    for conjunction in normalize_filters(filters):
+        conjunction_mask = np.ones(len(dataframe), dtype=bool)
+        for column, op, value in conjunction:
+            conjunction_mask &= np.asarray(
+                FILTER_OPERATORS[op](dataframe[column], value),
+                dtype=bool,
+            )
+        mask |= conjunction_mask
+    return dataframe.loc[mask].reset_index(drop=True)
+
+
+def read_datafile(filename, columns=None, filters=None, **read_kwargs):
+    """
+    Reads input csv, excel, parquet, feather, or Arrow IPC file from disk
+    into a pandas.DataFrame object based on the file's extension
+
+    Compressed csv files ending with .csv.gz, .csv.bz2, or .csv.zst are
+    decompressed as they are read.
+
+    For .parquet files, filters are passed to pyarrow so that row groups
+    not satisfying the filters are never read. For .feather and Arrow IPC
+    files, the file is memory-mapped and only the rows satisfying the filters
+    are converted to pandas. For .csv and excel files, rows are filtered after
+    the file is parsed.
+
+    :param filename: str filename of .csv, .xls, .xlsx, .parquet, .feather,
+        .arrow, or .ipc file to be read
+    :param columns: list of str column names to read, default=None reads all
+        columns
+    :param filters: list of (column, operator, value) tuples specifying rows
+        to read, see filter_rows, default=None reads all rows
+    :param read_kwargs: optional args to the pandas or pyarrow read function
+    :return: pandas.DataFrame
+    """
+    root, ext = os.path.splitext(filename)
+    if ext in COMPRESSION_EXTENSIONS and root.endswith('.csv'):
+        ext = '.csv'
+    read_columns = columns
+    if columns is not None and filters:
+        read_columns = list(dict.fromkeys(
+            list(columns) + filter_columns(filters)
+        ))
+    if ext == '.parquet':
+        import_pyarrow()
+        from pyarrow import parquet
+        return pd.read_parquet(
+            filename,
+            columns=columns,
+            filters=filter_expression(
+                filters, parquet.read_schema(filename),
+            ) if filters else None,
+            **read_kwargs
+        )
+    elif ext in COLUMNAR_EXTENSIONS:
+        import_pyarrow()
+        from pyarrow import feather
+        table = feather.read_table(
+            filename,
+            columns=read_columns,
+            memory_map=True,
+        )
+        if filters:
+            table = table.filter(filter_expression(filters, table.schema))
+        if columns is not None:
+            table = table.select(list(columns))
+        return table.to_pandas(**read_kwargs)
+    elif ext == '.csv':
+        input_df = pd.read_csv(filename, usecols=read_columns, **read_kwargs)
+    elif ext in ('.xls', '.xlsx'):
+        input_df = pd.read_excel(
+            filename,
+            usecols=read_columns,
+            **read_kwargs
+        )
+    else:
+        raise TypeError(
+            'from_file reads only .csv, .xls, .xlsx, .parquet, .feather, '
+            '.arrow, or .ipc filetypes'
+        )
+    if filters:
+        input_df = filter_rows(input_df, filters)
+    if columns is not None:
+        input_df = input_df[list(columns)]
+    return input_df
+
+
+def read_datafiles(filenames, jobs=1, source_column=None, validate=True,
+                   **read_kwargs):
+    """
+    Reads a list of input files into a single pandas.DataFrame object, reading
+    files in parallel worker processes when jobs > 1
+
+    All frames are combined with a single concatenation, so each row is
+    copied only once regardless of the number of files.
+
+    :param filenames: list of str filenames of files to be read, see
+        read_datafile for supported filetypes
+    :param jobs: int number of worker processes reading files in parallel,
+        default=1 reads files in the current process
+    :param source_column: str name of a categorical column recording the
+        filename from which each row was read, default=None adds no column
+    :param validate: bool whether to raise a ValueError if the column names
+        and data types of any file do not match those of the first file,
+        default=True
+    :param read_kwargs: optional args to read_datafile()
+    :return: pandas.DataFrame
+    """
+    read_function = partial(read_datafile, **read_kwargs)
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            frames = list(executor.map(read_function, filenames))
+    else:
+        frames = [read_function(filename) for filename in filenames]
+    if not frames:
+        raise ValueError('filenames must contain at least one filename')
+    if validate:
+        schema = frames[0].dtypes
+        for filename, frame in zip(filenames[1:], frames[1:]):
+            if not frame.dtypes.equals(schema):
+                raise ValueError(
+                    "The columns and data types of '{0}' do not match those "
+                    "of '{1}'.\n\nExpected:\n{2}\n\nFound:\n{3}"
+                    .format(filename, filenames[0], schema, frame.dtypes)
+                )
+    input_df = pd.concat(frames, ignore_index=True, copy=False)
+    if source_column:
+        categories = pd.Index(filenames).unique()
+        input_df[source_column] = pd.Categorical.from_codes(
+            np.repeat(
+                categories.get_indexer(filenames),
+                [len(frame) for frame in frames],
+            ),
+            categories=categories,
+        )
+    return input_df
+
+
+def write_datafile(dataframe, filename, jobs=1, **write_kwargs):
+    """
+    Saves a pandas.DataFrame to file in parquet, feather, or Arrow IPC
+    format based on the file's extension, all other extensions are saved in
+    csv format. The dataframe index is not saved.
+
+    csv files are compressed when the filename ends with .gz, .bz2, or .zst,
+    or when a compression write_kwarg is specified. csv files compressed as
+    gzip, bz2, or zstd, and uncompressed csv files when jobs > 1, are written
+    with basedata.ops.writers.write_csv_blocks, all other compression types
+    and options are written by pandas.DataFrame.to_csv().
+
+    :param dataframe: pandas.DataFrame to save
+    :param filename: str filename to which the dataframe should be written
+    :param jobs: int number of csv blocks formatted and compressed in
+        parallel, default=1
+    :param write_kwargs: optional args to pandas.DataFrame.to_csv(),
+        pandas.DataFrame.to_parquet(), pyarrow.feather.write_feather(), or
+        basedata.ops.writers.write_csv_blocks()
+    """
+    _, ext = os.path.splitext(filename)
+    if ext == '.parquet':
+        import_pyarrow()
+        dataframe.to_parquet(filename, index=False, **write_kwargs)
+    elif ext in COLUMNAR_EXTENSIONS:
+        pyarrow = import_pyarrow()
+        from pyarrow import feather
+        if ext != '.feather':
+            write_kwargs.setdefault('compression', 'uncompressed')
+        feather.write_feather(
+            pyarrow.Table.from_pandas(dataframe, preserve_index=False),
+            filename,
+            **write_kwargs
+        )
+    elif is_block_compression(
+        filename, write_kwargs.get('compression', 'infer'),
+    ) and (
+        jobs > 1
+        or infer_compression(filename)
+        or write_kwargs.get('compression') not in (None, 'infer')
+    ):
+        write_csv_blocks(dataframe, filename, jobs=jobs, **write_kwargs)
+    else:
+        dataframe.to_csv(filename, index=False, **write_kwargs)
+
+
+def instrument_operation(name, method):
+    """
+    Wraps a basedata.ops method so that each call is passed, along with a
+    PlanStep describing the call, to BaseDataClass._apply_operation whenever
+    the instance's changes are tracked or its operations are logged
+
+    :param name: str name of the method
+    :param method: function to wrap
+    :return: function
+    """
+    @wraps(method)
+    def operation(self, *args, **kwargs):
+        if self.tracker is None and self.log is None:
+            return method(self, *args, **kwargs)
+        step = describe_call(type(self), name, args, kwargs)
+        return self._apply_operation(
+            step,
+            lambda: method(self, *args, **kwargs),
+        )
+    return operation
+
+
+def instrument_operations(ops_class):
+    """
+    Class decorator that wraps each public method a BaseDataClass child class
+    inherits from its mixin classes with instrument_operation
+
+    :param ops_class: BaseDataClass child class
+    :return: ops_class
+    """
+    for name in dir(ops_class):
+        if name.startswith('_') or hasattr(BaseDataClass, name):
+            continue
+        method = inspect.getattr_static(ops_class, name)
+        if inspect.isfunction(method):
+            setattr(ops_class, name, instrument_operation(name, method))
+    return ops_class
+
+
 class BaseDataClass(object):
     """
     BaseDataClass manages base read/write operations and instantiates
     self.df for child classes across basedata.ops submodule classes
     """
 
-    def __init__(self, input_df, copy_input):
-        if copy_input:
-            self.input_df = input_df.copy()  # input df persists for reference
+    tracker = None  # ChangeTracker, set when copy_input='track'
+    log = None  # OperationLog, set by start_log
+
+    def __init__(self, input_df, copy_input, copy_on_write=False):
+        if copy_on_write:
+            input_df = share_columns(input_df)
+        if copy_input == 'track':
+            self.tracker = ChangeTracker(input_df)
+        elif copy_input:
+            # input df persists for reference
+            self.input_df = (
+                share_columns(input_df) if copy_on_write
+                else input_df.copy()
+            )
         self.df = input_df  # all basedata changes applied to this df
 
+    def __getattr__(self, name):
+        if name == 'input_df' and self.tracker is not None:
+            return self.tracker.rebuild(self.df)
+        raise AttributeError(
+            "'{0}' object has no attribute '{1}'"
+            .format(type(self).__name__, name)
+        )
+
+    def _apply_operation(self, step, operation):
+        """
+        Records the changes a basedata.ops method call is about to make to
+        self.df before calling it, and logs the call if self.log is started
+
+        The recorded changes are discarded if the method call raises.
+
+        :param step: basedata.ops.plan.PlanStep describing the method call
+        :param operation: function that makes the method call
+        :return: result of the method call
+        """
+        if self.tracker is not None:
+            checkpoint = self.tracker.checkpoint()
+            self.tracker.before_operation(self.df, step)
+        try:
+            if self.log is not None:
+                return self.log.record(
+                    step.name,
+                    step.arguments,
+                    lambda: self.df,
+                    operation,
+                )
+            return operation()
+        except Exception:
+            if self.tracker is not None:
+                self.tracker.restore(checkpoint)
+            raise
+
+    def start_log(self, trace_memory=False, deep_memory=False):
+        """
+        Starts an OperationLog that records the parameters, wall and CPU time,
+        rows and columns before and after, and memory use of every subsequent
+        basedata.ops method call and to_file save made against this instance
+
+        :param trace_memory: bool whether to also record the peak memory
+            allocated during each call using tracemalloc, default=False
+        :param deep_memory: bool whether memory use includes the values of
+            object columns, which scans every value of those columns before
+            and after each call, default=False
+        :return: basedata.log.OperationLog saved to self.log
+        """
+        self.log = OperationLog(trace_memory, deep_memory)
+        return self.log
+
+    @classmethod
+    def _from_dataframe(cls, input_df, copy_input, copy_on_write,
+                        optimize_dtypes):
+        """
+        Invokes BaseDataClass after optionally converting input df columns to
+        smaller data types
+        """
+        memory_report = None
+        if optimize_dtypes:
+            input_df, memory_report = downcast_dataframe(input_df)
+        instance = cls(input_df, copy_input, copy_on_write)
+        if memory_report is not None:
+            instance.memory_report = memory_report
+        return instance
+
     @classmethod
-    def from_file(cls, filename, copy_input=False, **read_kwargs):
+    def from_file(cls, filename, copy_input=False, columns=None,
+                  filters=None, copy_on_write=False, cache=None,
+                  optimize_dtypes=False, **read_kwargs):
         """
-        Invokes BaseDataClass and reads input csv or excel from disk
-        into a pandas.DataFrame object.
+        Invokes BaseDataClass and reads input csv, excel, parquet, feather, or
+        Arrow IPC file from disk into a pandas.DataFrame object.
 
-        :param filename: str filename of .csv, .xls, or .xlsx file to be read
-        :param copy_input: bool to specify whether self.input_df persists
-        :param read_kwargs: optional args to pandas.DataFrame.read_csv() or
-                            pandas.DataFrame.read_excel()
+        :param filename: str filename of .csv, .xls, .xlsx, .parquet,
+            .feather, .arrow, or .ipc file to be read
+        :param copy_input: bool to specify whether self.input_df persists,
+            or 'track' to rebuild self.input_df on request from the changes
+            recorded by a basedata.ops.tracking.ChangeTracker
+        :param columns: list of str column names to read, default=None reads
+            all columns
+        :param filters: list of (column, operator, value) tuples specifying
+            rows to read, or list of such lists any of which may be satisfied,
+            i.e. [('year', '>=', 2015), ('state', 'in', ['MA', 'NY'])],
+            default=None reads all rows
+        :param copy_on_write: bool whether self.input_df shares the data of
+            each column with self.df until that column is changed, rather
+            than persisting as a full copy, default=False
+        :param cache: basedata.ops.cache.LoadCache or str path of a cache
+            directory from which unchanged files are read instead of being
+            parsed again, default=None does not cache
+        :param optimize_dtypes: bool whether to convert columns to the
+            smallest data types able to hold their values, the resulting
+            report is saved to self.memory_report, default=False
+        :param read_kwargs: optional args to pandas.DataFrame.read_csv(),
+                            pandas.DataFrame.read_excel(),
+                            pandas.DataFrame.read_parquet(), or
+                            pyarrow.Table.to_pandas()
         :return: pandas.DataFrame and copy_input bool as class variables
         """
-        _, ext = os.path.splitext(filename)
-        if ext == '.csv':
-            input_df = pd.read_csv(filename, **read_kwargs)
-        elif ext in ('.xls', '.xlsx'):
-            input_df = pd.read_excel(filename, **read_kwargs)
+        if cache is None:
+            input_df = read_datafile(
+                filename,
+                columns,
+                filters,
+                **read_kwargs
+            )
         else:
-            raise TypeError(
-                'from_file reads only .csv, .xls, or .xlsx filetypes'
+            if not isinstance(cache, LoadCache):
+                cache = LoadCache(cache)
+            input_df = cache.load(
+                filename,
+                read_datafile,
+                columns=columns,
+                filters=filters,
+                **read_kwargs
             )
-        return cls(input_df, copy_input)
+        return cls._from_dataframe(
+            input_df,
+            copy_input,
+            copy_on_write,
+            optimize_dtypes,
+        )
+
+    @classmethod
+    def from_files(cls, filenames, directory=None, jobs=1, source_column=None,
+                   validate=True, copy_input=False, copy_on_write=False,
+                   optimize_dtypes=False, **read_kwargs):
+        """
+        Invokes BaseDataClass and reads a list of input files from disk into
+        a single pandas.DataFrame object, reading files in parallel worker
+        processes when jobs > 1.
+
+        :param filenames: list of str filenames of files to be read, or
+            pandas.DataFrame of subdirectory names and associated datafiles
+            as returned by basedata.inventory.make_datafile_dataframe
+        :param directory: str pathname of the target parent directory for
+            which the filenames dataframe was generated, required only if
+            filenames is a pandas.DataFrame, default=None
+        :param jobs: int number of worker processes reading files in
+            parallel, default=1
+        :param source_column: str name of a categorical column recording the
+            filename from which each row was read, default=None adds no column
+        :param validate: bool whether to raise a ValueError if the column
+            names and data types of the files do not match, default=True
+        :param copy_input: bool to specify whether self.input_df persists,
+            or 'track' to rebuild self.input_df on request from the changes
+            recorded by a basedata.ops.tracking.ChangeTracker
+        :param copy_on_write: bool whether self.input_df shares the data of
+            each column with self.df, see from_file, default=False
+        :param optimize_dtypes: bool whether to convert columns to the
+            smallest data types able to hold their values, default=False
+        :param read_kwargs: optional args to from_file, i.e. columns or
+            filters, and to the pandas or pyarrow read functions
+        :return: pandas.DataFrame and copy_input bool as class variables
+        """
+        if isinstance(filenames, pd.DataFrame):
+            if directory is None:
+                raise ValueError(
+                    'directory must be specified when filenames is a '
+                    'pandas.DataFrame.'
+                )
+            filenames = list_datafile_paths(filenames, directory)
+        input_df = read_datafiles(
+            list(filenames),
+            jobs,
+            source_column,
+            validate,
+            **read_kwargs
+        )
+        return cls._from_dataframe(
+            input_df,
+            copy_input,
+            copy_on_write,
+            optimize_dtypes,
+        )
+
+    @classmethod
+    def stream_file(cls, filename, chunksize=100000, **read_kwargs):
+        """
+        Invokes a ChunkedPipeline that reads an input csv from disk one chunk
+        at a time. Method calls recorded on the pipeline are applied to each
+        chunk when the pipeline is written to file with its to_file method.
+
+        :param filename: str filename of .csv, .csv.gz, .csv.bz2, or .csv.zst
+            file to be read
+        :param chunksize: int number of rows read into memory per chunk,
+            default=100000
+        :param read_kwargs: optional args to pandas.DataFrame.read_csv()
+        :return: basedata.ops.stream.ChunkedPipeline object
+        """
+        return ChunkedPipeline(cls, filename, chunksize, **read_kwargs)
 
     @classmethod
-    def from_object(cls, input_object, copy_input=False):
+    def from_object(cls, input_object, copy_input=False, copy_on_write=False,
+                    optimize_dtypes=False):
         """
         Invokes BaseDataClass and reads input df from similar BaseData class
         instance or pandas.DataFrame object.
 
+        By default, the input df is copied. When copy_on_write=True, self.df
+        and self.input_df instead share the data of each column with the input
+        df, and a column's data is only replaced, never modified, when a
+        method changes that column.
+
         :param input_object: object to be read into BaseDataClass
-        :param copy_input: bool to specify whether self.input_df persists
+        :param copy_input: bool to specify whether self.input_df persists,
+            or 'track' to rebuild self.input_df on request from the changes
+            recorded by a basedata.ops.tracking.ChangeTracker
+        :param copy_on_write: bool whether to share column data with the
+            input df rather than copying it, default=False
+        :param optimize_dtypes: bool whether to convert columns to the
+            smallest data types able to hold their values, the resulting
+            report is saved to self.memory_report, default=False
         :return: pandas.DataFrame and copy_input bool as class variables
         """
         if isinstance(input_object, pd.DataFrame):
-            input_df = input_object.copy()
+            input_df = input_object
         else:
             try:
                 if isinstance(input_object.df, pd.DataFrame):
-                    input_df = input_object.df.copy()
-                    # TODO implement self.log = input_object.log.copy()
+                    input_df = input_object.df
             except:
                 raise TypeError(
                     'input_object must be either pandas.DataFrame or '
                     'class object with input_object.df attribute of type '
                     'pandas.DataFrame.'
                 )
-        return cls(input_df, copy_input)
+        if not copy_on_write:
+            input_df = input_df.copy()
+        instance = cls._from_dataframe(
+            input_df,
+            copy_input,
+            copy_on_write,
+            optimize_dtypes,
+        )
+        log = getattr(input_object, 'log', None)
+        if isinstance(log, OperationLog):
+            instance.log = log.copy()
+        return instance
+
+    def lazy(self):
+        """
+        Invokes a LazyDataOps object that records method calls made against
+        this instance and applies an optimized version of those calls to
+        self.df only when its collect method is called.
+
+        :return: basedata.ops.plan.LazyDataOps object
+        """
+        return LazyDataOps(self)
 
-    def to_file(self, target_filename, **to_csv_kwargs):
+    def to_file(self, target_filename, jobs=1, background=False,
+                **write_kwargs):
         """
-        Saves current version of self.df to file in csv format
+        Saves current version of self.df to file in parquet, feather, or
+        Arrow IPC format when target_filename ends with .parquet, .feather,
+        .arrow, or .ipc, and in csv format otherwise
+
+        csv files ending with .gz, .bz2, or .zst are compressed, i.e.
+        'data.csv.gz', and are written in blocks of rows that are formatted
+        and compressed on jobs threads.
+
+        When background=True, the file is written by a background thread from
+        a snapshot of self.df that shares its column data, and changes made
+        to self.df after to_file returns are not saved.
 
-        :param target_filename: str filename to which csv should be written
-        :param to_csv_kwargs: optional args to pandas.DataFrame.to_csv()
+        :param target_filename: str filename to which self.df should be
+            written
+        :param jobs: int number of csv blocks formatted and compressed in
+            parallel, default=1
+        :param background: bool whether to write the file in a background
+            thread, default=False
+        :param write_kwargs: optional args to pandas.DataFrame.to_csv(),
+            pandas.DataFrame.to_parquet(), pyarrow.feather.write_feather(), or
+            basedata.ops.writers.write_csv_blocks()
+        :return: concurrent.futures.Future that completes when the file is
+            written, returned only if background=True
         """
-        # TODO: to_file saves will need trigger log file in future versions
-        self.df.to_csv(target_filename, index=False, **to_csv_kwargs)
+        def save():
+            if not background:
+                return write_datafile(
+                    self.df,
+                    target_filename,
+                    jobs,
+                    **write_kwargs
+                )
+            executor = ThreadPoolExecutor(max_workers=1)
+            future = executor.submit(
+                write_datafile,
+                share_columns(self.df),
+                target_filename,
+                jobs,
+                **write_kwargs
+            )
+            executor.shutdown(wait=False)
+            return future
+
+        if self.log is None:
+            return save()
+        # background saves are logged when submitted, not when completed
+        return self.log.record(
+            'to_file',
+            dict(
+                target_filename=target_filename,
+                jobs=jobs,
+                background=background,
+                **write_kwargs
+            ),
+            lambda: self.df,
+            save,
+        )
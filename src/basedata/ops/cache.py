@@ -0,0 +1,206 @@
+"""
+This submodule contains the LoadCache class, an on-disk cache of parsed
+input files that is used by BaseDataClass.from_file to skip re-parsing slow
+sources, such as large excel workbooks, that have not changed since they
+were last read.
+"""
+import hashlib
+import json
+import os
+import pickle
+
+import pandas as pd
+
+
+CACHE_EXTENSIONS = ('.feather', '.pkl')
+
+
+def hash_file(filename, block_size=2**20):
+    """
+    Generates a sha256 hash of a file's contents
+
+    :param filename: str filename of file to hash
+    :param block_size: int number of bytes read at a time, default=2**20
+    :return: str hex digest
+    """
+    sha = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def is_default_index(index):
+    """
+    Determines whether an index is the default RangeIndex 0-n, which is the
+    only index restored by pandas.read_feather
+
+    :param index: pandas.Index
+    :return: bool
+    """
+    return (
+        isinstance(index, pd.RangeIndex)
+        and index.start == 0
+        and index.step == 1
+        and index.name is None
+    )
+
+
+class LoadCache(object):
+    """
+    LoadCache stores parsed input files as .feather files in a cache
+    directory, keyed by each source file's path, its size and modification
+    time or its content hash, and the arguments used to read it
+
+    Frames that cannot be stored in feather format, i.e. frames with an
+    index other than the default RangeIndex, object columns with mixed value
+    types, or frames cached without pyarrow installed, are stored as pickle
+    files instead. When the total size of the cache exceeds
+    max_bytes, the least recently used entries are evicted. Entries for
+    source files that have since changed are never read again and are removed
+    by eviction or by the invalidate method.
+
+    :param directory: str path of the cache directory, created if it does not
+        exist
+    :param max_bytes: int maximum total size of the cache in bytes,
+        default=None does not evict entries
+    :param key: str 'mtime' to identify unchanged source files by their size
+        and modification time or 'hash' to identify them by a hash of their
+        contents, default='mtime'
+    """
+
+    def __init__(self, directory, max_bytes=None, key='mtime'):
+        if key not in ('mtime', 'hash'):
+            raise ValueError("key must be either 'mtime' or 'hash'")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.key = key
+
+    def _source_prefix(self, filename):
+        """Generates the cache filename prefix shared by a source file"""
+        return hashlib.sha256(
+            os.path.abspath(filename).encode('utf-8')
+        ).hexdigest()[:16]
+
+    def make_key(self, filename, **read_kwargs):
+        """
+        Generates the cache key of a source file read with read_kwargs
+
+        :param filename: str filename of the source file
+        :param read_kwargs: args used to read the source file
+        :return: str cache key
+        """
+        stat = os.stat(filename)
+        if self.key == 'hash':
+            version = hash_file(filename)
+        else:
+            version = [stat.st_size, stat.st_mtime_ns]
+        key_data = json.dumps(
+            [version, sorted(read_kwargs.items(), key=str)],
+            default=repr,
+        )
+        return '-'.join([
+            self._source_prefix(filename),
+            hashlib.sha256(key_data.encode('utf-8')).hexdigest()[:32],
+        ])
+
+    def _entries(self):
+        """Lists the filepaths of all cache entries"""
+        return [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if os.path.splitext(name)[1] in CACHE_EXTENSIONS
+        ]
+
+    def get(self, key):
+        """
+        Reads a cache entry
+
+        :param key: str cache key
+        :return: pandas.DataFrame or None if no entry exists for key
+        """
+        for ext in CACHE_EXTENSIONS:
+            path = os.path.join(self.directory, key + ext)
+            if os.path.exists(path):
+                os.utime(path)  # marks entry as recently used
+                if ext == '.feather':
+                    return pd.read_feather(path)
+                with open(path, 'rb') as f:
+                    return pickle.load(f)
+        return None
+
+    def put(self, key, dataframe):
+        """
+        Writes a cache entry and evicts least recently used entries if the
+        cache exceeds max_bytes
+
+        :param key: str cache key
+        :param dataframe: pandas.DataFrame to cache
+        """
+        path = os.path.join(self.directory, key)
+        tmp_path = path + '.tmp'
+        try:
+            if not is_default_index(dataframe.index):
+                raise ValueError('feather does not store the index')
+            dataframe.to_feather(tmp_path)
+            path += '.feather'
+        except Exception:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(dataframe, f, protocol=pickle.HIGHEST_PROTOCOL)
+            path += '.pkl'
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def load(self, filename, read_function, **read_kwargs):
+        """
+        Reads a source file from the cache, or reads it with read_function
+        and caches the result if no current cache entry exists
+
+        :param filename: str filename of the source file
+        :param read_function: function called as
+            read_function(filename, **read_kwargs) to read the source file
+        :param read_kwargs: args to read_function
+        :return: pandas.DataFrame
+        """
+        key = self.make_key(filename, **read_kwargs)
+        dataframe = self.get(key)
+        if dataframe is None:
+            dataframe = read_function(filename, **read_kwargs)
+            self.put(key, dataframe)
+        return dataframe
+
+    def size(self):
+        """
+        Calculates the total size of all cache entries
+
+        :return: int size in bytes
+        """
+        return sum(os.path.getsize(path) for path in self._entries())
+
+    def evict(self):
+        """
+        Deletes least recently used cache entries until the total size of the
+        cache is no greater than max_bytes
+        """
+        if self.max_bytes is None:
+            return
+        entries = sorted(self._entries(), key=os.path.getmtime)
+        total = sum(os.path.getsize(path) for path in entries)
+        for path in entries:
+            if total <= self.max_bytes:
+                break
+            total -= os.path.getsize(path)
+            os.remove(path)
+
+    def invalidate(self, filename=None):
+        """
+        Deletes all cache entries for a source file, or all cache entries if
+        no source file is specified
+
+        :param filename: str filename of the source file, default=None
+        """
+        prefix = self._source_prefix(filename) if filename else ''
+        for path in self._entries():
+            if os.path.basename(path).startswith(prefix):
+                os.remove(path)
@@ -5,10 +5,269 @@ column names.
 The functionality of these mixin classes is aggregated in the basedata.ops
 BaseDataOps class.
 """
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 import numpy as np
 import pandas as pd
 
-from .base import inplace_return_series, regex_sub_value
+from .base import convert_columns, failure_counts, inplace_return_columns,\
+    inplace_return_failures, inplace_return_series, is_column_list,\
+    read_datafile, regex_sub_series
+from .counts import SpaceSaving, count_series
+from .dates import parse_datetimes
+from .numeric import CURRENCY_SYMBOLS, parse_numbers
+from .unique import is_categorical
+
+
+def is_numeric_column(series):
+    """
+    Determines whether a series already holds int or float values
+
+    :param series: pandas.Series
+    :return: bool
+    """
+    return pd.api.types.is_numeric_dtype(series) \
+        and not pd.api.types.is_bool_dtype(series)
+
+
+def is_datetime_column(series):
+    """
+    Determines whether a series already holds datetime values
+
+    :param series: pandas.Series
+    :return: bool
+    """
+    return pd.api.types.is_datetime64_any_dtype(series)
+
+
+def numeric_series(series, coerce=True, return_failures=False,
+                   dropna=False):
+    """
+    Converts a series to a numeric data type (int or float) with
+    pandas.to_numeric, see ColumnConversionsMixin.to_numeric
+
+    :param series: pandas.Series to convert
+    :param coerce: bool whether to convert non-convertable values to
+        numpy.nan if True or to return the series as is if False,
+        default=True
+    :param return_failures: bool whether to report the values that could not
+        be converted, default=False
+    :param dropna: bool whether to drop na values from the failures
+        value_counts series, default=False
+    :return: tuple of the converted pandas.Series and the failures
+        value_counts pandas.Series, or None if return_failures is False
+    """
+    if is_numeric_column(series):
+        converted = series
+    else:
+        converted = pd.to_numeric(series, errors='coerce')
+    failures = failure_counts(series, converted, dropna) \
+        if return_failures else None
+    if not coerce and converted.isnull().sum() > series.isnull().sum():
+        # as with errors='ignore', values are left as is if any value
+        # cannot be converted
+        converted = series
+    return converted, failures
+
+
+def datetime_series(series, coerce=True, formats=None, epoch_unit='ns',
+                    return_failures=False, dropna=False):
+    """
+    Converts a series to a datetime data type with
+    basedata.ops.dates.parse_datetimes, see ColumnConversionsMixin.to_datetime
+
+    :param series: pandas.Series to convert
+    :param coerce: bool whether to convert non-convertable values to NaT if
+        True or to return the series as is if False, default=True
+    :param formats: list of str strftime formats tried in order, default
+        None detects formats from a sample of the series' values
+    :param epoch_unit: str unit of integer and float epoch times, default='ns'
+    :param return_failures: bool whether to report the values that could not
+        be converted, default=False
+    :param dropna: bool whether to drop na values from the failures
+        value_counts series, default=False
+    :return: tuple of the converted pandas.Series, the parse_datetimes
+        pandas.DataFrame report of formats or None if no report is made, and
+        the failures value_counts pandas.Series or None if return_failures is
+        False
+    """
+    report = None
+    if is_datetime_column(series):
+        converted = series
+    else:
+        parsed = parse_datetimes(series, formats, epoch_unit)
+        if parsed is None:
+            # values holding timezones are converted by pandas alone
+            converted = pd.to_datetime(series, errors='coerce')
+        else:
+            converted, report = parsed
+            if is_categorical(series):
+                converted = converted.astype('category')
+    failures = failure_counts(series, converted, dropna) \
+        if return_failures else None
+    if not coerce and converted.isnull().sum() > series.isnull().sum():
+        # as with errors='ignore', values are left as is if any value
+        # cannot be converted
+        converted = series
+    return converted, report, failures
+
+
+def mapping_series(map_dict, key_column=None, value_column=None,
+                   **read_kwargs):
+    """
+    Generates a pandas.Series of mapped values indexed by their unique keys
+    from a dict, pandas.Series, pandas.DataFrame, or data file
+
+    When a key appears more than once in a pandas.DataFrame or file, its last
+    value is kept, as it would be by dict(zip(keys, values)).
+
+    :param map_dict: dict mapping {current_value: new_value}, pandas.Series
+        of new values indexed by current values, or pandas.DataFrame or str
+        filename of a file read by basedata.ops.base.read_datafile holding
+        current values and new values in two columns
+    :param key_column: str name of the column of current values, default=None
+        uses the first column
+    :param value_column: str name of the column of new values, default=None
+        uses the second column
+    :param read_kwargs: optional args to read_datafile when map_dict is a
+        filename
+    :return: pandas.Series
+    """
+    if isinstance(map_dict, str):
+        columns = [key_column, value_column] \
+            if key_column and value_column else None
+        map_dict = read_datafile(map_dict, columns=columns, **read_kwargs)
+    if isinstance(map_dict, pd.DataFrame):
+        keys = map_dict[key_column] if key_column else map_dict.iloc[:, 0]
+        values = map_dict[value_column] if value_column \
+            else map_dict.iloc[:, 1]
+        map_dict = pd.Series(values.to_numpy(), index=keys.to_numpy())
+    elif not isinstance(map_dict, pd.Series):
+        map_dict = pd.Series(map_dict, dtype=object if not map_dict else None)
+    if not map_dict.index.is_unique:
+        map_dict = map_dict[~map_dict.index.duplicated(keep='last')]
+    return map_dict
+
+
+def map_series(series, mapping, na_action=None, exhaustive=False,
+               return_unmatched=False):
+    """
+    Maps the values of a series to new values by joining its distinct values
+    to the index of a mapping series, see ColumnConversionsMixin.map_values
+
+    Each distinct value is looked up once with pandas.Index.get_indexer, and
+    the number of rows holding each value missing from the mapping is counted
+    from the same factorized codes. Categorical series are remapped by
+    category and returned as categoricals.
+
+    :param series: pandas.Series to map
+    :param mapping: pandas.Series as returned by mapping_series
+    :param na_action: None or 'ignore', if 'ignore' missing values are not
+        looked up in the mapping, default=None
+    :param exhaustive: bool whether values missing from the mapping become
+        numpy.nan if True or retain their values if False, default=False
+    :param return_unmatched: bool whether to count the values missing from
+        the mapping, default=False
+    :return: tuple of the mapped pandas.Series and a value_counts
+        pandas.Series of unmatched values, or None if return_unmatched is
+        False
+    """
+    if is_categorical(series):
+        codes = series.cat.codes.to_numpy()
+        uniques = series.cat.categories
+    else:
+        codes, uniques = pd.factorize(series)
+    positions = mapping.index.get_indexer(uniques)
+    mapped = pd.Series(
+        pd.api.extensions.take(mapping.to_numpy(), positions, allow_fill=True)
+    )
+    if not exhaustive and is_categorical(series):
+        mapped = mapped.fillna(pd.Series(uniques))
+
+    # missing values are looked up as a single additional value
+    missing_value = np.nan
+    if na_action is None and (codes < 0).any():
+        position = mapping.index.get_indexer([np.nan])[0]
+        if position >= 0:
+            missing_value = mapping.iloc[position]
+
+    unmatched = None
+    if return_unmatched:
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        is_unmatched = (positions < 0) & (counts > 0)
+        unmatched = pd.Series(
+            counts[is_unmatched],
+            index=uniques[is_unmatched],
+            name=series.name,
+        ).sort_values(ascending=False, kind='stable')
+
+    if is_categorical(series):
+        if pd.notnull(missing_value):
+            mapped = pd.concat(
+                [mapped, pd.Series([missing_value])], ignore_index=True,
+            )
+            codes = np.where(codes < 0, len(mapped) - 1, codes)
+        mapped_codes, categories = pd.factorize(mapped)
+        result = pd.Categorical.from_codes(
+            np.where(codes >= 0, mapped_codes.take(np.maximum(codes, 0)), -1),
+            categories,
+        )
+    else:
+        result = pd.api.extensions.take(
+            mapped.infer_objects().to_numpy(),
+            codes,
+            allow_fill=True,
+            fill_value=missing_value,
+        )
+    result = pd.Series(result, index=series.index, name=series.name)
+    if not exhaustive and not is_categorical(series):
+        # unmatched rows keep their own values rather than those of the
+        # factorized uniques, which merge equal values of different types
+        result = result.fillna(series)
+    return result, unmatched
+
+
+def apply_frame(frame, function, vectorized=False, **kwargs):
+    """
+    Applies a function to a frame with pandas.DataFrame.apply, or to whole
+    column arrays when vectorized, see ColumnConversionsMixin.apply_function
+
+    :param frame: pandas.DataFrame of the columns the function is applied to,
+        or pandas.Series of a single column
+    :param function: function to apply
+    :param vectorized: bool whether to call function once with each column
+        of frame as a pandas.Series positional argument, default=False
+    :param kwargs: optional keyword args to the pandas apply method, or to
+        function when vectorized
+    :return: pandas.Series with the index of frame
+    """
+    if vectorized:
+        columns = [frame] if isinstance(frame, pd.Series) \
+            else [frame.iloc[:, i] for i in range(frame.shape[1])]
+        result = function(*columns, **kwargs)
+        if not isinstance(result, (pd.Series, pd.DataFrame)):
+            return pd.Series(result, index=frame.index)
+    else:
+        result = frame.apply(function, **kwargs)
+    return result.iloc[:, 0] if isinstance(result, pd.DataFrame) else result
+
+
+def split_rows(frame, n_chunks):
+    """
+    Splits a frame into at most n_chunks contiguous row chunks of nearly
+    equal length
+
+    :param frame: pandas.DataFrame to split
+    :param n_chunks: int number of chunks
+    :return: list of pandas.DataFrame chunks in row order
+    """
+    bounds = np.linspace(0, len(frame), n_chunks + 1).astype(int)
+    return [
+        frame.iloc[start:stop]
+        for start, stop in zip(bounds[:-1], bounds[1:])
+        if stop > start
+    ]
 
 
 class ColumnConversionsMixin(object):
@@ -20,7 +279,7 @@ class ColumnConversionsMixin(object):
     def substitute_chars(self, column, pattern, val_sub,
                          val_exception=np.nan, val_none=np.nan,
                          inplace=True, return_series=False,
-                         target_column=None):
+                         target_column=None, jobs=1, processes=False):
         """
         Strips or replaces characters from column values.
 
@@ -29,7 +288,9 @@ class ColumnConversionsMixin(object):
         characters, specify the desired replacement characters using val_sub
         (i.e. val_sub='substring')
 
-        :param column: str name of column on which to apply this operation
+        :param column: str name of column on which to apply this operation,
+            or list of str names of columns, which are converted in parallel
+            when jobs > 1
         :param pattern: str Regex pattern specifying which types of characters
             to substiture with val_sub str
         :param val_sub: str character(s) with which to replace pattern values
@@ -44,17 +305,27 @@ class ColumnConversionsMixin(object):
         :param target_column: None or string name of new column created, if
             None and inplace=True, modified series replaces original column,
             default=None
-        :return: pandas.Series if return_series is specified as True
+        :param jobs: int number of columns converted in parallel when column
+            is a list, default=1
+        :param processes: bool whether to convert columns in worker processes
+            rather than threads, default=False
+        :return: pandas.Series if return_series is specified as True, or a
+            pandas.DataFrame of the modified columns if column is a list
         """
-        series = self.df[column].copy().astype(str).apply(
-            lambda x: regex_sub_value(
-                val=x,
-                pattern=pattern,
-                val_sub=val_sub,
-                val_exception=val_exception,
-                val_none=val_none,
-            )
+        convert = partial(
+            regex_sub_series,
+            pattern=pattern,
+            val_sub=val_sub,
+            val_exception=val_exception,
+            val_none=val_none,
         )
+        if is_column_list(column):
+            series_list = convert_columns(self.df, column, convert,
+                                          jobs, processes)
+            return inplace_return_columns(self.df, column, series_list, None,
+                                          inplace, return_series,
+                                          target_column)
+        series = convert(self.df[column])
         return inplace_return_series(self.df, column, series,
                                      inplace, return_series, target_column)
 
@@ -63,30 +334,43 @@ class ColumnConversionsMixin(object):
         returns a value_counts series reporting all column values that cannot
         be directly converted to numeric data types int or float
 
+        Columns that are already numeric are not converted to strings, and
+        only their missing values are reported.
+
         :param column: str name of column to check for nonnumeric
         :param dropna: bool optional, whether to drop na values from resulting
             value_count series, default=False
         :param kwargs: additional arguments for pandas value_counts method
         :return: pandas.Series object
         """
-        value_counts = self.df[
-            pd.to_numeric(
-                self.df[column].astype(str),
-                errors='coerce'
-            ).isnull()
-        ][column].value_counts(dropna=dropna, **kwargs)
-        return value_counts
+        original = self.df[column]
+        if is_numeric_column(original):
+            series = original
+        else:
+            series = pd.to_numeric(original.astype(str), errors='coerce')
+        return failure_counts(original, series, dropna, **kwargs)
 
-    def to_numeric(self, column, coerce=True,
-                   inplace=True, return_series=False, target_column=None):
+    def to_numeric(self, column, coerce=True, return_failures=False,
+                   dropna=False, inplace=True, return_series=False,
+                   target_column=None, jobs=1, processes=False):
         """
         wrapper for pandas to_numeric method, which converts column values to
         a numeric data type (int or float)
 
-        :param column: str name of column to convert to numeric
+        The column is converted only once, also when the values that cannot
+        be converted are reported with return_failures, and columns that are
+        already numeric are returned as is.
+
+        :param column: str name of column to convert to numeric, or list of
+            str names of columns, which are converted in parallel when
+            jobs > 1
         :param coerce: bool optional, specifies whether to 'coerce'
             non-convertable values to numpy.nan if True or to leave those
             values as is if False, default=True
+        :param return_failures: bool whether to return a value_counts series
+            of the column values that could not be converted, default=False
+        :param dropna: bool optional, whether to drop na values from the
+            failures value_counts series, default=False
         :param inplace: bool whether to make changes to self.df in place,
             default=True
         :param return_series: bool whether to return modified pandas.Series
@@ -94,44 +378,143 @@ class ColumnConversionsMixin(object):
         :param target_column: None or string name of new column created, if
             None and inplace=True, modified series replaces original column,
             default=None
-        :return: pandas.Series if return_series is specified as True
+        :param jobs: int number of columns converted in parallel when column
+            is a list, default=1
+        :param processes: bool whether to convert columns in worker processes
+            rather than threads, default=False
+        :return: pandas.Series if return_series is specified as True, the
+            failures pandas.Series if return_failures is specified as True, or
+            a tuple of both if both are specified as True. If column is a
+            list, a pandas.DataFrame of the modified columns and a dict of
+            failures by column are returned instead
         """
-        series = pd.to_numeric(
-            self.df[column],
-            errors='coerce' if coerce else 'ignore'
+        convert = partial(
+            numeric_series,
+            coerce=coerce,
+            return_failures=return_failures,
+            dropna=dropna,
         )
-        return inplace_return_series(self.df, column, series,
-                                     inplace, return_series, target_column)
+        if is_column_list(column):
+            results = convert_columns(self.df, column, convert,
+                                      jobs, processes)
+            return inplace_return_columns(
+                self.df,
+                column,
+                [series for series, _ in results],
+                [failures for _, failures in results]
+                if return_failures else None,
+                inplace,
+                return_series,
+                target_column,
+            )
+        series, failures = convert(self.df[column])
+        return inplace_return_failures(self.df, column, series, failures,
+                                       inplace, return_series, target_column)
+
+    def parse_numeric(self, column, thousands=',', decimal='.',
+                      currency=CURRENCY_SYMBOLS, return_failures=False,
+                      dropna=False, inplace=True, return_series=False,
+                      target_column=None):
+        """
+        converts dirty numeric strings, i.e. '$12,400', '15,987.00', '12.5%',
+        or '(1,234)', to float values using
+        basedata.ops.numeric.parse_numbers
+
+        Thousands separators and currency symbols are removed, values ending
+        with a percent sign are divided by 100, and values in accounting
+        parentheses are negative. Values that cannot be converted become
+        numpy.nan.
+
+        :param column: str name of column to convert to numeric
+        :param thousands: str thousands separator, default=','
+        :param decimal: str decimal separator, default='.'
+        :param currency: str of currency symbols removed from values,
+            default='$€£¥'
+        :param return_failures: bool whether to return a value_counts series
+            of the column values that could not be converted, as reported by
+            check_nonnumeric, default=False
+        :param dropna: bool optional, whether to drop na values from the
+            failures value_counts series, default=False
+        :param inplace: bool whether to make changes to self.df in place,
+            default=True
+        :param return_series: bool whether to return modified pandas.Series
+            object, default=False
+        :param target_column: None or string name of new column created, if
+            None and inplace=True, modified series replaces original column,
+            default=None
+        :return: pandas.Series if return_series is specified as True, the
+            failures pandas.Series if return_failures is specified as True, or
+            a tuple of both if both are specified as True
+        """
+        original = self.df[column]
+        series = parse_numbers(original, thousands, decimal, currency)
+        failures = failure_counts(original, series, dropna) \
+            if return_failures else None
+        return inplace_return_failures(self.df, column, series, failures,
+                                       inplace, return_series, target_column)
 
-    def check_datetime(self, column, dropna=False, **kwargs):
+    def check_datetime(self, column, dropna=False, formats=None, **kwargs):
         """
         returns a value_counts series reporting all column values that cannot
         be directly converted to a datetime data type
 
+        Column values are converted to strings and parsed by
+        basedata.ops.dates.parse_datetimes, so epoch integers are reported as
+        values that cannot be converted. Columns that are already datetimes
+        are not converted to strings, and only their missing values are
+        reported.
+
         :param column: str name of column to check for datetime conversion
         :param dropna: bool optional, whether to drop na values from resulting
             value_count series, default=False
+        :param formats: list of str strftime formats tried in order, default
+            None detects formats from a sample of column values
         :param kwargs: additional arguments for pandas value_counts method
         :return: pandas.Series object
         """
-        value_counts = self.df[
-            pd.to_datetime(
-                self.df[column].astype(str),
-                errors='coerce'
-            ).isnull()
-        ][column].value_counts(dropna=dropna, **kwargs)
-        return value_counts
+        original = self.df[column]
+        if is_datetime_column(original):
+            return failure_counts(original, original, dropna, **kwargs)
+        values = original.astype(str)
+        parsed = parse_datetimes(values, formats)
+        if parsed is None:
+            series = pd.to_datetime(values, errors='coerce')
+        else:
+            series, _ = parsed
+        return failure_counts(original, series, dropna, **kwargs)
 
-    def to_datetime(self, column, coerce=True,
-                    inplace=True, return_series=False, target_column=None):
+    def to_datetime(self, column, coerce=True, formats=None, epoch_unit='ns',
+                    return_failures=False, dropna=False,
+                    inplace=True, return_series=False, target_column=None,
+                    jobs=1, processes=False):
         """
-        wrapper for pandas to_numeric method, which converts column values to
-        a datetime data type
+        converts column values to a datetime data type using
+        basedata.ops.dates.parse_datetimes
+
+        The date formats that parse the most values in a sample of the
+        column's strings are tried over all of its strings in order, strings
+        matching none of them are parsed by pandas.to_datetime, and integer
+        and float values are converted as epoch times. A pandas.DataFrame
+        reporting the number and share of rows parsed by each format is saved
+        to self.dateformats[column]. The column is converted only once, also
+        when the values that cannot be converted are reported with
+        return_failures, and columns that are already datetimes are returned
+        as is.
 
-        :param column: str name of column to convert to datetime
+        :param column: str name of column to convert to datetime, or list of
+            str names of columns, which are converted in parallel when
+            jobs > 1
         :param coerce: bool optional, specifies whether to 'coerce'
             non-convertable values to numpy.nan if True or to leave those
             values as is if False, default=True
+        :param formats: list of str strftime formats tried in order, default
+            None detects formats from a sample of column values
+        :param epoch_unit: str unit of integer and float epoch times, i.e.
+            's', 'ms', or 'ns', default='ns' as in pandas.to_datetime
+        :param return_failures: bool whether to return a value_counts series
+            of the column values that could not be converted, default=False
+        :param dropna: bool optional, whether to drop na values from the
+            failures value_counts series, default=False
         :param inplace: bool whether to make changes to self.df in place,
             default=True
         :param return_series: bool whether to return modified pandas.Series
@@ -139,37 +522,90 @@ class ColumnConversionsMixin(object):
         :param target_column: None or string name of new column created, if
             None and inplace=True, modified series replaces original column,
             default=None
-        :return: pandas.Series if return_series is specified as True
+        :param jobs: int number of columns converted in parallel when column
+            is a list, default=1
+        :param processes: bool whether to convert columns in worker processes
+            rather than threads, default=False
+        :return: pandas.Series if return_series is specified as True, the
+            failures pandas.Series if return_failures is specified as True, or
+            a tuple of both if both are specified as True. If column is a
+            list, a pandas.DataFrame of the modified columns and a dict of
+            failures by column are returned instead
         """
-        series = pd.to_datetime(
-            self.df[column],
-            errors='coerce' if coerce else 'ignore'
+        if not hasattr(self, 'dateformats'):
+            self.dateformats = dict()
+        convert = partial(
+            datetime_series,
+            coerce=coerce,
+            formats=formats,
+            epoch_unit=epoch_unit,
+            return_failures=return_failures,
+            dropna=dropna,
         )
-        return inplace_return_series(self.df, column, series,
-                                     inplace, return_series, target_column)
+        columns = column if is_column_list(column) else [column]
+        results = convert_columns(self.df, columns, convert, jobs, processes)
+        for col, (_, report, _) in zip(columns, results):
+            if report is not None:
+                self.dateformats[col] = report
+        if is_column_list(column):
+            return inplace_return_columns(
+                self.df,
+                column,
+                [series for series, _, _ in results],
+                [failures for _, _, failures in results]
+                if return_failures else None,
+                inplace,
+                return_series,
+                target_column,
+            )
+        (series, _, failures), = results
+        return inplace_return_failures(self.df, column, series, failures,
+                                       inplace, return_series, target_column)
 
-    def report_values(self, column, dropna=False, **kwargs):
+    def report_values(self, column, dropna=False, top_k=None, **kwargs):
         """
         returns a value_counts series reporting all unique column values
 
+        When top_k is specified, the column is counted COUNT_CHUNKSIZE rows at
+        a time by a basedata.ops.counts.SpaceSaving counter that keeps only
+        the estimated counts of the top_k most frequent values, which
+        overestimate the true counts by at most len(column) / top_k.
+
         :param column: str name of column to check for unique values
         :param dropna: bool optional, whether to drop na values from resulting
             value_count series, default=False
+        :param top_k: None or int number of most frequent values to report
+            with bounded memory, default=None reports all values exactly
         :param kwargs: additional arguments for pandas value_counts method
         :return: pandas.Series object
         """
+        if top_k:
+            return count_series(
+                self.df[column], SpaceSaving(top_k, dropna),
+            ).result()
         value_counts = self.df[column].value_counts(dropna=False, **kwargs)
         return value_counts
 
     def map_values(self, column, map_dict, na_action=None, exhaustive=False,
-                   inplace=True, return_series=False, target_column=None):
+                   inplace=True, return_series=False, target_column=None,
+                   key_column=None, value_column=None, return_unmatched=False,
+                   **read_kwargs):
         """
-        maps existing column values to new value based on input dictionary
+        maps existing column values to new value based on input dictionary,
+        pandas.Series, pandas.DataFrame, or data file
 
-        acts as a simple wrapper for the pandas Series.map method
+        Each distinct column value is looked up in the mapping only once by
+        a hash join against the mapping's keys, see map_series, so large
+        mappings read from file are never converted to a dict. Values that
+        do not match any key are counted in the same pass and may be
+        returned with return_unmatched.
 
         :param column: str name of column in which value will be mapped
-        :param map_dict: dict mapping {current_value: new_value}
+        :param map_dict: dict mapping {current_value: new_value},
+            pandas.Series of new values indexed by current values, or
+            pandas.DataFrame or str filename of a .csv, .parquet, or other
+            file read by basedata.ops.base.read_datafile holding current
+            values and new values in two columns
         :param na_action: None or 'ignore', if 'ignore' propogate NaN values
             without passing them to the mapping correspondence, defaul=None
         :param exhaustive: bool whether or not value map is expected to affect
@@ -183,17 +619,26 @@ class ColumnConversionsMixin(object):
         :param target_column: None or string name of new column created, if
             None and inplace=True, modified series replaces original column,
             default=None
-        :return: pandas.Series if return_series is specified as True
+        :param key_column: str name of the column of current values when
+            map_dict is a pandas.DataFrame or filename, default=None uses the
+            first column
+        :param value_column: str name of the column of new values when
+            map_dict is a pandas.DataFrame or filename, default=None uses the
+            second column
+        :param return_unmatched: bool whether to return a value_counts series
+            of the column values not matching any key, default=False
+        :param read_kwargs: optional args to read_datafile when map_dict is a
+            filename
+        :return: pandas.Series if return_series is specified as True, the
+            unmatched pandas.Series if return_unmatched is specified as True,
+            or a tuple of both if both are specified as True
         """
-        if exhaustive:
-            series = self.df[column].copy().map(map_dict, na_action)
-        else:
-            series = self.df[column].copy().map(
-                map_dict,
-                na_action
-            ).fillna(self.df[column].copy())
-        return inplace_return_series(self.df, column, series,
-                                     inplace, return_series, target_column)
+        mapping = mapping_series(map_dict, key_column, value_column,
+                                 **read_kwargs)
+        series, unmatched = map_series(self.df[column], mapping, na_action,
+                                       exhaustive, return_unmatched)
+        return inplace_return_failures(self.df, column, series, unmatched,
+                                       inplace, return_series, target_column)
 
     def map_column_names(self, map_dict, inplace=True):
         """
@@ -210,10 +655,20 @@ class ColumnConversionsMixin(object):
         return self.df.rename(columns=map_dict, inplace=inplace)
 
     def apply_function(self, column_list, function, target_column,
-                       inplace=True, return_series=False, **kwargs):
+                       inplace=True, return_series=False, vectorized=False,
+                       jobs=1, **kwargs):
         """
         Applies function to dataframe object, using pandas.DataFrame.apply()
-        method.
+        method, or to whole column arrays when vectorized=True.
+
+        When vectorized=True, function is called once with each column of
+        column_list as a pandas.Series positional argument, i.e.
+        function(df['a'], df['b']), and must return an array-like with one
+        value per row. When jobs > 1, the rows of self.df are split into jobs
+        chunks that are applied in parallel worker processes and joined in
+        order, so function must be picklable, i.e. defined at module level
+        rather than as a lambda, and must be row-wise, i.e. axis=1, or
+        vectorized.
 
         :param column_list: list column name(s) against which to apply function
         :param function: function to apply to dataframe object
@@ -223,18 +678,35 @@ class ColumnConversionsMixin(object):
             default=True
         :param return_series: bool whether to return modified pandas.Series
             object, default=False
-        :param kwargs: optional keyword args to for pandas apply method.
-            Axis=1 is required whenever the function is applied to multiple
-            input columns
+        :param vectorized: bool whether to call function once with whole
+            column arrays rather than once per row or column, default=False
+        :param jobs: int number of row chunks applied in parallel worker
+            processes, default=1 applies function in the current process
+        :param kwargs: optional keyword args to for pandas apply method, or to
+            function when vectorized=True. Axis=1 is required whenever the
+            function is applied to multiple input columns
         :return: pandas.Series if return_series is specified as True
         """
         if inplace and not target_column:
             raise ValueError(
                 'When inplace == True a target_column name must be specified.'
             )
-        result = self.df[column_list].copy().apply(function, **kwargs)
-        is_df = isinstance(result, pd.DataFrame)
-        series = result.iloc[:, 0] if is_df else result
+        if jobs > 1 and not vectorized \
+                and kwargs.get('axis', 0) not in (1, 'columns'):
+            raise ValueError(
+                'When jobs > 1 function must be applied with axis=1 or '
+                'vectorized=True.'
+            )
+        apply = partial(apply_frame, function=function,
+                        vectorized=vectorized, **kwargs)
+        frame = self.df[column_list]
+        if jobs > 1 and len(frame) > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                series = pd.concat(
+                    list(executor.map(apply, split_rows(frame, jobs)))
+                )
+        else:
+            series = apply(frame)
         return inplace_return_series(self.df, target_column, series,
                                      inplace, return_series, target_column)
 
@@ -0,0 +1,320 @@
+"""
+This submodule contains counters that report the values of a column one
+chunk at a time, so that columns too large to count in memory, i.e. columns
+read from file by a basedata.ops.stream.ChunkedPipeline, can be counted
+with bounded memory.
+
+Each counter is updated with a pandas.Series chunk and can be merged with
+another counter of the same type, so that chunks may be counted in separate
+processes and their partial counts merged:
+
+- ExactCounter keeps an exact value_counts series of every value
+- SpaceSaving keeps the estimated counts of at most k heavy hitter values,
+  overestimating the count of each value by at most N / k, where N is the
+  number of values counted
+- HyperLogLog estimates the number of distinct values from 2 ** precision
+  registers with a relative standard error of 1.04 / sqrt(2 ** precision)
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+TOP_K = 1000
+HLL_PRECISION = 14
+
+# number of rows counted at a time by count_series
+COUNT_CHUNKSIZE = 1000000
+
+
+class ExactCounter(object):
+    """
+    ExactCounter counts every distinct value exactly
+
+    :param dropna: bool whether to exclude missing values from the counts,
+        default=False
+    """
+
+    def __init__(self, dropna=False):
+        self.dropna = dropna
+        self.counts = pd.Series(dtype=np.int64)
+        self.total = 0
+
+    def update(self, series):
+        """
+        Counts the values of a chunk
+
+        :param series: pandas.Series chunk of values
+        """
+        self._add(series.value_counts(dropna=self.dropna), len(series))
+        self.counts.name = series.name
+
+    def merge(self, other):
+        """
+        Adds the counts of another ExactCounter to this counter
+
+        :param other: ExactCounter
+        """
+        self._add(other.counts, other.total)
+
+    def _add(self, counts, total):
+        """Adds a value_counts series to the counts"""
+        name = self.counts.name if self.total else counts.name
+        if self.total:
+            counts = pd.concat([self.counts, counts]).groupby(
+                level=0, dropna=False, sort=False,
+            ).sum()
+        self.counts = counts.astype(np.int64)
+        self.counts.name = name
+        self.total += total
+
+    def result(self):
+        """
+        :return: pandas.Series value_counts of every value, in descending
+            order of count
+        """
+        return self.counts.sort_values(ascending=False, kind='stable')
+
+
+class SpaceSaving(object):
+    """
+    SpaceSaving keeps the estimated counts of the k most frequent values
+
+    Each chunk is counted exactly and merged into the summary as a
+    weighted update: values already in the summary add their chunk counts,
+    new values add their chunk counts to the smallest count of a full
+    summary, and only the k largest counts are kept. Two summaries are merged
+    in the same way, following the parallel Space-Saving algorithm of Cafaro
+    et al.
+
+    Estimated counts are never less than the true counts, and overestimate
+    them by at most the value's error, which is no greater than error_bound,
+    N / k. Every value occurring more than N / k times is in the summary.
+
+    :param k: int maximum number of values kept, default=TOP_K
+    :param dropna: bool whether to exclude missing values from the counts,
+        default=False
+    """
+
+    def __init__(self, k=TOP_K, dropna=False):
+        self.k = k
+        self.dropna = dropna
+        self.counts = pd.Series(dtype=np.int64)
+        self.errors = pd.Series(dtype=np.int64)
+        self.total = 0
+
+    @property
+    def error_bound(self):
+        """
+        :return: float maximum overestimate of any count, N / k
+        """
+        return self.total / self.k
+
+    def min_count(self):
+        """
+        :return: int smallest count of a full summary, which bounds the count
+            of any value not in the summary, or 0 if the summary is not full
+        """
+        return int(self.counts.min()) if len(self.counts) >= self.k else 0
+
+    def update(self, series):
+        """
+        Counts the values of a chunk
+
+        :param series: pandas.Series chunk of values
+        """
+        counts = series.value_counts(dropna=self.dropna)
+        self._merge(
+            counts,
+            pd.Series(0, index=counts.index, dtype=np.int64),
+            0,
+            len(series),
+        )
+        self.counts.name = series.name
+
+    def merge(self, other):
+        """
+        Merges the summary of another SpaceSaving counter into this counter
+
+        :param other: SpaceSaving counter with the same k
+        """
+        self._merge(other.counts, other.errors, other.min_count(),
+                    other.total)
+
+    def _merge(self, counts, errors, min_count, total):
+        """Merges counts, and their errors, into the summary"""
+        name = self.counts.name if self.total else counts.name
+        own_min = self.min_count()
+        summary = pd.concat(
+            [self.counts, self.errors, counts, errors],
+            axis=1,
+            keys=['count', 'error', 'other_count', 'other_error'],
+        )
+        own = summary['count'].notnull()
+        other = summary['other_count'].notnull()
+        summary['count'] = (
+            summary['count'].fillna(own_min)
+            + summary['other_count'].fillna(min_count)
+        )
+        summary['error'] = (
+            summary['error'].where(own, own_min)
+            + summary['other_error'].where(other, min_count)
+        )
+        summary = summary.nlargest(self.k, 'count', keep='first')
+        self.counts = summary['count'].astype(np.int64)
+        self.errors = summary['error'].astype(np.int64)
+        self.counts.name = name
+        self.total += total
+
+    def result(self):
+        """
+        :return: pandas.Series estimated value_counts of at most k values, in
+            descending order of count
+        """
+        return self.counts.sort_values(ascending=False, kind='stable')
+
+
+class HyperLogLog(object):
+    """
+    HyperLogLog estimates the number of distinct values
+
+    Values are hashed with pandas.util.hash_pandas_object, so the hashes of
+    equal values are the same in every process. The estimate has a relative
+    standard error of 1.04 / sqrt(2 ** precision), 0.81% for the default
+    precision of 14, using 2 ** precision bytes of memory.
+
+    :param precision: int number of hash bits used to select a register,
+        from 4 to 18, default=HLL_PRECISION
+    :param dropna: bool whether to exclude missing values from the count,
+        default=True as in pandas.Series.nunique
+    """
+
+    def __init__(self, precision=HLL_PRECISION, dropna=True):
+        if not 4 <= precision <= 18:
+            raise ValueError('precision must be from 4 to 18')
+        self.precision = precision
+        self.dropna = dropna
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+        self.total = 0
+
+    @property
+    def relative_error(self):
+        """
+        :return: float relative standard error of the estimate
+        """
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def update(self, series):
+        """
+        Adds the values of a chunk to the registers
+
+        :param series: pandas.Series chunk of values
+        """
+        self.total += len(series)
+        if self.dropna:
+            series = series.dropna()
+        if len(series) == 0:
+            return
+        hashes = pd.util.hash_pandas_object(series, index=False).to_numpy()
+        width = 64 - self.precision
+        index = (hashes >> np.uint64(width)).astype(np.intp)
+        remainder = hashes & np.uint64(2 ** width - 1)
+        # rank of the first set bit of the remaining width bits
+        bit_length = np.searchsorted(
+            2 ** np.arange(width, dtype=np.uint64), remainder, side='right',
+        )
+        rank = (width - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other):
+        """
+        Merges the registers of another HyperLogLog counter into this counter
+
+        :param other: HyperLogLog counter with the same precision
+        """
+        if other.precision != self.precision:
+            raise ValueError('HyperLogLog precisions must match to merge')
+        np.maximum(self.registers, other.registers, out=self.registers)
+        self.total += other.total
+
+    def result(self):
+        """
+        :return: int estimated number of distinct values
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m ** 2 / np.sum(
+            np.exp2(-self.registers.astype(np.float64))
+        )
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros:
+            # linear counting is more accurate for small cardinalities
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+
+def _count_chunk(counter, chunk):
+    """
+    Updates a counter with a chunk, used by worker processes of count_chunks
+    """
+    counter.update(chunk)
+    return counter
+
+
+def _empty_copy(counter):
+    """Generates an empty counter with the parameters of counter"""
+    if isinstance(counter, SpaceSaving):
+        return SpaceSaving(counter.k, counter.dropna)
+    if isinstance(counter, HyperLogLog):
+        return HyperLogLog(counter.precision, counter.dropna)
+    return ExactCounter(counter.dropna)
+
+
+def count_chunks(chunks, counter, jobs=1):
+    """
+    Counts a sequence of pandas.Series chunks, in jobs worker processes when
+    jobs > 1, and merges each chunk's counts into counter
+
+    At most 2 * jobs chunks are held in memory at any time.
+
+    :param chunks: iterable of pandas.Series chunks of values
+    :param counter: ExactCounter, SpaceSaving, or HyperLogLog counter
+    :param jobs: int number of chunks counted in parallel worker processes,
+        default=1 counts chunks in the current process
+    :return: the updated counter
+    """
+    if jobs <= 1:
+        for chunk in chunks:
+            counter.update(chunk)
+        return counter
+    pending = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for chunk in chunks:
+            pending.append(
+                executor.submit(_count_chunk, _empty_copy(counter), chunk)
+            )
+            if len(pending) >= 2 * jobs:
+                counter.merge(pending.pop(0).result())
+        for future in pending:
+            counter.merge(future.result())
+    return counter
+
+
+def count_series(series, counter, chunksize=COUNT_CHUNKSIZE):
+    """
+    Counts the values of a series chunksize rows at a time
+
+    :param series: pandas.Series of values
+    :param counter: ExactCounter, SpaceSaving, or HyperLogLog counter
+    :param chunksize: int number of rows counted at a time,
+        default=COUNT_CHUNKSIZE
+    :return: the updated counter
+    """
+    return count_chunks(
+        (
+            series.iloc[start:start + chunksize]
+            for start in range(0, len(series), chunksize)
+        ),
+        counter,
+    )
@@ -0,0 +1,223 @@
+"""
+This submodule contains functions for converting columns holding a mix of
+date strings, epoch integers, and blank values to datetimes.
+
+Each distinct value is parsed only once. The date formats that parse the
+most distinct values in a sample of the column's strings are tried over all
+of its strings in order, and strings matching none of those formats exactly
+are parsed by pandas.to_datetime without a format. Integer and float values
+are converted as epoch times. The number of rows parsed by each format is
+reported alongside the converted values.
+"""
+import datetime
+import re
+
+import numpy as np
+import pandas as pd
+
+from .base import compile_pattern
+
+
+# candidate formats detected by detect_formats, more specific formats are
+# listed first so that they are preferred when formats parse equal shares
+DATE_FORMATS = (
+    '%Y-%m-%d %H:%M:%S.%f',
+    '%Y-%m-%dT%H:%M:%S.%f',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%d',
+    '%Y/%m/%d',
+    '%Y%m%d',
+    '%m/%d/%Y %H:%M:%S',
+    '%m/%d/%Y %H:%M',
+    '%m/%d/%Y',
+    '%d/%m/%Y',
+    '%m/%d/%y',
+    '%d.%m.%Y',
+    '%d-%b-%Y',
+    '%d %b %Y',
+    '%b %d, %Y',
+)
+
+SAMPLE_SIZE = 1000
+
+# regex patterns matching the strings each strftime directive may parse
+DIRECTIVE_PATTERNS = {
+    '%Y': '[0-9]{4}',
+    '%y': '[0-9]{2}',
+    '%m': '[0-9]{1,2}',
+    '%d': '[0-9]{1,2}',
+    '%H': '[0-9]{1,2}',
+    '%M': '[0-9]{1,2}',
+    '%S': '[0-9]{1,2}',
+    '%f': '[0-9]{1,9}',
+    '%b': '[A-Za-z]{3}',
+    '%B': '[A-Za-z]+',
+}
+
+# report labels for values not parsed by a date format
+EPOCH, DATETIME, INFERRED, UNPARSED, MISSING = (
+    'epoch', 'datetime', 'inferred', 'unparsed', 'missing'
+)
+
+
+def format_pattern(date_format):
+    """
+    Generates a compiled regex pattern matching strings in a strftime format,
+    used to check that strings match a format exactly before they are parsed
+
+    :param date_format: str strftime format
+    :return: re.Pattern compiled pattern
+    """
+    parts = re.split('(%[a-zA-Z])', date_format)
+    return compile_pattern(''.join(
+        DIRECTIVE_PATTERNS.get(part, re.escape(part)) for part in parts
+    ))
+
+
+def parse_format(values, date_format):
+    """
+    Parses the string values matching a strftime format exactly
+
+    :param values: numpy.ndarray of str values
+    :param date_format: str strftime format
+    :return: numpy.ndarray of datetime64[ns] values, NaT where values do not
+        match the format
+    """
+    fullmatch = format_pattern(date_format).fullmatch
+    matches = np.array([bool(fullmatch(val)) for val in values], dtype=bool)
+    parsed = np.full(len(values), np.datetime64('NaT'), dtype='M8[ns]')
+    if matches.any():
+        parsed[matches] = pd.to_datetime(
+            values[matches],
+            format=date_format,
+            errors='coerce',
+        )
+    return parsed
+
+
+def detect_formats(values, formats=DATE_FORMATS, sample_size=SAMPLE_SIZE):
+    """
+    Detects which date formats parse a sample of string values
+
+    :param values: numpy.ndarray of str values
+    :param formats: iterable of str strftime formats to try, default
+        DATE_FORMATS
+    :param sample_size: int maximum number of values sampled, default=1000
+    :return: list of str formats parsing at least one sampled value, in
+        descending order of the share of values they parse
+    """
+    if len(values) == 0:
+        return []
+    step = max(len(values) // sample_size, 1)
+    sample = values[::step][:sample_size]
+    shares = []
+    for i, date_format in enumerate(formats):
+        n_parsed = pd.notnull(parse_format(sample, date_format)).sum()
+        if n_parsed:
+            shares.append((-n_parsed, i, date_format))
+    return [date_format for _, _, date_format in sorted(shares)]
+
+
+def _value_kinds(values):
+    """
+    Classifies object values as numbers, datetimes, or strings
+    """
+    is_number = np.array([
+        isinstance(val, (int, float, np.number))
+        and not isinstance(val, (bool, np.bool_))
+        for val in values
+    ], dtype=bool)
+    is_datetime = np.array([
+        isinstance(val, (datetime.date, np.datetime64)) for val in values
+    ], dtype=bool)
+    is_string = np.array([isinstance(val, str) for val in values],
+                         dtype=bool)
+    return is_number, is_datetime, is_string
+
+
+def parse_datetimes(series, formats=None, epoch_unit='ns',
+                    sample_size=SAMPLE_SIZE, infer=True):
+    """
+    Converts a series of date strings, epoch times, and datetimes to
+    datetimes, parsing each distinct value only once
+
+    Strings are parsed by the formats detected in a sample of the series'
+    distinct strings, in order, and strings matching none of them are parsed
+    by pandas.to_datetime without a format. Integer and float values are
+    converted as epoch times in epoch_unit units, which defaults to 'ns'
+    like pandas.to_datetime. Values that cannot be converted become NaT.
+
+    :param series: pandas.Series to convert
+    :param formats: list of str strftime formats tried in order, default=None
+        detects formats from DATE_FORMATS
+    :param epoch_unit: str unit of epoch times, i.e. 's', 'ms', or 'ns',
+        default='ns'
+    :param sample_size: int maximum number of distinct strings sampled to
+        detect formats, default=1000
+    :param infer: bool whether to parse strings matching none of the formats
+        with pandas.to_datetime, which parses each such string separately, if
+        False they are left 'unparsed', default=True
+    :return: tuple of the converted pandas.Series and a pandas.DataFrame
+        reporting the number of rows and share of rows parsed by each format
+        or converted as an 'epoch', 'datetime', or 'inferred' value, or left
+        'unparsed' or 'missing', or None if values parsed without a format
+        hold timezones and cannot be combined with the other values
+    """
+    codes, uniques = pd.factorize(series)
+    values = np.asarray(uniques, dtype=object)
+    parsed = np.full(len(values), np.datetime64('NaT'), dtype='M8[ns]')
+    labels = np.full(len(values), UNPARSED, dtype=object)
+    is_number, is_datetime, is_string = _value_kinds(values)
+
+    if is_number.any():
+        parsed[is_number] = pd.to_datetime(
+            values[is_number], unit=epoch_unit, errors='coerce',
+        )
+        labels[is_number] = EPOCH
+    if is_datetime.any():
+        converted = pd.to_datetime(values[is_datetime], errors='coerce')
+        if getattr(converted, 'tz', None) is not None \
+                or converted.dtype == object:
+            return None
+        parsed[is_datetime] = converted
+        labels[is_datetime] = DATETIME
+
+    remaining = np.flatnonzero(is_string)
+    if formats is None:
+        formats = detect_formats(values[remaining], sample_size=sample_size)
+    for date_format in formats:
+        if len(remaining) == 0:
+            break
+        converted = parse_format(values[remaining], date_format)
+        is_parsed = pd.notnull(converted)
+        parsed[remaining[is_parsed]] = converted[is_parsed]
+        labels[remaining[is_parsed]] = date_format
+        remaining = remaining[~is_parsed]
+    if infer and len(remaining):
+        converted = pd.to_datetime(values[remaining], errors='coerce')
+        if getattr(converted, 'tz', None) is not None \
+                or converted.dtype == object:
+            return None
+        is_parsed = np.asarray(converted.notnull())
+        parsed[remaining[is_parsed]] = converted[is_parsed]
+        labels[remaining[is_parsed]] = INFERRED
+
+    labels[pd.isnull(parsed) & (labels != UNPARSED)] = UNPARSED
+    missing = codes < 0
+    result = parsed.take(np.where(missing, 0, codes)) if len(values) \
+        else np.full(len(codes), np.datetime64('NaT'), dtype='M8[ns]')
+    result[missing] = np.datetime64('NaT')
+
+    counts = np.bincount(codes[~missing], minlength=len(values))
+    rows = pd.Series(counts, dtype=np.int64).groupby(labels).sum()
+    rows[MISSING] = int(missing.sum())
+    order = list(formats) + [EPOCH, DATETIME, INFERRED, UNPARSED, MISSING]
+    rows = rows.reindex([label for label in order if label in rows.index])
+    rows = rows[rows > 0]
+    report = pd.DataFrame({
+        'rows': rows,
+        'share': rows / max(len(series), 1),
+    })
+    report.index.name = 'format'
+    return pd.Series(result, index=series.index, name=series.name), report
@@ -4,10 +4,96 @@ This submodule basedata.ops mixin classes for cleaning unique ID values.
 The functionality of these mixin classes is aggregated in the basedata.ops
 BaseDataOps class.
 """
+from functools import partial
+
 import numpy as np
 import pandas as pd
 
-from .base import inplace_return_series, regex_sub_value, regex_replace_value
+from .base import convert_columns, inplace_return_columns,\
+    inplace_return_series, is_column_list, regex_replace_array,\
+    regex_sub_series
+from .unique import apply_unique
+
+
+# character classes for which numeric ID lengths are checked arithmetically
+DIGIT_CLASSES = ('[0-9]', '\\d', '[\\d]')
+
+POWERS_OF_TEN = 10 ** np.arange(1, 20, dtype=np.uint64)
+
+
+def is_numeric_id_series(series, integral_floats=False):
+    """
+    Determines whether a series holds integer, or float, values whose ID
+    lengths can be calculated without converting them to strings
+
+    :param series: pandas.Series
+    :param integral_floats: bool whether float values are measured as the
+        integers they hold, default=False measures only integer values
+    :return: bool
+    """
+    return series.dtype.kind in ('iuf' if integral_floats else 'iu')
+
+
+def numeric_id_lengths(series):
+    """
+    Calculates the number of characters of each value of an integer or float
+    series written as an integer ID, i.e. len(str(int(value))), by counting
+    digits rather than converting values to strings
+
+    Float values are measured as the integers they hold, so that IDs read
+    as floats because of missing values are measured without their '.0'
+    suffix. Non-integral floats, NaN, and infinite values have length -1.
+
+    :param series: pandas.Series of integer or float values
+    :return: tuple of numpy.ndarray int lengths and numpy.ndarray of the
+        integer values
+    """
+    values = series.to_numpy()
+    integral = None
+    if values.dtype.kind == 'f':
+        integral = (
+            np.isfinite(values)
+            & (np.floor(values) == values)
+            & (np.abs(values) < 2.0 ** 63)
+        )
+        values = np.where(integral, values, 0).astype(np.int64)
+    if values.dtype.kind == 'u':
+        magnitude = values.astype(np.uint64)
+        negative = np.zeros(len(values), dtype=bool)
+    else:
+        values = values.astype(np.int64)
+        magnitude = np.abs(values).astype(np.uint64)
+        negative = values < 0
+    lengths = np.searchsorted(POWERS_OF_TEN, magnitude, side='right') + 1
+    lengths += negative
+    if integral is not None:
+        lengths[~integral] = -1
+    return lengths, values
+
+
+def fill_series(series, other, fill):
+    """
+    Replaces the values of a series with the values of another series in
+    selected rows, categorical series keep their categorical dtype and gain
+    categories for any new values
+
+    :param series: pandas.Series whose values are replaced
+    :param other: pandas.Series of replacement values with the same index
+    :param fill: numpy.ndarray of bool selecting the rows to replace
+    :return: pandas.Series
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        values = other.to_numpy(dtype=object)[fill]
+        series = series.cat.add_categories(
+            pd.Index(pd.unique(values)).difference(
+                series.cat.categories, sort=False,
+            )
+        )
+        series.iloc[np.flatnonzero(fill)] = values
+        return series
+    if isinstance(other.dtype, pd.CategoricalDtype):
+        other = other.astype(object)
+    return series.where(~fill, other)
 
 
 class DedupeMixin(object):
@@ -102,10 +188,12 @@ class ValidIDsMixin(object):
     def strip_nonnumeric(self, column, pattern='[^0-9]', val_sub='',
                          val_exception=np.nan, val_none=np.nan,
                          inplace=True, return_series=False,
-                         target_column=None):
+                         target_column=None, jobs=1, processes=False):
         """
         strips nonnumeric characters from column values
 
+        :param column: str name of column, or list of str names of columns,
+            which are converted in parallel when jobs > 1
         :param pattern: str Regex pattern specifying which types of charaters
             to substiture with val_sub str, optional, default='[^0-9]'
         :param val_sub: str character(s) with which to replace pattern values,
@@ -118,43 +206,78 @@ class ValidIDsMixin(object):
             default=True
         :param return_series: bool whether to return modified pandas.Series
             object, default=False
-        :return: pandas.Series if return_series is specified as True
-        """
-        series = self.df[column].copy().astype(str).apply(
-            lambda x: regex_sub_value(
-                val=x,
-                pattern=pattern,
-                val_sub=val_sub,
-                val_exception=val_exception,
-                val_none=val_none
-            )
+        :param jobs: int number of columns converted in parallel when column
+            is a list, default=1
+        :param processes: bool whether to convert columns in worker processes
+            rather than threads, default=False
+        :return: pandas.Series if return_series is specified as True, or a
+            pandas.DataFrame of the modified columns if column is a list
+        """
+        convert = partial(
+            regex_sub_series,
+            pattern=pattern,
+            val_sub=val_sub,
+            val_exception=val_exception,
+            val_none=val_none,
         )
+        if is_column_list(column):
+            series_list = convert_columns(self.df, column, convert,
+                                          jobs, processes)
+            return inplace_return_columns(self.df, column, series_list, None,
+                                          inplace, return_series,
+                                          target_column)
+        series = convert(self.df[column])
         return inplace_return_series(self.df, column, series,
                                      inplace, return_series, target_column)
 
-    def report_offlenIDs(self, column, target_len=8, dropna=False):
+    def report_offlenIDs(self, column, target_len=8, dropna=False,
+                         integral_floats=False):
         """
         generate a value_counts report with all of the column values
         with number of characters not matching the specified target length
 
+        The lengths of integer column values are calculated by counting digits
+        rather than converting values to strings.
+
         :param target_len: int specifying length of a valid id, default=8
         :param dropna: bool indicating whether to include np.nan values in
             the output value_counts series, default=False
+        :param integral_floats: bool whether float values are measured as the
+            integer IDs they hold, i.e. 12345678.0 has a length of 8 and
+            non-integral floats and NaN are always reported, default=False
+            measures float values as written, i.e. 12345678.0 has a length
+            of 10
         :returns: pandas.Series of the IDs not matching the target_len
         """
-        value_counts = self.df.loc[
-            self.df[column].astype(str).str.len() != target_len
-        ][column].value_counts(dropna=dropna)
+        series = self.df[column]
+        if is_numeric_id_series(series, integral_floats):
+            lengths, _ = numeric_id_lengths(series)
+        else:
+            lengths = np.fromiter(
+                (
+                    len(val) if isinstance(val, str) else len(str(val))
+                    for val in series.to_numpy()
+                ),
+                dtype=np.int64,
+                count=len(series),
+            )
+        value_counts = series[lengths != target_len].value_counts(
+            dropna=dropna
+        )
         return value_counts
 
     def remove_offlenIDs(self, column, target_len=8, pattern='[0-9]',
                          val_new=np.nan, val_exception=np.nan,
                          inplace=True, return_series=False,
-                         target_column=None):
+                         target_column=None, integral_floats=False):
         """
         removes all IDs not matching the desired character length and replaces
         them with a chosen replacement value
 
+        Valid IDs are returned as strings. When pattern is a digit class, the
+        lengths of integer column values are calculated by counting digits
+        rather than matching the pattern against each value.
+
         :param target_len: int specifying length of a valid id, default=8
         :param pattern: str Regex pattern specifying which types of characters
             to substiture with val_sub str, default='[0-9]'
@@ -166,16 +289,32 @@ class ValidIDsMixin(object):
             default=True
         :param return_series: bool whether to return modified pandas.Series
             object, default=False
+        :param integral_floats: bool whether float values holding integers
+            are measured and returned as integer IDs, i.e. 12345678.0 is
+            returned as '12345678', default=False matches float values as
+            written, so that 12345678.0 is replaced as off-length
         :return: pandas.Series of column values after replacing offlenIDs
         """
-        series = self.df[column].copy().astype(str).apply(
-            lambda x: regex_replace_value(
-                val=x,
-                val_new=val_new,
-                pattern=''.join([pattern, '{{{0}}}$']).format(target_len),
-                val_exception=val_exception,
-            )
-        )
+        series = self.df[column]
+        if (
+            is_numeric_id_series(series, integral_floats)
+            and pattern in DIGIT_CLASSES
+        ):
+            lengths, values = numeric_id_lengths(series)
+            valid = (lengths == target_len) & (values >= 0)
+            result = np.full(len(series), val_new, dtype=object)
+            result[valid] = values[valid].astype(str).astype(object)
+            series = pd.Series(result, index=series.index, name=series.name)
+        else:
+            series = apply_unique(
+                series,
+                lambda values: regex_replace_array(
+                    values=values.astype(str),
+                    val_new=val_new,
+                    pattern=''.join([pattern, '{{{0}}}$']).format(target_len),
+                    val_exception=val_exception,
+                ),
+            ).infer_objects()
         return inplace_return_series(self.df, column, series,
                                      inplace, return_series, target_column)
 
@@ -186,16 +325,36 @@ class ValidIDsMixin(object):
         replaces all blank ID values with the corresponding values from
         a different value in the same dataframe
 
-        :param replace_col: str name of column with replacement values
+        When replace_col is a list of columns, blank values are coalesced from
+        each column in order, i.e. values still blank after being replaced
+        from the first column are replaced from the second column. The number
+        of values filled from each column is saved to self.fillcounts[column]
+        as a pandas.Series indexed by replace_col.
+
+        :param replace_col: str name of column with replacement values, or
+            list of str names of columns in order of preference
         :param inplace: bool make changes to self.df inplace, default=True
         :param return_series: bool whether to return modified pandas.Series
             object, default=False
         """
-        series = self.df.copy().apply(
-            lambda row:
-            row[replace_col] if pd.isnull(row[column])
-            else row[column],
-            axis=1,
+        if not hasattr(self, 'fillcounts'):
+            self.fillcounts = dict()
+        replace_cols = replace_col if isinstance(replace_col, (list, tuple)) \
+            else [replace_col]
+        series = self.df[column]
+        blank = series.isnull().to_numpy()
+        fillcounts = []
+        for col in replace_cols:
+            fill = blank & self.df[col].notnull().to_numpy()
+            n_filled = int(fill.sum())
+            if n_filled:
+                series = fill_series(series, self.df[col], fill)
+                blank &= ~fill
+            fillcounts.append(n_filled)
+        self.fillcounts[column] = pd.Series(
+            fillcounts,
+            index=replace_cols,
+            dtype=np.int64,
         )
         return inplace_return_series(self.df, column, series,
                                      inplace, return_series, target_column)
@@ -0,0 +1,122 @@
+"""
+This submodule contains functions and a basedata.ops mixin class for
+reducing the memory used by dataframe columns by converting them to smaller
+data types.
+
+The functionality of these mixin classes is aggregated in the basedata.ops
+BaseDataOps class.
+"""
+import numpy as np
+import pandas as pd
+
+
+def downcast_series(series, categorical_ratio=0.5):
+    """
+    Converts a series to the smallest data type able to hold its values
+    without loss
+
+    Integers are converted to the smallest signed integer type holding their
+    range, floats are converted to float32 only if every value is unchanged
+    by the conversion, and object columns containing only strings are
+    converted to categoricals when the ratio of unique values to rows is no
+    greater than categorical_ratio. All other series are returned unchanged.
+
+    :param series: pandas.Series to convert
+    :param categorical_ratio: float maximum ratio of unique values to rows
+        for which string columns are converted to categoricals, default=0.5
+    :return: pandas.Series
+    """
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return series
+    elif pd.api.types.is_integer_dtype(dtype):
+        return pd.to_numeric(series, downcast='integer')
+    elif pd.api.types.is_float_dtype(dtype):
+        downcast = series.astype(np.float32)
+        lossless = (downcast == series) | series.isnull()
+        return downcast if lossless.all() else series
+    elif pd.api.types.is_object_dtype(dtype) and len(series):
+        if pd.api.types.infer_dtype(series, skipna=True) != 'string':
+            return series
+        if series.nunique(dropna=False) / len(series) <= categorical_ratio:
+            return series.astype('category')
+    return series
+
+
+def downcast_dataframe(dataframe, columns=None, categorical_ratio=0.5):
+    """
+    Converts dataframe columns to the smallest data types able to hold their
+    values without loss, see downcast_series. The data of columns that are
+    not converted is shared with the input dataframe.
+
+    :param dataframe: pandas.DataFrame whose columns are converted
+    :param columns: list of str column names to convert, default=None
+        converts all columns
+    :param categorical_ratio: float maximum ratio of unique values to rows
+        for which string columns are converted to categoricals, default=0.5
+    :return: tuple of the converted pandas.DataFrame and a pandas.DataFrame
+        reporting the dtype and memory usage in bytes of each column before
+        and after conversion
+    """
+    if columns is None:
+        columns = list(dataframe.columns)
+    records = []
+    converted = dict()
+    for i, column in enumerate(dataframe.columns):
+        series = dataframe.iloc[:, i]
+        if column not in columns:
+            converted[i] = series
+            continue
+        new_series = downcast_series(series, categorical_ratio)
+        converted[i] = new_series
+        records.append({
+            'column': column,
+            'dtype_before': str(series.dtype),
+            'dtype_after': str(new_series.dtype),
+            'bytes_before': series.memory_usage(index=False, deep=True),
+            'bytes_after': new_series.memory_usage(index=False, deep=True),
+        })
+    # unconverted columns are shared with, not copied from, the input df
+    new_dataframe = pd.DataFrame(converted, index=dataframe.index, copy=False)
+    new_dataframe.columns = dataframe.columns
+    report = pd.DataFrame.from_records(
+        records,
+        columns=[
+            'column',
+            'dtype_before',
+            'dtype_after',
+            'bytes_before',
+            'bytes_after',
+        ],
+    ).set_index('column')
+    return new_dataframe, report
+
+
+class MemoryMixin(object):
+    """
+    Mixin class methods for reducing the memory used by self.df
+    """
+
+    def optimize_memory(self, columns=None, categorical_ratio=0.5):
+        """
+        Converts self.df columns to the smallest data types able to hold their
+        values without loss. Integers are downcast, floats are converted to
+        float32 when no precision is lost, and repetitive string columns are
+        converted to categoricals.
+
+        The resulting report is saved to self.memory_report.
+
+        :param columns: list of str column names to convert, default=None
+            converts all columns
+        :param categorical_ratio: float maximum ratio of unique values to rows
+            for which string columns are converted to categoricals,
+            default=0.5
+        :return: pandas.DataFrame reporting the dtype and memory usage in
+            bytes of each column before and after conversion
+        """
+        self.df, self.memory_report = downcast_dataframe(
+            self.df,
+            columns,
+            categorical_ratio,
+        )
+        return self.memory_report
@@ -0,0 +1,132 @@
+"""
+This submodule contains functions for converting dirty numeric strings, i.e.
+'$12,400', '15,987.00', '12.5%', or '(1,234)', to numbers in a single pass
+over each distinct value.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+from .base import compile_pattern
+from .unique import apply_unique, is_categorical
+
+
+CURRENCY_SYMBOLS = '$€£¥'
+
+
+def number_pattern(thousands=',', decimal='.', currency=CURRENCY_SYMBOLS):
+    """
+    Generates a compiled regex pattern matching a number written with
+    optional thousands separators, currency symbol, sign, percent sign, and
+    accounting parentheses, i.e. '($1,234.50)'. Thousands separators must
+    separate groups of three digits.
+
+    :param thousands: str thousands separator, default=','
+    :param decimal: str decimal separator, default='.'
+    :param currency: str of currency symbols, default='$€£¥'
+    :return: re.Pattern compiled pattern with groups 'open', 'sign',
+        'number', 'percent', and 'close'
+    """
+    integer = '[0-9]{{1,3}}(?:{0}[0-9]{{3}})+|[0-9]+'.format(
+        re.escape(thousands)
+    ) if thousands else '[0-9]+'
+    currency = '[{0}]?'.format(
+        ''.join(re.escape(char) for char in currency)
+    ) if currency else ''
+    return compile_pattern(
+        r'\s*(?P<open>\()?\s*(?P<sign>[-+])?\s*{currency}\s*(?P<sign2>[-+])?'
+        r'(?P<number>(?:{integer})(?:{decimal}[0-9]*)?|{decimal}[0-9]+)'
+        r'\s*(?P<percent>%)?\s*(?P<close>\))?\s*'.format(
+            currency=currency,
+            integer=integer,
+            decimal=re.escape(decimal),
+        )
+    )
+
+
+def parse_number(val, pattern, thousands=',', decimal='.'):
+    """
+    Converts a dirty numeric string to a float
+
+    Thousands separators and currency symbols are removed, values ending
+    with a percent sign are divided by 100, and values in parentheses are
+    negative. Values with more than one sign, or with a sign inside
+    parentheses, i.e. '(-5)', are not numbers.
+
+    :param val: str value to convert
+    :param pattern: re.Pattern as returned by number_pattern
+    :param thousands: str thousands separator, default=','
+    :param decimal: str decimal separator, default='.'
+    :return: float value, or numpy.nan if val is not a number
+    """
+    match = pattern.fullmatch(val)
+    if match is None or bool(match.group('open')) != bool(
+            match.group('close')):
+        return np.nan
+    n_signs = bool(match.group('sign')) + bool(match.group('sign2'))
+    if n_signs > 1 or (n_signs and match.group('open')):
+        return np.nan
+    number = match.group('number')
+    if thousands:
+        number = number.replace(thousands, '')
+    if decimal != '.':
+        number = number.replace(decimal, '.')
+    number = float(number)
+    if match.group('sign') == '-' or match.group('sign2') == '-' \
+            or match.group('open'):
+        number = -number
+    if match.group('percent'):
+        number = number / 100
+    return number
+
+
+def parse_numbers(series, thousands=',', decimal='.',
+                  currency=CURRENCY_SYMBOLS):
+    """
+    Converts a series of dirty numeric strings to floats, see parse_number.
+    Numeric series are returned unchanged and categorical series are
+    converted once per category.
+
+    Values that are already plain numbers are converted directly, so when
+    decimal is '.', strings such as '1e5', 'inf', and 'nan' are converted as
+    they are by pandas.to_numeric. Strings with underscores, i.e. '1_000',
+    are not numbers, as they are not to pandas.to_numeric.
+
+    :param series: pandas.Series to convert
+    :param thousands: str thousands separator, default=','
+    :param decimal: str decimal separator, default='.'
+    :param currency: str of currency symbols, default='$€£¥'
+    :return: pandas.Series of numeric values, numpy.nan where values could
+        not be converted
+    """
+    if pd.api.types.is_numeric_dtype(series) \
+            and not pd.api.types.is_bool_dtype(series):
+        return series
+    pattern = number_pattern(thousands, decimal, currency)
+    plain = decimal == '.' and thousands != '.'
+
+    def convert(val):
+        if isinstance(val, (int, float, np.number)) \
+                and not isinstance(val, (bool, np.bool_)):
+            return float(val)
+        if not isinstance(val, str):
+            return np.nan
+        if plain and '_' not in val:
+            try:
+                return float(val)
+            except ValueError:
+                pass
+        return parse_number(val, pattern, thousands, decimal)
+
+    result = apply_unique(
+        series,
+        lambda values: np.fromiter(
+            (convert(val) for val in values),
+            dtype=np.float64,
+            count=len(values),
+        ),
+    )
+    if is_categorical(result):
+        result = result.astype(np.float64)
+    return result
@@ -0,0 +1,373 @@
+"""
+This submodule contains the OperationPlan and LazyDataOps classes, which
+record basedata.ops method calls as a plan that is optimized and executed
+only when the plan is collected.
+
+Before a plan is executed, steps whose results are overwritten before they
+are ever read are dropped, and consecutive transformations of the same column
+are grouped and run one after another against a frame holding only that
+column, so that the column is read from and written to self.df only once.
+Each step of a group still makes its own pass over the column's values.
+"""
+import inspect
+from collections import namedtuple
+
+import pandas as pd
+
+
+# methods without an inplace parameter that transform self.df
+TRANSFORM_OPERATIONS = ('add_column', 'drop_blankID_rows', 'drop_dupes')
+
+# methods that remove rows from, or rename the columns of, self.df and
+# therefore must see the result of every step recorded before them
+BARRIER_OPERATIONS = ('drop_blankID_rows', 'drop_dupes', 'map_column_names')
+
+# methods that compute a new version of a column solely from that column's
+# values and can be grouped with other steps on the same column
+COLUMN_OPERATIONS = (
+    'substitute_chars',
+    'to_numeric',
+    'parse_numeric',
+    'to_datetime',
+    'map_values',
+    'strip_nonnumeric',
+    'remove_offlenIDs',
+)
+
+# arguments requesting values that steps recorded in an OperationPlan cannot
+# return
+RETURN_ARGUMENTS = ('return_series', 'return_failures', 'return_unmatched')
+
+
+PlanStep = namedtuple(
+    'PlanStep',
+    ['name', 'arguments', 'reads', 'writes', 'barrier'],
+)
+
+
+def is_plan_operation(ops_class, name):
+    """
+    Determines whether a class method transforms self.df and can therefore be
+    recorded as a step in an OperationPlan
+
+    :param ops_class: class object whose methods will be recorded
+    :param name: str name of the method to evaluate
+    :return: bool whether the method can be recorded
+    """
+    if name.startswith('_'):
+        return False
+    method = getattr(ops_class, name, None)
+    if not callable(method):
+        return False
+    if name in TRANSFORM_OPERATIONS:
+        return True
+    return 'inplace' in inspect.signature(method).parameters
+
+
+def as_columns(column):
+    """
+    Generates a list of the column names named by a column argument
+
+    :param column: str name of a column, or list or tuple of str names
+    :return: list of str names
+    """
+    return list(column) if isinstance(column, (list, tuple)) else [column]
+
+
+def describe_call(ops_class, name, args, kwargs):
+    """
+    Generates a PlanStep describing which columns of self.df a method call
+    reads and writes
+
+    :param ops_class: class object on which the method is defined
+    :param name: str name of the method called
+    :param args: tuple positional arguments of the method call
+    :param kwargs: dict keyword arguments of the method call
+    :return: PlanStep namedtuple
+    """
+    signature = inspect.signature(getattr(ops_class, name))
+    bound = signature.bind(None, *args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    arguments.pop('self')
+    for param in signature.parameters.values():
+        if param.kind == param.VAR_KEYWORD:
+            arguments.update(arguments.pop(param.name))
+
+    reads = set()
+    if 'column' in arguments:
+        reads.update(as_columns(arguments['column']))
+    if 'column_list' in arguments:
+        reads.update(as_columns(arguments['column_list']))
+    if 'replace_col' in arguments:
+        reads.update(as_columns(arguments['replace_col']))
+
+    if name == 'add_column':
+        reads, writes = set(), {arguments['column']}
+    elif not arguments.get('inplace', name in TRANSFORM_OPERATIONS):
+        writes = set()
+    elif arguments.get('target_column'):
+        writes = set(as_columns(arguments['target_column']))
+    else:
+        writes = set(as_columns(arguments['column'])) \
+            if 'column' in arguments else set()
+    return PlanStep(
+        name,
+        arguments,
+        frozenset(reads),
+        frozenset(writes),
+        name in BARRIER_OPERATIONS,
+    )
+
+
+def is_column_step(step):
+    """
+    Determines whether a PlanStep can be grouped with other steps on its
+    column
+
+    :param step: PlanStep namedtuple
+    :return: bool
+    """
+    return (
+        step.name in COLUMN_OPERATIONS
+        and len(step.reads) == 1
+        and step.reads == step.writes
+    )
+
+
+def _is_overwritten(step, later_steps):
+    """
+    Determines whether every column written by a step is overwritten by a
+    later step before any later step reads it
+    """
+    for column in step.writes:
+        overwritten = False
+        for later in later_steps:
+            if later.barrier or column in later.reads:
+                break
+            if column in later.writes:
+                overwritten = True
+                break
+        if not overwritten:
+            return False
+    return True
+
+
+def eliminate_dead_steps(steps):
+    """
+    Removes steps that do not change self.df and steps whose results are
+    overwritten before they are read
+
+    :param steps: list of PlanStep namedtuples
+    :return: list of PlanStep namedtuples
+    """
+    live_steps = []
+    for i, step in enumerate(steps):
+        if step.barrier:
+            live_steps.append(step)
+        elif step.writes and not _is_overwritten(step, steps[i + 1:]):
+            live_steps.append(step)
+    return live_steps
+
+
+def fuse_column_steps(steps):
+    """
+    Groups consecutive column steps on the same column into lists of steps
+    that are executed against a frame holding only that column
+
+    A step joins an earlier group on its column so long as no step in between
+    reads or writes that column. Every other step is returned as a list
+    containing only itself.
+
+    :param steps: list of PlanStep namedtuples
+    :return: list of lists of PlanStep namedtuples
+    """
+    groups = []
+    open_groups = dict()
+    for step in steps:
+        if is_column_step(step):
+            column, = step.reads
+            if column in open_groups:
+                open_groups[column].append(step)
+                continue
+            group = [step]
+            open_groups[column] = group
+            groups.append(group)
+            continue
+        if step.barrier:
+            open_groups.clear()
+        for column in step.reads | step.writes:
+            open_groups.pop(column, None)
+        groups.append([step])
+    return groups
+
+
+class OperationPlan(object):
+    """
+    OperationPlan records basedata.ops method calls as PlanStep namedtuples
+    and executes an optimized version of those steps against a BaseDataOps
+    instance
+    """
+
+    def __init__(self, ops_class):
+        self.ops_class = ops_class
+        self.steps = []
+
+    def add(self, name, args, kwargs):
+        """
+        Records a method call as a step in the plan
+
+        :param name: str name of the method called
+        :param args: tuple positional arguments of the method call
+        :param kwargs: dict keyword arguments of the method call
+        """
+        step = describe_call(self.ops_class, name, args, kwargs)
+        if any(step.arguments.get(arg) for arg in RETURN_ARGUMENTS):
+            raise ValueError(
+                'Steps recorded in an OperationPlan cannot return a series.'
+            )
+        self.steps.append(step)
+
+    def optimize(self):
+        """
+        Generates the optimized plan
+
+        :return: list of lists of PlanStep namedtuples, each inner list of
+            several steps is executed against a single column frame
+        """
+        return fuse_column_steps(eliminate_dead_steps(self.steps))
+
+    def explain(self):
+        """
+        Generates a plain text description of the optimized plan
+
+        :return: str description of the optimized plan
+        """
+        lines = [
+            'OperationPlan: {0} recorded steps'.format(len(self.steps))
+        ]
+        groups = self.optimize()
+        for i, group in enumerate(groups):
+            if len(group) > 1:
+                column, = group[0].reads
+                lines.append(
+                    "{0}. steps on column '{1}', run against a single column "
+                    "frame:".format(i + 1, column)
+                )
+                lines.extend(
+                    '      - {0}'.format(format_step(step))
+                    for step in group
+                )
+            else:
+                lines.append('{0}. {1}'.format(i + 1, format_step(group[0])))
+        n_dropped = len(self.steps) - sum(len(group) for group in groups)
+        lines.append('{0} steps dropped as unused'.format(n_dropped))
+        return '\n'.join(lines)
+
+    def execute(self, ops):
+        """
+        Executes the optimized plan against a BaseDataOps instance
+
+        :param ops: BaseDataOps instance whose self.df is transformed
+        """
+        for group in self.optimize():
+            if len(group) > 1:
+                self._execute_fused(ops, group)
+            else:
+                step, = group
+                getattr(ops, step.name)(**step.arguments)
+
+    def _execute_fused(self, ops, group):
+        """
+        Executes a group of column steps one after another against a single
+        column frame, so that the column is read from and written to ops.df
+        only once, the date format reports of to_datetime steps are saved to
+        ops.dateformats
+        """
+        column, = group[0].reads
+        fused_step = PlanStep(
+            ' + '.join(step.name for step in group),
+            {'column': column},
+            group[0].reads,
+            group[0].writes,
+            False,
+        )
+
+        def run():
+            column_ops = self.ops_class(
+                pd.DataFrame({column: ops.df[column]}, copy=False),
+                False,
+            )
+            for step in group:
+                getattr(column_ops, step.name)(**step.arguments)
+            ops.df[column] = column_ops.df[column]
+            if hasattr(column_ops, 'dateformats'):
+                if not hasattr(ops, 'dateformats'):
+                    ops.dateformats = dict()
+                ops.dateformats.update(column_ops.dateformats)
+
+        ops._apply_operation(fused_step, run)
+
+
+def format_step(step):
+    """
+    Generates a plain text description of a PlanStep
+
+    :param step: PlanStep namedtuple
+    :return: str description of the step
+    """
+    return '{0}({1})'.format(
+        step.name,
+        ', '.join(
+            '{0}={1!r}'.format(key, value)
+            for key, value in step.arguments.items()
+        ),
+    )
+
+
+class LazyDataOps(object):
+    """
+    LazyDataOps records method calls made against a BaseDataOps instance and
+    applies an optimized version of those calls only when collect is called
+
+    Recorded methods are called on the LazyDataOps object exactly as they
+    would be called on the BaseDataOps instance, e.g.::
+
+        lazy = BaseDataOps.from_file('data.csv').lazy()
+        lazy.substitute_chars('id', '[-]', '')
+        lazy.strip_nonnumeric('id')
+        lazy.explain()
+        Base = lazy.collect()
+    """
+
+    def __init__(self, ops):
+        self.ops = ops
+        self.plan = OperationPlan(type(ops))
+
+    def __getattr__(self, name):
+        if not is_plan_operation(type(self.ops), name):
+            raise AttributeError(
+                "'{0}' cannot be recorded by LazyDataOps".format(name)
+            )
+
+        def record(*args, **kwargs):
+            self.plan.add(name, args, kwargs)
+            return self
+
+        return record
+
+    def explain(self):
+        """
+        Prints a plain text description of the optimized plan
+        """
+        print(self.plan.explain())
+
+    def collect(self):
+        """
+        Executes the optimized plan and clears all recorded steps
+
+        :return: BaseDataOps instance with all recorded steps applied
+        """
+        self.plan.execute(self.ops)
+        self.plan.steps = []
+        return self.ops
@@ -0,0 +1,163 @@
+"""
+This submodule contains functions and a basedata.ops mixin class for
+profiling the data quality of every dataframe column in a single pass.
+
+Each column is factorized once, the checks made by check_nonnumeric,
+check_datetime, report_offlenIDs, report_values, and report_dupes are made
+once per distinct value, and their results are weighted by the number of
+rows holding each value. Columns are factorized by factorize_values, so that
+values of different types that compare equal, i.e. 1, 1.0, and True, are
+checked separately, as they are by the per-method reports.
+
+The functionality of these mixin classes is aggregated in the basedata.ops
+BaseDataOps class.
+"""
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from .base import convert_columns
+from .cols import is_datetime_column, is_numeric_column
+from .dates import parse_datetimes
+from .ids import is_numeric_id_series, numeric_id_lengths
+from .unique import factorize_values
+
+
+def value_lengths(values):
+    """
+    Calculates the number of characters of each value as measured by
+    report_offlenIDs
+
+    :param values: pandas.Series of values
+    :return: numpy.ndarray of int lengths
+    """
+    if is_numeric_id_series(values):
+        lengths, _ = numeric_id_lengths(values)
+        return lengths
+    return np.fromiter(
+        (
+            len(val) if isinstance(val, str) else len(str(val))
+            for val in values.to_numpy()
+        ),
+        dtype=np.int64,
+        count=len(values),
+    )
+
+
+def profile_series(series, infer_dates=False):
+    """
+    Profiles the values of a series in a single pass over its rows
+
+    :param series: pandas.Series to profile
+    :param infer_dates: bool whether strings matching none of the date
+        formats detected in the series are parsed by pandas.to_datetime, as
+        they are by check_datetime, default=False reports them as values
+        that cannot be converted to datetimes
+    :return: dict with the series' dtype, the number of rows and of null
+        values, the shares of non-null values that cannot be converted to
+        numeric or datetime data types, the number of distinct non-null
+        values, the number of values occurring more than once and of the
+        rows holding them, and the minimum, maximum, and {length: rows}
+        histogram of non-null value lengths
+    """
+    codes, values = factorize_values(series)
+    counts = np.bincount(codes[codes >= 0], minlength=len(values))
+    n_values = int(counts.sum())
+
+    if is_numeric_column(series):
+        nonnumeric = np.zeros(len(values), dtype=bool)
+    else:
+        nonnumeric = pd.to_numeric(
+            values.astype(str), errors='coerce',
+        ).isnull().to_numpy()
+    if is_datetime_column(series):
+        nondatetime = np.zeros(len(values), dtype=bool)
+    else:
+        strings = values.astype(str)
+        parsed = parse_datetimes(strings, infer=infer_dates)
+        converted = pd.to_datetime(strings, errors='coerce') \
+            if parsed is None else parsed[0]
+        nondatetime = converted.isnull().to_numpy()
+
+    lengths = value_lengths(values)
+    histogram = pd.Series(counts).groupby(lengths).sum()
+    duplicates = counts > 1
+    return {
+        'dtype': str(series.dtype),
+        'rows': len(series),
+        'nulls': len(series) - n_values,
+        'nonnumeric_share':
+            counts[nonnumeric].sum() / n_values if n_values else np.nan,
+        'nondatetime_share':
+            counts[nondatetime].sum() / n_values if n_values else np.nan,
+        'cardinality': len(values),
+        'duplicate_keys': int(duplicates.sum()),
+        'duplicate_rows': int(counts[duplicates].sum()),
+        'min_length': histogram.index.min() if n_values else np.nan,
+        'max_length': histogram.index.max() if n_values else np.nan,
+        'lengths': {
+            int(length): int(rows) for length, rows in histogram.items()
+        },
+    }
+
+
+def profile_dataframe(dataframe, columns=None, infer_dates=False, jobs=1,
+                      processes=False):
+    """
+    Profiles dataframe columns, see profile_series, in parallel when
+    jobs > 1
+
+    :param dataframe: pandas.DataFrame whose columns are profiled
+    :param columns: list of str column names to profile, default=None
+        profiles all columns
+    :param infer_dates: bool whether to parse strings matching no detected
+        date format with pandas.to_datetime, default=False
+    :param jobs: int number of columns profiled in parallel, default=1
+    :param processes: bool whether to profile columns in worker processes
+        rather than threads, default=False
+    :return: pandas.DataFrame with one row per column
+    """
+    columns = list(dataframe.columns) if columns is None else list(columns)
+    profiles = convert_columns(
+        dataframe,
+        columns,
+        partial(profile_series, infer_dates=infer_dates),
+        jobs,
+        processes,
+    )
+    return pd.DataFrame(profiles, index=pd.Index(columns, name='column'))
+
+
+class ProfileMixin(object):
+    """
+    Mixin class methods for profiling the data quality of self.df columns
+    """
+
+    def profile(self, columns=None, infer_dates=False, jobs=1,
+                processes=False):
+        """
+        Reports the null count, non-numeric and non-datetime shares, value
+        length histogram, cardinality, and duplicate keys of every column in
+        a single pass over each column, see profile_series
+
+        The resulting report is saved to self.profile_report.
+
+        :param columns: list of str column names to profile, default=None
+            profiles all columns
+        :param infer_dates: bool whether to parse strings matching no
+            detected date format with pandas.to_datetime, as check_datetime
+            does, default=False
+        :param jobs: int number of columns profiled in parallel, default=1
+        :param processes: bool whether to profile columns in worker processes
+            rather than threads, default=False
+        :return: pandas.DataFrame with one row per column
+        """
+        self.profile_report = profile_dataframe(
+            self.df,
+            columns,
+            infer_dates,
+            jobs,
+            processes,
+        )
+        return self.profile_report
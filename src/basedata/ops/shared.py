@@ -0,0 +1,369 @@
+"""
+This submodule contains functions and a basedata.ops mixin class for running
+basedata.ops methods on separate columns, or row ranges, of self.df in
+parallel worker processes without pickling column data.
+
+Before the workers start, each column they read is copied once into
+multiprocessing.shared_memory blocks:
+
+- columns of numeric, boolean, and datetime numpy data types are stored as
+  their raw values, which the workers read without copying them
+- object columns holding only strings and missing values are stored as
+  their UTF-8 encoded bytes and the offsets of each value, so that a worker
+  decodes only the strings of its own row range
+- all other columns, i.e. categoricals and columns of mixed types, are
+  pickled to the workers
+
+Workers write their results to new shared memory blocks in the same way, and
+the results are copied once from those blocks into the new self.df columns.
+Every shared memory block is unlinked as soon as it has been read.
+
+multiprocessing.shared_memory was added in Python 3.8 and is imported only
+when columns are shared, so that basedata.ops may still be imported by
+earlier Python versions.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import inspect
+
+import numpy as np
+import pandas as pd
+
+from .base import assign_columns, is_column_list
+from .plan import BARRIER_OPERATIONS, describe_call, is_plan_operation
+
+
+# numpy dtype kinds stored in shared memory as raw values
+SHARED_KINDS = 'biufcmM'
+
+ARRAY, STRINGS, PICKLED = 'array', 'strings', 'pickled'
+
+
+def import_shared_memory():
+    """
+    Imports the multiprocessing modules used to share columns
+
+    :return: tuple of the multiprocessing.resource_tracker and
+        multiprocessing.shared_memory modules
+    """
+    try:
+        from multiprocessing import resource_tracker, shared_memory
+    except ImportError:
+        raise ImportError(
+            'run_shared requires multiprocessing.shared_memory, which was '
+            'added in Python 3.8'
+        )
+    return resource_tracker, shared_memory
+
+
+def _create_block(values):
+    """
+    Copies a numpy array into a new shared memory block
+
+    :param values: numpy.ndarray
+    :return: str name of the shared memory block
+    """
+    _, shared_memory = import_shared_memory()
+    block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    np.ndarray(values.shape, values.dtype, buffer=block.buf)[:] = values
+    block.close()
+    return block.name
+
+
+def _block_array(block, dtype, length):
+    """Views the values of an attached shared memory block as an array"""
+    return np.ndarray((length,), np.dtype(dtype), buffer=block.buf)
+
+
+def is_string_array(values):
+    """
+    Determines whether an object array holds only strings and missing values
+
+    :param values: numpy.ndarray of object values
+    :return: bool
+    """
+    return pd.api.types.infer_dtype(values, skipna=True) in ('string', 'empty')
+
+
+def share_series(series):
+    """
+    Copies the values of a series into shared memory blocks
+
+    :param series: pandas.Series
+    :return: dict describing the shared values, which is small enough to be
+        pickled to worker processes and is read by SharedSeries
+    """
+    descriptor = {'name': series.name, 'length': len(series)}
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in SHARED_KINDS:
+        descriptor.update(
+            kind=ARRAY,
+            dtype=dtype.str,
+            blocks=[_create_block(series.to_numpy())],
+        )
+    elif dtype == object and is_string_array(series.to_numpy()):
+        values = series.to_numpy()
+        present = pd.notnull(values)
+        encoded = [val.encode('utf-8') for val in values[present]]
+        lengths = np.zeros(len(values), dtype=np.int64)
+        lengths[present] = [len(val) for val in encoded]
+        offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        descriptor.update(
+            kind=STRINGS,
+            blocks=[
+                _create_block(np.frombuffer(b''.join(encoded), np.uint8)),
+                _create_block(offsets),
+                _create_block(present),
+            ],
+        )
+    else:
+        descriptor.update(kind=PICKLED, series=series)
+    return descriptor
+
+
+class SharedSeries(object):
+    """
+    SharedSeries attaches to the shared memory blocks described by
+    share_series and reads the values of a range of rows
+
+    :param descriptor: dict as returned by share_series
+    """
+
+    def __init__(self, descriptor):
+        self.descriptor = descriptor
+        _, shared_memory = import_shared_memory()
+        self.blocks = [
+            shared_memory.SharedMemory(name=name)
+            for name in descriptor.get('blocks', [])
+        ]
+
+    def values(self, start=0, stop=None):
+        """
+        Reads the values of rows start to stop, the values of numeric columns
+        are views of the shared memory and are not copied
+
+        :param start: int position of the first row, default=0
+        :param stop: int position after the last row, default=None reads to
+            the last row
+        :return: numpy.ndarray or, for pickled series, pandas array of values
+        """
+        descriptor = self.descriptor
+        length = descriptor['length']
+        stop = length if stop is None else stop
+        if descriptor['kind'] == ARRAY:
+            return _block_array(
+                self.blocks[0], descriptor['dtype'], length,
+            )[start:stop]
+        if descriptor['kind'] == STRINGS:
+            data = self.blocks[0].buf
+            offsets = _block_array(self.blocks[1], np.int64, length + 1)
+            present = _block_array(self.blocks[2], np.bool_, length)
+            values = np.full(stop - start, np.nan, dtype=object)
+            for i in np.flatnonzero(present[start:stop]):
+                values[i] = str(
+                    data[offsets[start + i]:offsets[start + i + 1]],
+                    'utf-8',
+                )
+            return values
+        return descriptor['series'].array[start:stop]
+
+    def close(self):
+        """
+        Closes this process' handles to the shared memory blocks
+        """
+        for block in self.blocks:
+            block.close()
+
+    def unlink(self):
+        """
+        Closes and frees the shared memory blocks, called once their values
+        are no longer read by any process
+        """
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+
+
+def is_shared_operation(ops_class, name):
+    """
+    Determines whether a class method can be run by run_shared, i.e. whether
+    it converts a single column of self.df inplace without removing rows
+
+    :param ops_class: class object on which the method is defined
+    :param name: str name of the method to evaluate
+    :return: bool
+    """
+    if name in BARRIER_OPERATIONS or not is_plan_operation(ops_class, name):
+        return False
+    parameters = inspect.signature(getattr(ops_class, name)).parameters
+    return all(
+        param in parameters for param in ('column', 'inplace', 'return_series')
+    )
+
+
+def _run_operation(ops_class, descriptors, start, stop, name, column,
+                   kwargs):
+    """
+    Runs a basedata.ops method on rows start to stop of the shared columns,
+    called in worker processes by SharedMemoryMixin.run_shared
+
+    :return: dict as returned by share_series describing the result column
+    """
+    shared = [SharedSeries(descriptor) for descriptor in descriptors]
+    frame = pd.DataFrame(
+        {
+            descriptor['name']: series.values(start, stop)
+            for descriptor, series in zip(descriptors, shared)
+        },
+        index=pd.RangeIndex(start, stop),
+        copy=False,
+    )
+    ops = ops_class(frame, False)
+    getattr(ops, name)(column, **kwargs)
+    target, = describe_call(ops_class, name, (column,), kwargs).writes
+    result = share_series(ops.df[target])
+    # views of the shared memory must be released before it is closed
+    del frame, ops
+    for series in shared:
+        series.close()
+    return result
+
+
+def _row_ranges(length, n_ranges):
+    """Splits length rows into at most n_ranges contiguous (start, stop)"""
+    bounds = np.linspace(0, length, max(n_ranges, 1) + 1).astype(int)
+    return [
+        (int(start), int(stop))
+        for start, stop in zip(bounds[:-1], bounds[1:])
+        if stop > start
+    ] or [(0, length)]
+
+
+def _gather(descriptors, length, index, name):
+    """
+    Copies the result row ranges described by descriptors, in row order,
+    into a single series and frees their shared memory blocks
+    """
+    shared = [SharedSeries(descriptor) for descriptor in descriptors]
+    parts = [series.values() for series in shared]
+    kinds = {descriptor['kind'] for descriptor in descriptors}
+    dtypes = {descriptor.get('dtype') for descriptor in descriptors}
+    if kinds == {ARRAY} and len(dtypes) == 1:
+        values = np.empty(length, dtype=np.dtype(dtypes.pop()))
+        position = 0
+        for part in parts:
+            values[position:position + len(part)] = part
+            position += len(part)
+    elif kinds == {STRINGS}:
+        values = np.concatenate(parts)
+    else:
+        values = pd.concat(
+            [pd.Series(part) for part in parts], ignore_index=True,
+        ).array
+    del parts
+    for series in shared:
+        series.unlink()
+    return pd.Series(values, index=index, name=name)
+
+
+class SharedMemoryMixin(object):
+    """
+    Mixin class methods for running basedata.ops methods on the columns and
+    row ranges of self.df in parallel worker processes
+    """
+
+    def run_shared(self, name, column, jobs=2, split_rows=False, **kwargs):
+        """
+        Runs a basedata.ops method on each of a list of columns, and on
+        separate row ranges of each column when split_rows=True, in jobs
+        worker processes that read the columns from shared memory, see
+        basedata.ops.shared, and writes the results to self.df in a single
+        batch, e.g.::
+
+            Base.run_shared('strip_nonnumeric', ['id', 'alt_id'], jobs=8,
+                            split_rows=True)
+
+        Only methods converting a single column inplace, see
+        is_shared_operation, may be run. With split_rows=True each row range is
+        transformed separately, so methods must transform each row
+        independently, i.e. to_datetime detects date formats separately in
+        each row range. Reports that methods save to the instance are made
+        in the worker processes and are not saved, i.e. to_datetime does not
+        update self.dateformats.
+
+        :param name: str name of the method to run, i.e. 'to_numeric'
+        :param column: str name of column, or list of str names of columns,
+            passed to the method as its column argument
+        :param jobs: int number of worker processes, default=2
+        :param split_rows: bool whether to split each column into jobs row
+            ranges transformed in parallel, default=False transforms each
+            column in a single worker
+        :param kwargs: optional keyword args to the method, which is run with
+            inplace=True, a list of target_column names names the target of
+            each column
+        :return: None, self.df is updated inplace
+        """
+        resource_tracker, _ = import_shared_memory()
+        if not is_shared_operation(type(self), name):
+            raise ValueError(
+                "'{0}' cannot be run by run_shared".format(name)
+            )
+        columns = list(column) if is_column_list(column) else [column]
+        kwargs = dict(kwargs, inplace=True, return_series=False)
+        targets = kwargs.pop('target_column', None)
+        if not is_column_list(targets):
+            targets = [targets] * len(columns)
+        elif len(targets) != len(columns):
+            raise ValueError('target_column must name a column per column')
+        column_kwargs = [
+            dict(kwargs, target_column=target) if target else kwargs
+            for target in targets
+        ]
+        steps = [
+            describe_call(type(self), name, (col,), col_kwargs)
+            for col, col_kwargs in zip(columns, column_kwargs)
+        ]
+        reads = list(dict.fromkeys(
+            col for step in steps for col in self.df.columns
+            if col in step.reads
+        ))
+        ranges = _row_ranges(len(self.df), jobs) if split_rows \
+            else [(0, len(self.df))]
+
+        # worker processes register their result blocks with the parent's
+        # resource tracker, so the blocks outlive the workers
+        resource_tracker.ensure_running()
+        shared = []
+        try:
+            descriptors = []
+            for col in reads:
+                descriptors.append(share_series(self.df[col]))
+                shared.append(SharedSeries(descriptors[-1]))
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = [
+                    [
+                        executor.submit(
+                            _run_operation, type(self), descriptors,
+                            start, stop, name, col, col_kwargs,
+                        )
+                        for start, stop in ranges
+                    ]
+                    for col, col_kwargs in zip(columns, column_kwargs)
+                ]
+                results = [
+                    [future.result() for future in col_futures]
+                    for col_futures in futures
+                ]
+        finally:
+            for series in shared:
+                series.unlink()
+
+        targets = [next(iter(step.writes)) for step in steps]
+        series_list = [
+            _gather(descriptors, len(self.df), self.df.index, target)
+            for descriptors, target in zip(results, targets)
+        ]
+        if self.tracker is not None:
+            for step in steps:
+                self.tracker.before_operation(self.df, step)
+        assign_columns(self.df, targets, series_list)
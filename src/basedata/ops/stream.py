@@ -0,0 +1,173 @@
+"""
+This submodule contains the ChunkedPipeline class, which records a sequence of
+basedata.ops method calls as an OperationPlan and replays the optimized plan
+against a file that is read and written one chunk at a time.
+
+Pipelines are created with the BaseDataClass.stream_file class method so that
+peak memory stays at a few chunks regardless of the size of the input file.
+"""
+import os
+
+import pandas as pd
+
+from .counts import ExactCounter, count_chunks
+from .plan import OperationPlan, is_plan_operation
+from .writers import COMPRESSION_EXTENSIONS, format_block,\
+    infer_compression, is_block_compression
+
+
+def is_chunk_operation(ops_class, name):
+    """
+    Determines whether a class method can be replayed chunk by chunk
+
+    Only methods that transform self.df using the rows of a single chunk are
+    supported. Reporting methods and methods that depend on the index values
+    of the full dataframe (i.e. drop_dupes) are not.
+
+    :param ops_class: class object whose methods will be replayed
+    :param name: str name of the method to evaluate
+    :return: bool whether the method can be replayed chunk by chunk
+    """
+    if name == 'drop_dupes':
+        return False
+    return is_plan_operation(ops_class, name)
+
+
+class ChunkedPipeline(object):
+    """
+    ChunkedPipeline records basedata.ops method calls and replays them on each
+    chunk of an input .csv file, which may be compressed as .csv.gz,
+    .csv.bz2, or .csv.zst, appending each transformed chunk to the output
+    file
+
+    Recorded methods are called on the pipeline object exactly as they would
+    be called on a BaseDataOps instance, e.g.::
+
+        pipeline = BaseDataOps.stream_file('big.csv', chunksize=500000)
+        pipeline.strip_nonnumeric('id')
+        pipeline.remove_offlenIDs('id', target_len=8)
+        pipeline.to_file('big_clean.csv')
+
+    Column data types are inferred separately for each chunk, therefore the
+    dtype read_kwarg should be used to fix the data types of columns whose
+    inferred type may vary from one chunk to the next (i.e. ID columns that
+    contain blank values in only some chunks).
+    """
+
+    def __init__(self, ops_class, filename, chunksize=100000, **read_kwargs):
+        root, ext = os.path.splitext(filename)
+        if ext in COMPRESSION_EXTENSIONS and root.endswith('.csv'):
+            ext = '.csv'
+        if ext != '.csv':
+            raise TypeError('stream_file reads only .csv filetypes')
+        self.ops_class = ops_class
+        self.filename = filename
+        self.chunksize = chunksize
+        self.read_kwargs = read_kwargs
+        self.plan = OperationPlan(ops_class)
+
+    def __getattr__(self, name):
+        if not is_chunk_operation(self.ops_class, name):
+            raise AttributeError(
+                "'{0}' cannot be applied chunk by chunk by a "
+                "ChunkedPipeline".format(name)
+            )
+
+        def record(*args, **kwargs):
+            self.plan.add(name, args, kwargs)
+            return self
+
+        return record
+
+    def apply_steps(self, chunk):
+        """
+        Applies the optimized plan of recorded method calls to a single chunk
+
+        :param chunk: pandas.DataFrame chunk to transform
+        :return: pandas.DataFrame of the transformed chunk
+        """
+        ops = self.ops_class(chunk, False)
+        self.plan.execute(ops)
+        return ops.df
+
+    def explain(self):
+        """
+        Prints a plain text description of the optimized plan applied to
+        each chunk
+        """
+        print(self.plan.explain())
+
+    def iter_chunks(self):
+        """
+        Reads the input file one chunk at a time and yields each chunk after
+        the recorded method calls have been applied
+
+        :return: generator of pandas.DataFrame chunks
+        """
+        reader = pd.read_csv(
+            self.filename,
+            chunksize=self.chunksize,
+            **self.read_kwargs
+        )
+        with reader:
+            for chunk in reader:
+                yield self.apply_steps(chunk)
+
+    def count_values(self, column, counter=None, jobs=1):
+        """
+        Applies the recorded method calls to each chunk of the input file and
+        counts the values of a column chunk by chunk
+
+        :param column: str name of column to count
+        :param counter: basedata.ops.counts ExactCounter, SpaceSaving, or
+            HyperLogLog counter, default=None counts values exactly
+        :param jobs: int number of chunks counted in parallel worker
+            processes, whose partial counts are merged, default=1
+        :return: the updated counter, whose result method returns the counts
+        """
+        return count_chunks(
+            (chunk[column] for chunk in self.iter_chunks()),
+            counter if counter is not None else ExactCounter(),
+            jobs,
+        )
+
+    def to_file(self, target_filename, **to_csv_kwargs):
+        """
+        Applies the recorded method calls to each chunk of the input file and
+        writes each chunk to the target file in csv format as it is completed
+
+        The target file is compressed when its filename ends with .gz, .bz2,
+        or .zst, or when compression is specified. Each chunk is compressed
+        separately, see basedata.ops.writers, so only gzip, bz2, and zstd
+        compression can be written.
+
+        :param target_filename: str filename to which csv should be written
+        :param to_csv_kwargs: optional args to pandas.DataFrame.to_csv(), a
+            header is written before the first chunk only, encoding sets
+            the text encoding of the target file, default='utf-8', and
+            compression is 'gzip', 'bz2', 'zstd', None, or 'infer',
+            default='infer'
+        :return: int number of rows written to the target file
+        """
+        header = to_csv_kwargs.pop('header', True)
+        encoding = to_csv_kwargs.pop('encoding', None) or 'utf-8'
+        compression = to_csv_kwargs.pop('compression', 'infer')
+        if not is_block_compression(target_filename, compression):
+            raise ValueError(
+                "ChunkedPipeline.to_file writes only 'gzip', 'bz2', or "
+                "'zstd' compressed, or uncompressed, csv files"
+            )
+        if compression == 'infer':
+            compression = infer_compression(target_filename)
+        n_rows = 0
+        with open(target_filename, 'wb') as target:
+            for i, chunk in enumerate(self.iter_chunks()):
+                target.write(format_block(
+                    chunk,
+                    header if i == 0 else False,
+                    compression=compression,
+                    encoding=encoding,
+                    **to_csv_kwargs
+                ))
+                n_rows += len(chunk)
+        return n_rows
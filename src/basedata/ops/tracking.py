@@ -0,0 +1,180 @@
+"""
+This submodule contains the ChangeTracker class, which records the changes
+made to self.df by basedata.ops methods so that the input dataframe can be
+rebuilt on request without keeping a full copy of it.
+
+The tracker keeps the original values of only those columns that a method
+overwrites, the rows removed by drop_dupes and drop_blankID_rows, and the
+renames made by map_column_names. Changes made to self.df directly, rather
+than through basedata.ops methods, are not tracked.
+"""
+import numpy as np
+import pandas as pd
+
+
+class ChangeTracker(object):
+    """
+    ChangeTracker records the changes made to a dataframe by basedata.ops
+    methods and rebuilds the original dataframe from its current version
+
+    :param input_df: pandas.DataFrame whose changes are tracked
+    """
+
+    def __init__(self, input_df):
+        self.columns = input_df.columns
+        self.dtypes = input_df.dtypes
+        self.index = input_df.index
+        self.names = {column: column for column in input_df.columns}
+        self.row_ids = None  # positions in input_df of current rows
+        self.snapshots = dict()
+        self.removed = []
+
+    def _current_row_ids(self, dataframe):
+        """Generates the input_df positions of the rows of the current df"""
+        if self.row_ids is None:
+            return pd.RangeIndex(len(dataframe))
+        return self.row_ids
+
+    def record_columns(self, dataframe, columns):
+        """
+        Saves the original values of columns about to be overwritten, values
+        are saved only the first time each input_df column is overwritten
+
+        :param dataframe: pandas.DataFrame current version of the dataframe
+        :param columns: iterable of str current names of columns about to be
+            overwritten
+        """
+        for column in columns:
+            original = self.names.get(column)
+            if original is None or original in self.snapshots:
+                continue
+            self.snapshots[original] = pd.Series(
+                dataframe[column].values,
+                index=self._current_row_ids(dataframe),
+            )
+
+    def record_rows(self, dataframe, positions):
+        """
+        Saves the rows about to be removed from the dataframe
+
+        :param dataframe: pandas.DataFrame current version of the dataframe
+        :param positions: array of int positions of the rows to be removed
+        """
+        row_ids = self._current_row_ids(dataframe)
+        positions = np.unique(np.asarray(positions, dtype=np.intp))
+        positions = positions[positions >= 0]
+        rows = self._to_original(dataframe.iloc[positions])
+        rows.index = row_ids[positions]
+        self.removed.append(rows)
+        self.row_ids = np.delete(row_ids, positions)
+
+    def record_renames(self, map_dict):
+        """
+        Saves the renames about to be made to the dataframe's columns
+
+        :param map_dict: dict mapping {current_name: new_name}
+        """
+        self.names = {
+            map_dict.get(column, column): original
+            for column, original in self.names.items()
+        }
+
+    def checkpoint(self):
+        """
+        Saves the current record of removed rows and renames, see restore
+
+        :return: tuple of recorded state passed to restore
+        """
+        return self.names, self.row_ids, len(self.removed)
+
+    def restore(self, checkpoint):
+        """
+        Discards the rows and renames recorded since a checkpoint, called when
+        a basedata.ops method raises rather than making the recorded changes
+
+        Saved column values are kept, as they hold the original values of
+        their columns whether or not the method changed them.
+
+        :param checkpoint: tuple as returned by checkpoint
+        """
+        self.names, self.row_ids, n_removed = checkpoint
+        del self.removed[n_removed:]
+
+    def before_operation(self, dataframe, step):
+        """
+        Records the changes a basedata.ops method is about to make
+
+        :param dataframe: pandas.DataFrame current version of the dataframe
+        :param step: basedata.ops.plan.PlanStep describing the method call
+        """
+        arguments = step.arguments
+        if step.name == 'drop_dupes':
+            self.record_rows(
+                dataframe,
+                dataframe.index.get_indexer(
+                    np.atleast_1d(arguments['index_list'])
+                ),
+            )
+        elif step.name == 'drop_blankID_rows':
+            self.record_rows(
+                dataframe,
+                np.flatnonzero(dataframe[arguments['column']].isnull()),
+            )
+        elif step.name == 'map_column_names':
+            if arguments.get('inplace'):
+                self.record_renames(arguments['map_dict'])
+        else:
+            self.record_columns(
+                dataframe,
+                [column for column in step.writes if column in dataframe],
+            )
+
+    def _to_original(self, dataframe):
+        """Selects and renames the input_df columns of a dataframe"""
+        current = [
+            column for column in dataframe.columns if column in self.names
+        ]
+        original_df = dataframe[current]
+        original_df.columns = [self.names[column] for column in current]
+        return original_df
+
+    def rebuild(self, dataframe):
+        """
+        Rebuilds the input dataframe from the current version of the
+        dataframe and the recorded changes
+
+        :param dataframe: pandas.DataFrame current version of the dataframe
+        :return: pandas.DataFrame
+        """
+        current_df = self._to_original(dataframe)
+        current_df.index = self._current_row_ids(dataframe)
+        input_df = pd.concat([current_df] + self.removed).sort_index()
+        for column, snapshot in self.snapshots.items():
+            in_snapshot = input_df.index.isin(snapshot.index)
+            input_df[column] = input_df[column].where(
+                ~in_snapshot,
+                snapshot.reindex(input_df.index),
+            )
+        input_df = input_df[list(self.columns)]
+        for column, dtype in self.dtypes.items():
+            if input_df[column].dtype != dtype:
+                input_df[column] = input_df[column].astype(dtype)
+        input_df.index = self.index
+        return input_df
+
+    def memory_usage(self):
+        """
+        Calculates the memory used by the recorded changes
+
+        :return: int size in bytes
+        """
+        n_bytes = 0 if self.row_ids is None else self.row_ids.nbytes
+        n_bytes += sum(
+            snapshot.memory_usage(index=True, deep=True)
+            for snapshot in self.snapshots.values()
+        )
+        n_bytes += sum(
+            rows.memory_usage(index=True, deep=True).sum()
+            for rows in self.removed
+        )
+        return n_bytes
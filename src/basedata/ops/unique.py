@@ -0,0 +1,174 @@
+"""
+This submodule contains functions for applying basedata.ops transformations
+once per distinct column value, rather than once per row, and expanding the
+results back to every row through the column's factorized integer codes.
+
+Columns with many rows but few distinct values, i.e. IDs, codes, and dates,
+are transformed in this way automatically. A column is transformed once per
+distinct value when it is categorical, or when it has at least
+UNIQUE_MIN_ROWS rows and the ratio of distinct values to rows in a sample of
+UNIQUE_SAMPLE_SIZE of its rows is no greater than UNIQUE_MAX_RATIO. These
+module-level settings may be changed, i.e. setting UNIQUE_MIN_ROWS to None
+disables the unique value mode for all columns that are not categorical.
+
+Distinct values are found by factorize_values, which, unlike
+pandas.factorize, keeps values of different types that compare equal, i.e.
+1, 1.0, and True in object columns, apart, so that each is transformed as it
+would be in its own row.
+"""
+import numpy as np
+import pandas as pd
+
+
+UNIQUE_MIN_ROWS = 10000
+UNIQUE_MAX_RATIO = 0.5
+UNIQUE_SAMPLE_SIZE = 10000
+
+# inferred dtypes of object columns whose values are all of a single type
+SINGLE_TYPES = ('string', 'bytes', 'integer', 'boolean', 'empty')
+
+
+def is_categorical(series):
+    """
+    Determines whether a series is categorical
+
+    :param series: pandas.Series
+    :return: bool
+    """
+    return isinstance(series.dtype, pd.CategoricalDtype)
+
+
+def use_unique_values(series):
+    """
+    Determines whether a series should be transformed once per distinct value
+
+    :param series: pandas.Series
+    :return: bool
+    """
+    if is_categorical(series):
+        return True
+    if UNIQUE_MIN_ROWS is None or len(series) < UNIQUE_MIN_ROWS:
+        return False
+    step = max(len(series) // UNIQUE_SAMPLE_SIZE, 1)
+    sample = series.iloc[::step]
+    return sample.nunique(dropna=False) / len(sample) <= UNIQUE_MAX_RATIO
+
+
+def factorize_values(series):
+    """
+    Encodes a series as integer codes of its distinct values, like
+    pandas.factorize, except that values of different types, i.e. 1, 1.0,
+    and True, and the float values 0.0 and -0.0, in float and object columns,
+    which pandas.factorize encodes as a single value, are encoded as distinct
+    values
+
+    :param series: pandas.Series
+    :return: tuple of numpy.ndarray int codes, -1 for missing values, in
+        order of first occurrence, and pandas.Series of the first value
+        encoded by each code
+    """
+    codes, uniques = pd.factorize(series)
+    values = series.to_numpy()
+    key = None
+    if series.dtype == object and pd.api.types.infer_dtype(
+        values, skipna=True,
+    ) not in SINGLE_TYPES:
+        type_codes, types = pd.factorize(series.map(type).to_numpy())
+        key = codes * len(types) + type_codes
+        float_types = [
+            i for i, value_type in enumerate(types)
+            if issubclass(value_type, (float, np.floating))
+        ]
+        if float_types:
+            floats = np.flatnonzero(
+                np.isin(type_codes, float_types) & (codes >= 0)
+            )
+            float_values = values[floats].astype(np.float64)
+            negative_zero = floats[
+                (float_values == 0) & np.signbit(float_values)
+            ]
+            key[negative_zero] = -2 - type_codes[negative_zero]
+    elif series.dtype.kind == 'f':
+        negative_zero = (values == 0) & np.signbit(values)
+        if negative_zero.any():
+            key = np.where(negative_zero, -2, codes)
+    if key is None:
+        return codes, pd.Series(uniques, name=series.name)
+    present = codes >= 0
+    codes = np.full(len(codes), -1, dtype=np.intp)
+    codes[present], _ = pd.factorize(key[present])
+    positions = np.flatnonzero(present)
+    _, first = np.unique(codes[positions], return_index=True)
+    uniques = series.iloc[positions[first]].reset_index(drop=True)
+    return codes, uniques
+
+
+def apply_unique(series, function):
+    """
+    Applies an elementwise transformation to a series, once per distinct
+    value if use_unique_values(series) is True and once per row otherwise
+
+    The function is called with a pandas.Series of the distinct values and
+    must return an array-like of the same length, in which each value depends
+    only on the corresponding input value. Missing values are transformed
+    separately from, and as they appear in, the input series. Categorical
+    series are transformed once per category and returned as categoricals.
+
+    :param series: pandas.Series to transform
+    :param function: function transforming a pandas.Series elementwise
+    :return: pandas.Series with the index and name of the input series
+    """
+    if not use_unique_values(series):
+        return _apply_rows(series, function)
+    if is_categorical(series):
+        return _apply_categories(series, function)
+    codes, uniques = factorize_values(series)
+    if len(uniques) == 0:
+        return _apply_rows(series, function)
+    unique_result = pd.Series(function(uniques))
+    missing = codes < 0
+    result = unique_result.take(np.where(missing, 0, codes))
+    result.index = series.index
+    result.name = series.name
+    if missing.any():
+        result.iloc[np.flatnonzero(missing)] = np.asarray(
+            function(series[missing])
+        )
+    return result
+
+
+def _apply_rows(series, function):
+    """
+    Applies an elementwise transformation to every row of a series
+    """
+    result = function(series)
+    if isinstance(result, pd.Series):
+        result.index = series.index
+        result.name = series.name
+        return result
+    return pd.Series(result, index=series.index, name=series.name)
+
+
+def _apply_categories(series, function):
+    """
+    Applies an elementwise transformation to the categories of a categorical
+    series and rebuilds the categorical from the transformed categories
+    """
+    codes = series.cat.codes.to_numpy()
+    inputs = pd.Series(series.cat.categories, name=series.name)
+    missing = codes < 0
+    if missing.any():
+        # the first missing value stands in for every missing value
+        first = np.argmax(missing)
+        inputs = pd.concat(
+            [inputs.astype(object), series.iloc[[first]].astype(object)],
+            ignore_index=True,
+        )
+        codes = np.where(missing, len(inputs) - 1, codes)
+    outputs = pd.Series(function(inputs))
+    output_codes, categories = pd.factorize(outputs)
+    return pd.Series(
+        pd.Categorical.from_codes(output_codes[codes], categories),
+        index=series.index,
+        name=series.name,
+    )
@@ -0,0 +1,165 @@
+"""
+This submodule contains functions for writing pandas.DataFrame objects to csv
+files in independently formatted and compressed blocks of rows.
+
+Blocks are formatted and compressed in a thread or process pool and written
+to file in their original order. gzip, bz2, and zstd all decompress a
+sequence of independently compressed blocks as a single stream, so the
+decompressed file is identical to the output of a single-threaded
+pandas.DataFrame.to_csv() call.
+"""
+import bz2
+import gzip
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+
+COMPRESSION_EXTENSIONS = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.zst': 'zstd',
+}
+
+COMPRESSION_LEVELS = {
+    'gzip': 6,
+    'bz2': 9,
+    'zstd': 3,
+}
+
+# extensions of files whose compression is inferred and written only by
+# pandas.DataFrame.to_csv()
+TO_CSV_EXTENSIONS = ('.xz', '.zip', '.tar', '.tar.gz', '.tar.bz2', '.tar.xz')
+
+
+def infer_compression(filename):
+    """
+    Infers the compression type of a file from its extension
+
+    :param filename: str filename, i.e. 'data.csv.gz'
+    :return: str 'gzip', 'bz2', 'zstd', or None if the file is uncompressed
+    """
+    _, ext = os.path.splitext(filename)
+    return COMPRESSION_EXTENSIONS.get(ext)
+
+
+def is_block_compression(filename, compression='infer'):
+    """
+    Determines whether a csv file is written uncompressed, or with a
+    compression type that write_csv_blocks can write, rather than with a
+    compression written only by pandas.DataFrame.to_csv(), i.e. 'xz', 'zip',
+    or a dict of compression options
+
+    :param filename: str filename to which csv should be written
+    :param compression: str compression type, dict of compression options,
+        None, or 'infer' to infer the compression type from the filename
+        extension, default='infer'
+    :return: bool
+    """
+    if isinstance(compression, str):
+        if compression == 'infer':
+            return not filename.endswith(TO_CSV_EXTENSIONS)
+        return compression in COMPRESSION_LEVELS
+    return compression is None
+
+
+def compress_block(data, compression, level=None):
+    """
+    Compresses a block of bytes as a complete gzip member, bz2 stream, or
+    zstd frame
+
+    :param data: bytes to compress
+    :param compression: str 'gzip', 'bz2', 'zstd', or None for no compression
+    :param level: int compression level, default=None uses the
+        COMPRESSION_LEVELS default for the compression type
+    :return: bytes
+    """
+    if compression is None:
+        return data
+    if compression not in COMPRESSION_LEVELS:
+        raise ValueError(
+            "compression must be one of 'gzip', 'bz2', 'zstd', or None"
+        )
+    if level is None:
+        level = COMPRESSION_LEVELS[compression]
+    if compression == 'gzip':
+        return gzip.compress(data, compresslevel=level)
+    elif compression == 'bz2':
+        return bz2.compress(data, compresslevel=level)
+    else:
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                'zstandard is required to write zstd compressed files.'
+            )
+        return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+def format_block(dataframe, header, compression=None, level=None,
+                 encoding='utf-8', **to_csv_kwargs):
+    """
+    Formats a block of rows in csv format and compresses the result
+
+    :param dataframe: pandas.DataFrame block of rows to format
+    :param header: bool whether to include the csv header row
+    :param compression: str 'gzip', 'bz2', 'zstd', or None
+    :param level: int compression level, default=None
+    :param encoding: str text encoding of the csv, default='utf-8'
+    :param to_csv_kwargs: optional args to pandas.DataFrame.to_csv()
+    :return: bytes
+    """
+    text = dataframe.to_csv(index=False, header=header, **to_csv_kwargs)
+    return compress_block(text.encode(encoding), compression, level)
+
+
+def write_csv_blocks(dataframe, filename, compression='infer', level=None,
+                     jobs=1, block_size=100000, processes=False,
+                     **to_csv_kwargs):
+    """
+    Saves a pandas.DataFrame to file in csv format, formatting and
+    compressing blocks of rows in parallel and writing them in order
+
+    At most 2 * jobs blocks are held in memory at any time.
+
+    :param dataframe: pandas.DataFrame to save
+    :param filename: str filename to which csv should be written
+    :param compression: str 'gzip', 'bz2', 'zstd', None, or 'infer' to infer
+        the compression type from the filename extension, default='infer'
+    :param level: int compression level, default=None uses the
+        COMPRESSION_LEVELS default for the compression type
+    :param jobs: int number of blocks formatted and compressed in parallel,
+        default=1
+    :param block_size: int number of rows per block, default=100000
+    :param processes: bool whether to use a process pool rather than a
+        thread pool, default=False
+    :param to_csv_kwargs: optional args to pandas.DataFrame.to_csv(), a
+        header is written before the first block only
+    :return: int number of bytes written to file
+    """
+    header = to_csv_kwargs.pop('header', True)
+    if compression == 'infer':
+        compression = infer_compression(filename)
+    format_func = partial(
+        format_block,
+        compression=compression,
+        level=level,
+        **to_csv_kwargs
+    )
+    starts = range(0, max(len(dataframe), 1), block_size)
+    Executor = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    n_bytes = 0
+    with Executor(max_workers=jobs) as executor, open(filename, 'wb') as f:
+        pending = deque()
+        for start in starts:
+            pending.append(executor.submit(
+                format_func,
+                dataframe.iloc[start:start + block_size],
+                header if start == 0 else False,
+            ))
+            if len(pending) >= 2 * jobs:
+                n_bytes += f.write(pending.popleft().result())
+        while pending:
+            n_bytes += f.write(pending.popleft().result())
+    return n_bytes
@@ -11,7 +11,7 @@ import pandas as pd
 
 from basedata.inventory import list_subdir_paths, list_subdirs,\
     list_files_with_extensions, list_datafiles, make_datafile_array,\
-    make_datafile_dataframe
+    make_datafile_dataframe, list_datafile_paths
 
 
 testdir_list = [
@@ -164,3 +164,12 @@ class InventoryTests(TestCase):
             )
             self.assertIsNone(datafile_df)
             assert os.path.exists(fp)
+
+    def test_list_datafile_paths(self):
+        """ensure list_datafile_paths returns existing datafile paths"""
+        with TemporaryDirectory() as tmp:
+            make_dirfiles(tmp, testdir_list, testfile_list)
+            datafile_df = make_datafile_dataframe(tmp)
+            path_list = list_datafile_paths(datafile_df, tmp)
+            self.assertEqual(len(path_list), len(datafile_df))
+            assert False not in [os.path.exists(fp) for fp in path_list]
@@ -0,0 +1,162 @@
+"""
+unittests for basedata.log submodule
+"""
+import json
+import os
+from unittest import TestCase
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pandas as pd
+
+from basedata.log import OperationLog, LOG_COLUMNS, summarize_value
+from basedata.ops import BaseDataOps
+
+
+def make_log_dataframe():
+    """builds dataframe with id column containing a blank value"""
+    return pd.DataFrame({
+        'ids': ['1-23', '4 56', np.nan, '7-89'],
+        'values': [1, 2, 3, 4],
+    })
+
+
+class OperationLogTests(TestCase):
+    """unittests for log.OperationLog class"""
+
+    def test_summarize_value(self):
+        """ensure non-scalar parameters are summarized as short strings"""
+        self.assertEqual(summarize_value(5), 5)
+        self.assertIsNone(summarize_value(None))
+        summary = summarize_value(list(range(100)), max_len=20)
+        self.assertEqual(len(summary), 20)
+        self.assertTrue(summary.endswith('...'))
+        self.assertEqual(summarize_value(1.5), 1.5)
+        self.assertEqual(summarize_value(np.nan), 'nan')
+        self.assertEqual(summarize_value(-np.inf), '-inf')
+
+    def test_record(self):
+        """ensure record returns result and logs shape changes"""
+        Log = OperationLog()
+        df = make_log_dataframe()
+        result = Log.record(
+            'head',
+            {'n': 2},
+            lambda: df,
+            lambda: df.head(2),
+        )
+        self.assertEqual(len(result), 2)
+        record, = Log.records
+        self.assertEqual(record['operation'], 'head')
+        self.assertEqual(record['rows_before'], 4)
+        self.assertEqual(record['columns_after'], 2)
+        self.assertIsNone(record['peak_memory'])
+
+    def test_record_nested(self):
+        """ensure only the outermost of nested calls is recorded"""
+        Log = OperationLog()
+        df = make_log_dataframe()
+        Log.record(
+            'outer',
+            {},
+            lambda: df,
+            lambda: Log.record('inner', {}, lambda: df, lambda: None),
+        )
+        self.assertEqual([r['operation'] for r in Log.records], ['outer'])
+
+    def test_record_trace_memory(self):
+        """ensure peak memory is recorded when tracing memory"""
+        Log = OperationLog(trace_memory=True)
+        df = make_log_dataframe()
+        Log.record('alloc', {}, lambda: df, lambda: np.ones(100000))
+        self.assertGreaterEqual(Log.records[0]['peak_memory'], 800000)
+
+    def test_export(self):
+        """ensure log exports to dataframe and JSON lines file"""
+        Log = OperationLog()
+        df = make_log_dataframe()
+        Log.record('first', {}, lambda: df, lambda: None)
+        Log.record('second', {}, lambda: df, lambda: None)
+        self.assertEqual(list(Log.to_dataframe().columns), LOG_COLUMNS)
+        with TemporaryDirectory() as tmp:
+            fp = os.path.join(tmp, 'log.jsonl')
+            Log.to_json(fp)
+            with open(fp) as f:
+                records = [json.loads(line) for line in f]
+        self.assertEqual(records, Log.records)
+
+    def test_export_strict_json(self):
+        """ensure nan parameters are exported as valid JSON"""
+        Base = BaseDataOps.from_object(make_log_dataframe())
+        Log = Base.start_log()
+        Base.strip_nonnumeric('ids', val_exception=np.nan)
+
+        def reject_constant(name):
+            raise ValueError(name)
+
+        for line in Log.to_json().splitlines():
+            record = json.loads(line, parse_constant=reject_constant)
+            self.assertEqual(record['parameters']['val_exception'], 'nan')
+
+    def test_record_object_bytes(self):
+        """ensure memory use includes object values only when deep"""
+        df = make_log_dataframe()
+        for deep_memory in (False, True):
+            Log = OperationLog(deep_memory=deep_memory)
+            Log.record('first', {}, lambda: df, lambda: None)
+            self.assertEqual(
+                Log.records[0]['bytes_before'],
+                df.memory_usage(index=True, deep=deep_memory).sum(),
+            )
+            self.assertEqual(Log.copy().deep_memory, deep_memory)
+
+
+class LoggedOperationsTests(TestCase):
+    """unittests for BaseDataOps.start_log"""
+
+    def test_not_logged(self):
+        """ensure operations are not logged unless the log is started"""
+        Base = BaseDataOps.from_object(make_log_dataframe())
+        Base.strip_nonnumeric('ids')
+        self.assertIsNone(Base.log)
+
+    def test_operations_logged(self):
+        """ensure each method call and to_file save is logged once"""
+        Base = BaseDataOps.from_object(make_log_dataframe())
+        Log = Base.start_log()
+        Base.drop_blankID_rows('ids')
+        Base.substitute_chars('ids', '[-]', '')
+        Base.report_values('values')
+        with TemporaryDirectory() as tmp:
+            Base.to_file(os.path.join(tmp, 'test.csv'))
+        log_df = Log.to_dataframe()
+        self.assertEqual(
+            log_df['operation'].tolist(),
+            ['drop_blankID_rows', 'substitute_chars', 'report_values',
+             'to_file'],
+        )
+        self.assertEqual(log_df['rows_before'].tolist(), [4, 3, 3, 3])
+        self.assertEqual(log_df['parameters'][1]['pattern'], '[-]')
+
+    def test_lazy_fused_logged(self):
+        """ensure fused lazy steps are logged as a single pass"""
+        Base = BaseDataOps.from_object(make_log_dataframe())
+        Log = Base.start_log()
+        lazy = Base.lazy()
+        lazy.substitute_chars('ids', '[-]', '')
+        lazy.strip_nonnumeric('ids')
+        lazy.collect()
+        self.assertEqual(
+            Log.to_dataframe()['operation'].tolist(),
+            ['substitute_chars + strip_nonnumeric'],
+        )
+
+    def test_from_object_copies_log(self):
+        """ensure from_object copies, rather than shares, the input log"""
+        Base = BaseDataOps.from_object(make_log_dataframe())
+        Base.start_log()
+        Base.strip_nonnumeric('ids')
+        Base_new = BaseDataOps.from_object(Base)
+        Base_new.add_column('new', 0)
+        self.assertEqual(len(Base.log.records), 1)
+        self.assertEqual(len(Base_new.log.records), 2)
@@ -2,6 +2,7 @@
 Unit-tests for basedata.ops.base submodule
 """
 import os
+import re
 from unittest import TestCase
 from tempfile import TemporaryDirectory
 
@@ -9,9 +10,12 @@ import numpy as np
 import pandas as pd
 
 from basedata.ops.base import BaseDataClass, inplace_return_series,\
-    regex_sub_value, regex_replace_value
+    regex_sub_value, regex_replace_value, filter_rows, normalize_filters,\
+    arrow_regex_sub, regex_sub_array, regex_replace_array, strip_char_class,\
+    DIGIT_PATTERNS, ALNUM_PATTERNS, WHITESPACE_PATTERNS, compile_pattern
 from test_databuild import make_simple_dataframe, save_simple_dataframe,\
-    make_dirty_numeric_dataframe, make_dirty_datetime_dataframe
+    make_dirty_numeric_dataframe, make_dirty_datetime_dataframe,\
+    make_twocol_dataframe, save_dataframe
 
 
 keycol = 'test'
@@ -93,6 +97,75 @@ class MiscFunctionsTest(TestCase):
         ]
         self.assertEqual(outputs, outputs_test)
 
+    def test_compile_pattern(self):
+        """ensures compiled patterns are cached and reused"""
+        compile_pattern.cache_clear()
+        regex_sub_array(['a1', 'b2'], '[a-z]', '')
+        regex_replace_array(['a1', 'b2'], 'x', '[a-z]')
+        regex_sub_value('c3', '[a-z]')
+        info = compile_pattern.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+
+    def test_regex_sub_array(self):
+        """ensures regex_sub_array matches regex_sub_value for each value"""
+        inputs = ['1234', '123abc4', '', 1234, None, 'abc']
+        for pattern, val_sub in [('[^0-9]', ''), ('[a-c]', 'x'), ('(', '')]:
+            outputs = [
+                regex_sub_value(input_val, pattern, val_sub, 'error', 'none')
+                for input_val in inputs
+            ]
+            outputs_test = regex_sub_array(
+                inputs, pattern, val_sub, 'error', 'none'
+            )
+            self.assertEqual(outputs, list(outputs_test))
+
+    def test_regex_sub_array_str(self):
+        """ensures str arrays are substituted as regex_sub_value would"""
+        ascii_inputs = ['1234', '12-3a 4', '', 'xab', 'ab:c[d]', 'a,b']
+        for inputs in [ascii_inputs,
+                       ascii_inputs + ['ab\x0b\n'],
+                       ascii_inputs + ['\xe91-2']]:
+            for pattern, val_sub in [
+                ('[-]', ''), ('[a-z]+', '#'), ('\\s', '_'), ('b$', 'Z'),
+                ('x*', '-'), ('(\\d)', '<\\1>'), ('(?<=a)b', 'Q'),
+                ('[^0-9]', ''), ('[[:alpha:]]', ''), ('[a-z]{,2}b', '#'),
+                ('(?U)[a-z]+', '#'),
+            ]:
+                outputs = [
+                    regex_sub_value(input_val, pattern, val_sub, 'error',
+                                    'none')
+                    for input_val in inputs
+                ]
+                outputs_test = regex_sub_array(
+                    np.array(inputs, dtype=object), pattern, val_sub,
+                    'error', 'none',
+                )
+                self.assertEqual(outputs, list(outputs_test))
+
+    def test_arrow_regex_sub(self):
+        """ensures pyarrow substitutes only where it matches re"""
+        inputs = np.array(['12-3a', 'b-c'], dtype=object)
+        outputs = arrow_regex_sub(inputs, '[-a]', '')
+        if outputs is not None:  # pyarrow is installed
+            self.assertEqual(list(outputs), ['123', 'bc'])
+        self.assertIsNone(arrow_regex_sub(inputs, '[-]*', ''))
+        self.assertIsNone(arrow_regex_sub(inputs, '(-)', '\\1'))
+        self.assertIsNone(arrow_regex_sub(inputs, '[[:alpha:]]', ''))
+        self.assertIsNone(arrow_regex_sub(inputs, '[a-z]{,2}b', ''))
+        self.assertIsNone(arrow_regex_sub(
+            np.array(['\xe9-1'], dtype=object), '[-]', '',
+        ))
+
+    def test_strip_char_class(self):
+        """ensures strip_char_class matches re.sub for supported patterns"""
+        inputs = ['1234', '12 3a-4', '\u0661\u0662', '\xb23', 'A\xc0b\t9', '']
+        for pattern in DIGIT_PATTERNS + ALNUM_PATTERNS + WHITESPACE_PATTERNS:
+            self.assertEqual(
+                strip_char_class(inputs, pattern),
+                [re.sub(pattern, '', input_val) for input_val in inputs],
+            )
+        self.assertIsNone(strip_char_class(inputs, '[^0-8]'))
+
     def test_regex_replace_value(self):
         """ensures sub_value_regex returns accurate values"""
         inputs = ['1234', '12345', '123a5', '', 1234, None, np.nan]
@@ -104,6 +177,33 @@ class MiscFunctionsTest(TestCase):
         ]
         self.assertEqual(outputs, outputs_test)
 
+    def test_regex_replace_array(self):
+        """ensures regex_replace_array matches regex_replace_value"""
+        inputs = ['1234', '12345', '123a5', '', '1234\n', 1234, None]
+        for pattern in ['[0-9]{4}$', '[a-z]', '(']:
+            outputs = [
+                regex_replace_value(input_val, 'test', pattern, 'error')
+                for input_val in inputs
+            ]
+            outputs_test = regex_replace_array(
+                inputs, 'test', pattern, 'error'
+            )
+            self.assertEqual(outputs, list(outputs_test))
+
+    def test_normalize_filters(self):
+        """ensure single conjunction of filters is wrapped in a list"""
+        filters = [('a', '==', 1), ('b', '>', 2)]
+        self.assertEqual(normalize_filters(filters), [filters])
+        self.assertEqual(normalize_filters([filters]), [filters])
+
+    def test_filter_rows(self):
+        """ensure filter_rows selects rows satisfying any conjunction"""
+        df = pd.DataFrame({'a': [1, 2, 3, 4], 'b': ['w', 'x', 'y', 'z']})
+        filters = [[('a', '>', 2), ('b', '!=', 'z')], [('b', 'in', ['w'])]]
+        df_test = filter_rows(df, filters)
+        self.assertEqual(df_test['a'].tolist(), [1, 3])
+        self.assertEqual(df_test.index.tolist(), [0, 1])
+
 
 class BaseDataClassTests(TestCase):
     """Tests to ensure class data.BaseDataClass functions properly"""
@@ -138,6 +238,122 @@ class BaseDataClassTests(TestCase):
                 None,
             )
 
+    def test_from_file_parquet(self):
+        """ensure parquet is read and stored to BaseDataClass class"""
+        with TemporaryDirectory() as tmp:
+            fp, df_test = save_simple_dataframe(tmp, 'test.parquet')
+            df_read = BaseDataClass.from_file(fp).df
+            self.assertEqual(
+                pd.testing.assert_frame_equal(df_test, df_read),
+                None,
+            )
+
+    def test_from_file_feather(self):
+        """ensure feather is read and stored to BaseDataClass class"""
+        with TemporaryDirectory() as tmp:
+            fp, df_test = save_simple_dataframe(tmp, 'test.feather')
+            df_read = BaseDataClass.from_file(fp).df
+            self.assertEqual(
+                pd.testing.assert_frame_equal(df_test, df_read),
+                None,
+            )
+
+    def test_from_file_columns_filters(self):
+        """ensure only selected columns and filtered rows are read"""
+        df = make_twocol_dataframe()
+        threshold = df['col2'].median()
+        df_test = df.loc[df['col2'] > threshold, ['col1']].reset_index(
+            drop=True
+        )
+        with TemporaryDirectory() as tmp:
+            for name in ('test.csv', 'test.parquet', 'test.arrow'):
+                fp = os.path.join(tmp, name)
+                save_dataframe(df, fp)
+                df_read = BaseDataClass.from_file(
+                    fp,
+                    columns=['col1'],
+                    filters=[('col2', '>', threshold)],
+                ).df
+                self.assertEqual(
+                    pd.testing.assert_frame_equal(df_test, df_read),
+                    None,
+                )
+
+    def test_from_file_filters_float_values(self):
+        """ensure integer columns are filtered by float values as in pandas"""
+        df = pd.DataFrame({
+            'col1': [1, 2, 3, 4],
+            'col2': [45303358, 1, 81398865, 3],
+        })
+        filters = [[('col2', '>', 2.5)], [('col1', 'in', [2.0])]]
+        df_test = df.loc[(df['col2'] > 2.5) | (df['col1'] == 2)]\
+            .reset_index(drop=True)
+        with TemporaryDirectory() as tmp:
+            for name in ('test.parquet', 'test.arrow'):
+                fp = os.path.join(tmp, name)
+                save_dataframe(df, fp)
+                df_read = BaseDataClass.from_file(fp, filters=filters).df
+                self.assertEqual(
+                    pd.testing.assert_frame_equal(df_test, df_read),
+                    None,
+                )
+
+    def test_from_files(self):
+        """ensure files are combined and source column is recorded"""
+        with TemporaryDirectory() as tmp:
+            fp_1, df_1 = save_simple_dataframe(tmp, 'test_1.csv')
+            fp_2, df_2 = save_simple_dataframe(tmp, 'test_2.parquet')
+            for jobs in (1, 2):
+                df_read = BaseDataClass.from_files(
+                    [fp_1, fp_2],
+                    jobs=jobs,
+                    source_column='source',
+                ).df
+                df_test = pd.concat([df_1, df_2], ignore_index=True)
+                self.assertEqual(
+                    pd.testing.assert_frame_equal(
+                        df_test,
+                        df_read.drop(columns='source'),
+                    ),
+                    None,
+                )
+                self.assertEqual(
+                    df_read['source'].tolist(),
+                    [fp_1] * len(df_1) + [fp_2] * len(df_2),
+                )
+
+    def test_from_files_inventory(self):
+        """ensure files listed in inventory dataframe are read"""
+        with TemporaryDirectory() as tmp:
+            subdir = os.path.join(tmp, 'sub')
+            os.mkdir(subdir)
+            _, df_test = save_simple_dataframe(subdir, 'test.csv')
+            inventory_df = pd.DataFrame(
+                [['sub', 'test.csv']],
+                columns=['directory', 'filename'],
+            )
+            df_read = BaseDataClass.from_files(inventory_df, tmp).df
+            self.assertEqual(
+                pd.testing.assert_frame_equal(df_test, df_read),
+                None,
+            )
+            with self.assertRaises(ValueError):
+                BaseDataClass.from_files(inventory_df)
+
+    def test_from_files_validate(self):
+        """ensure from_files fails elegantly with mismatched schemas"""
+        with TemporaryDirectory() as tmp:
+            fp_1, _ = save_simple_dataframe(tmp, 'test_1.csv')
+            fp_2 = os.path.join(tmp, 'test_2.csv')
+            save_dataframe(make_twocol_dataframe(), fp_2)
+            with self.assertRaises(ValueError):
+                BaseDataClass.from_files([fp_1, fp_2])
+            df_read = BaseDataClass.from_files(
+                [fp_1, fp_2],
+                validate=False,
+            ).df
+            self.assertEqual(len(df_read.columns), 3)
+
     def test_from_file_fail(self):
         """ensure from_file fails elegantly with wrong filetype read"""
         with TemporaryDirectory() as tmp:
@@ -178,6 +394,37 @@ class BaseDataClassTests(TestCase):
             None,
         )
 
+    def test_from_object_copy_on_write(self):
+        """ensure copy_on_write shares columns until they are changed"""
+        df_test = make_twocol_dataframe()
+        df_original = df_test.copy()
+        Base = BaseDataClass.from_object(
+            df_test,
+            copy_input=True,
+            copy_on_write=True,
+        )
+        self.assertTrue(
+            np.shares_memory(df_test['col1'].values, Base.df['col1'].values)
+        )
+        self.assertTrue(
+            np.shares_memory(
+                df_test['col1'].values,
+                Base.input_df['col1'].values,
+            )
+        )
+        Base.df['col1'] = Base.df['col1'] * 2
+        self.assertTrue(
+            np.shares_memory(df_test['col2'].values, Base.df['col2'].values)
+        )
+        self.assertEqual(
+            pd.testing.assert_frame_equal(df_original, df_test),
+            None,
+        )
+        self.assertEqual(
+            pd.testing.assert_frame_equal(df_original, Base.input_df),
+            None,
+        )
+
     def test_from_object_fail(self):
         """ensure from_object fails elegantly with invalid object"""
         class InvalidClass(object):
@@ -194,3 +441,17 @@ class BaseDataClassTests(TestCase):
             fp_save = os.path.join(tmp, "test_save.csv")
             Base.to_file(fp_save)
             assert os.path.exists(fp_save)
+
+    def test_to_file_columnar(self):
+        """ensure to_file saves columnar formats based on extension"""
+        with TemporaryDirectory() as tmp:
+            df_test = make_simple_dataframe()
+            Base = BaseDataClass.from_object(df_test)
+            for name in ('test.parquet', 'test.feather', 'test.arrow'):
+                fp_save = os.path.join(tmp, name)
+                Base.to_file(fp_save)
+                df_read = BaseDataClass.from_file(fp_save).df
+                self.assertEqual(
+                    pd.testing.assert_frame_equal(df_test, df_read),
+                    None,
+                )
@@ -0,0 +1,129 @@
+"""
+Unittests for basedata.ops.cache submodule
+"""
+import os
+from unittest import TestCase
+from tempfile import TemporaryDirectory
+
+import pandas as pd
+
+from basedata.ops.base import BaseDataClass, read_datafile
+from basedata.ops.cache import LoadCache, hash_file
+from test_databuild import save_simple_dataframe, save_dataframe,\
+    make_dirty_ids_dataframe, make_twocol_dataframe
+
+
+class LoadCacheTests(TestCase):
+    """unittests for cache.LoadCache class"""
+
+    def test_hash_file(self):
+        """ensure identical files have identical hashes"""
+        with TemporaryDirectory() as tmp:
+            fp_1, df = save_simple_dataframe(tmp, 'test_1.csv')
+            fp_2 = os.path.join(tmp, 'test_2.csv')
+            save_dataframe(df, fp_2)
+            self.assertEqual(hash_file(fp_1), hash_file(fp_2))
+
+    def test_invalid_key_fail(self):
+        """ensure LoadCache fails elegantly with invalid key type"""
+        with TemporaryDirectory() as tmp:
+            with self.assertRaises(ValueError):
+                LoadCache(tmp, key='name')
+
+    def test_make_key(self):
+        """ensure keys differ by read_kwargs and file version"""
+        with TemporaryDirectory() as tmp:
+            fp, df = save_simple_dataframe(tmp, 'test.csv')
+            Cache = LoadCache(os.path.join(tmp, 'cache'))
+            key = Cache.make_key(fp)
+            self.assertEqual(key, Cache.make_key(fp))
+            self.assertNotEqual(key, Cache.make_key(fp, columns=['id']))
+            save_dataframe(pd.concat([df, df]), fp)
+            self.assertNotEqual(key, Cache.make_key(fp))
+
+    def test_load_reads_from_cache(self):
+        """ensure load parses the source file only once"""
+        calls = []
+
+        def read_function(filename, **read_kwargs):
+            calls.append(filename)
+            return read_datafile(filename, **read_kwargs)
+
+        with TemporaryDirectory() as tmp:
+            fp, df_test = save_simple_dataframe(tmp, 'test.xlsx')
+            Cache = LoadCache(os.path.join(tmp, 'cache'), key='hash')
+            Cache.load(fp, read_function)
+            df_read = Cache.load(fp, read_function)
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(
+                pd.testing.assert_frame_equal(df_test, df_read),
+                None,
+            )
+
+    def test_put_mixed_types(self):
+        """ensure frames that cannot be stored as feather are pickled"""
+        df_test = make_dirty_ids_dataframe()
+        with TemporaryDirectory() as tmp:
+            Cache = LoadCache(tmp)
+            Cache.put('key', df_test)
+            self.assertTrue(os.path.exists(os.path.join(tmp, 'key.pkl')))
+            self.assertEqual(
+                pd.testing.assert_frame_equal(df_test, Cache.get('key')),
+                None,
+            )
+
+    def test_evict(self):
+        """ensure least recently used entries are evicted"""
+        with TemporaryDirectory() as tmp:
+            _, df = save_simple_dataframe(tmp, 'test.csv')
+            Cache = LoadCache(os.path.join(tmp, 'cache'))
+            Cache.put('old', df)
+            os.utime(os.path.join(Cache.directory, 'old.feather'), (0, 0))
+            Cache.put('new', df)
+            Cache.max_bytes = Cache.size() - 1
+            Cache.evict()
+            self.assertIsNone(Cache.get('old'))
+            self.assertIsNotNone(Cache.get('new'))
+
+    def test_invalidate(self):
+        """ensure invalidate deletes only the source file's entries"""
+        with TemporaryDirectory() as tmp:
+            fp_1, _ = save_simple_dataframe(tmp, 'test_1.csv')
+            fp_2, _ = save_simple_dataframe(tmp, 'test_2.csv')
+            Cache = LoadCache(os.path.join(tmp, 'cache'))
+            Cache.load(fp_1, read_datafile)
+            Cache.load(fp_2, read_datafile)
+            Cache.invalidate(fp_1)
+            self.assertIsNone(Cache.get(Cache.make_key(fp_1)))
+            self.assertIsNotNone(Cache.get(Cache.make_key(fp_2)))
+            Cache.invalidate()
+            self.assertEqual(Cache.size(), 0)
+
+    def test_from_file_cache(self):
+        """ensure from_file reads through cache directory"""
+        with TemporaryDirectory() as tmp:
+            fp, df_test = save_simple_dataframe(tmp, 'test.xlsx')
+            cache_dir = os.path.join(tmp, 'cache')
+            BaseDataClass.from_file(fp, cache=cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            df_read = BaseDataClass.from_file(fp, cache=cache_dir).df
+            self.assertEqual(
+                pd.testing.assert_frame_equal(df_test, df_read),
+                None,
+            )
+
+    def test_from_file_cache_index_col(self):
+        """ensure cached reads keep the index read with index_col"""
+        with TemporaryDirectory() as tmp:
+            fp = os.path.join(tmp, 'test.csv')
+            save_dataframe(make_twocol_dataframe(), fp)
+            cache_dir = os.path.join(tmp, 'cache')
+            df_test = BaseDataClass.from_file(fp, index_col=0).df
+            BaseDataClass.from_file(fp, index_col=0, cache=cache_dir)
+            df_read = BaseDataClass.from_file(
+                fp, index_col=0, cache=cache_dir,
+            ).df
+            self.assertEqual(
+                pd.testing.assert_frame_equal(df_test, df_read),
+                None,
+            )
@@ -1,7 +1,9 @@
 """
 Unittests for basedata.ops.cols submodule
 """
+import os
 from unittest import TestCase
+from tempfile import TemporaryDirectory
 
 import numpy as np
 import pandas as pd
@@ -37,6 +39,25 @@ class ColumnConversionsMixinTests(TestCase):
             in Conv.df[keycol].dropna().astype(int).values
         ]
 
+    def test_substitute_chars_none_exception(self):
+        """ensure substitute_chars val_none and val_exception are returned"""
+        Conv = self.create_ColumnConversions_class(
+            make_dirty_numeric_dataframe()
+        )
+        series = Conv.substitute_chars(
+            keycol, '[^0-9]', '', val_exception='error', val_none='none',
+            inplace=False, return_series=True,
+        )
+        self.assertEqual(
+            series.tolist()[-5:],
+            ['none', 'none', '12400', 'none', '1598700'],
+        )
+        series = Conv.substitute_chars(
+            keycol, '[', '', val_exception='error',
+            inplace=False, return_series=True,
+        )
+        self.assertTrue((series == 'error').all())
+
     def test_check_nonnumeric(self):
         """ensure check_numeric returns value counts for all errors"""
         Conv = self.create_ColumnConversions_class(
@@ -74,6 +95,82 @@ class ColumnConversionsMixinTests(TestCase):
         )
         self.assertIsInstance(Conv.df[keycol].values[0], int)
 
+    def test_to_numeric_return_failures(self):
+        """ensure to_numeric reports the values it could not convert"""
+        Conv = self.create_ColumnConversions_class(
+            make_dirty_numeric_dataframe()
+        )
+        failures = Conv.to_numeric(keycol, return_failures=True)
+        self.assertCountEqual(
+            failures.index.values.astype(str),
+            np.array(numeric_dirt_list).astype(str),
+        )
+        self.assertEqual(Conv.df[keycol].dtype, np.float64)
+
+    def test_check_nonnumeric_numeric_column(self):
+        """ensure only missing values are reported for numeric columns"""
+        Conv = self.create_ColumnConversions_class(
+            pd.DataFrame({keycol: [1.0, np.nan, 3.0, np.nan]})
+        )
+        value_count_series = Conv.check_nonnumeric(keycol)
+        self.assertEqual(len(value_count_series), 1)
+        self.assertEqual(value_count_series.iloc[0], 2)
+        self.assertTrue(Conv.check_nonnumeric(keycol, dropna=True).empty)
+
+    def test_parse_numeric(self):
+        """ensure parse_numeric converts separated numbers to floats"""
+        Conv = self.create_ColumnConversions_class(
+            make_dirty_numeric_dataframe()
+        )
+        Conv.parse_numeric(keycol)
+        self.assertEqual(Conv.df[keycol].dtype, np.float64)
+        self.assertCountEqual(
+            Conv.df[keycol].dropna().tolist()[-2:],
+            [12400.0, 15987.0],
+        )
+
+    def test_parse_numeric_return_failures(self):
+        """ensure parse_numeric reports values that cannot be converted"""
+        Conv = self.create_ColumnConversions_class(
+            make_dirty_numeric_dataframe()
+        )
+        series, failures = Conv.parse_numeric(
+            keycol, return_failures=True, inplace=False, return_series=True,
+        )
+        self.assertCountEqual(
+            failures.index.values.astype(str),
+            ['', 'nan', 'test'],
+        )
+        self.assertEqual(failures.sum(), series.isnull().sum())
+        self.assertNotEqual(Conv.df[keycol].dtype, np.float64)
+
+    def test_to_numeric_column_list(self):
+        """ensure to_numeric converts a list of columns in worker processes"""
+        df = make_dirty_numeric_dataframe()
+        df['other'] = df[keycol].copy()
+        Conv = self.create_ColumnConversions_class(df)
+        failures = Conv.to_numeric(
+            [keycol, 'other'], return_failures=True, jobs=2, processes=True,
+        )
+        self.assertEqual(list(failures), [keycol, 'other'])
+        self.assertCountEqual(
+            failures['other'].index.values.astype(str),
+            np.array(numeric_dirt_list).astype(str),
+        )
+        self.assertTrue((Conv.df.dtypes == np.float64).all())
+
+    def test_substitute_chars_target_columns(self):
+        """ensure a list of columns is written to a list of target columns"""
+        df = make_twocol_dataframe()
+        Conv = self.create_ColumnConversions_class(df)
+        Conv.substitute_chars(['col1', 'col2'], '[0-9]', 'x',
+                              target_column=['new1', 'new2'], jobs=2)
+        self.assertEqual(list(Conv.df.columns)[-2:], ['new1', 'new2'])
+        self.assertTrue(Conv.df['new2'].str.fullmatch('x+').all())
+        with self.assertRaises(ValueError):
+            Conv.substitute_chars(['col1', 'col2'], '[0-9]', 'x',
+                                  target_column=['new1'])
+
     def test_check_datetime(self):
         """ensure check_datetime returns value counts for all errors"""
         Conv = self.create_ColumnConversions_class(
@@ -111,6 +208,45 @@ class ColumnConversionsMixinTests(TestCase):
         )
         self.assertIsInstance(Conv.df[keycol].values[0], str)
 
+    def test_to_datetime_return_failures(self):
+        """ensure to_datetime returns the series and failures together"""
+        Conv = self.create_ColumnConversions_class(
+            make_dirty_datetime_dataframe()
+        )
+        series, failures = Conv.to_datetime(
+            keycol, coerce=False, return_failures=True, return_series=True,
+        )
+        self.assertCountEqual(
+            failures.index.values.astype(str),
+            ['test', ' ', 'nan'],
+        )
+        self.assertIsInstance(series.values[0], str)
+
+    def test_check_datetime_datetime_column(self):
+        """ensure only missing values are reported for datetime columns"""
+        Conv = self.create_ColumnConversions_class(
+            pd.DataFrame({keycol: pd.to_datetime(['2010-10-10', None])})
+        )
+        value_count_series = Conv.check_datetime(keycol)
+        self.assertEqual(value_count_series.sum(), 1)
+        self.assertEqual(
+            Conv.to_datetime(keycol, return_failures=True).sum(), 1
+        )
+
+    def test_to_datetime_column_list(self):
+        """ensure to_datetime reports formats for each column of a list"""
+        df = make_dirty_datetime_dataframe()
+        df['other'] = df[keycol].copy()
+        Conv = self.create_ColumnConversions_class(df)
+        result = Conv.to_datetime([keycol, 'other'], inplace=False,
+                                  return_series=True, jobs=2)
+        self.assertIsInstance(result, pd.DataFrame)
+        self.assertCountEqual(Conv.dateformats, [keycol, 'other'])
+        self.assertTrue(
+            (result.dtypes == np.dtype('datetime64[ns]')).all()
+        )
+        self.assertEqual(Conv.df[keycol].dtype, object)
+
     def test_report_values(self):
         """ensure report_values reports all values and returns series"""
         df = make_dirty_numeric_dataframe()
@@ -123,6 +259,14 @@ class ColumnConversionsMixinTests(TestCase):
         )
         self.assertIsInstance(value_count_series, pd.Series)
 
+    def test_report_values_top_k(self):
+        """ensure report_values reports only top_k values when specified"""
+        df = pd.DataFrame({keycol: ['a'] * 5 + ['b'] * 3 + list('cdefg')})
+        Conv = self.create_ColumnConversions_class(df)
+        value_count_series = Conv.report_values(keycol, top_k=2)
+        self.assertEqual(list(value_count_series.index), ['a', 'b'])
+        self.assertTrue((value_count_series >= [5, 3]).all())
+
     def test_map_values_exhaustive(self):
         """ensure map_values accurately maps values"""
         df = make_dirty_numeric_dataframe()
@@ -150,6 +294,62 @@ class ColumnConversionsMixinTests(TestCase):
         self.assertCountEqual(map_vals, value_test[:-1])
         self.assertEqual(test_val, value_test[-1])
 
+    def test_map_values_not_exhaustive_mixed_types(self):
+        """ensure unmatched values of mixed type columns keep their values"""
+        df = pd.DataFrame({keycol: [1, '1', 1.0, True, None, 'x'] * 3})
+        Conv = self.create_ColumnConversions_class(df)
+        map_dict = {'x': 'y'}
+        series = Conv.map_values(keycol, map_dict, exhaustive=False,
+                                 inplace=False, return_series=True)
+        expected = df[keycol].map(map_dict).fillna(df[keycol])
+        self.assertEqual(
+            pd.testing.assert_series_equal(series, expected),
+            None,
+        )
+        self.assertEqual(
+            [type(val) for val in series[:4]], [int, str, float, bool],
+        )
+
+    def test_map_values_dataframe_unmatched(self):
+        """ensure map_values joins a mapping frame and counts unmatched"""
+        df = pd.DataFrame({keycol: ['a', 'b', 'c', 'c', np.nan]})
+        Conv = self.create_ColumnConversions_class(df)
+        mapping = pd.DataFrame({
+            'old': ['a', 'b', 'b'],
+            'new': ['x', 'y', 'z'],
+        })
+        unmatched = Conv.map_values(keycol, mapping, exhaustive=True,
+                                    return_unmatched=True)
+        self.assertEqual(unmatched.to_dict(), {'c': 2})
+        self.assertEqual(
+            Conv.df[keycol].tolist()[:4], ['x', 'z', np.nan, np.nan],
+        )
+
+    def test_map_values_file(self):
+        """ensure map_values reads mapping columns from file"""
+        df = pd.DataFrame({keycol: [1, 2, 3]})
+        Conv = self.create_ColumnConversions_class(df)
+        with TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'mapping.csv')
+            pd.DataFrame({
+                'other': [0, 0],
+                'old': [1, 3],
+                'new': ['one', 'three'],
+            }).to_csv(filename, index=False)
+            Conv.map_values(keycol, filename, key_column='old',
+                            value_column='new')
+        self.assertEqual(Conv.df[keycol].tolist(), ['one', 2, 'three'])
+
+    def test_map_values_categorical(self):
+        """ensure map_values remaps the categories of categorical columns"""
+        df = pd.DataFrame({keycol: pd.Categorical(['a', 'b', None, 'a'])})
+        Conv = self.create_ColumnConversions_class(df)
+        series = Conv.map_values(keycol, {'a': 'x', 'b': 'x'},
+                                 inplace=False, return_series=True)
+        self.assertEqual(series.dtype, 'category')
+        self.assertEqual(list(series.cat.categories), ['x'])
+        self.assertEqual(series.isnull().sum(), 1)
+
     def test_map_column_names_inplace(self):
         """ensure map_column_names accurately maps names inplace"""
         df = make_dirty_numeric_dataframe()
@@ -255,6 +455,59 @@ class ColumnConversionsMixinTests(TestCase):
                 inplace=True,
             )
 
+    def test_apply_function_vectorized(self):
+        """ensure apply_function passes whole columns when vectorized"""
+        colname_list = ['col1', 'col2']
+        df = make_twocol_dataframe(colname_list[0], colname_list[1])
+        Conv = self.create_ColumnConversions_class(df)
+        calls = []
+
+        def test_func(col1, col2):
+            calls.append(len(col1))
+            return col1.to_numpy() + col2.to_numpy()
+
+        series = Conv.apply_function(
+            colname_list,
+            target_column='col3',
+            function=test_func,
+            return_series=True,
+            vectorized=True,
+        )
+        self.assertEqual(calls, [len(df)])
+        pd.testing.assert_series_equal(
+            series, df[colname_list].sum(axis=1), check_names=False,
+        )
+        self.assertTrue(Conv.df['col3'].equals(series))
+
+    def test_apply_function_jobs(self):
+        """ensure apply_function joins process results in row order"""
+        colname_list = ['col1', 'col2']
+        df = make_twocol_dataframe(colname_list[0], colname_list[1])
+        Conv = self.create_ColumnConversions_class(df)
+        series = Conv.apply_function(
+            colname_list,
+            target_column=None,
+            function=sum,
+            inplace=False,
+            return_series=True,
+            jobs=2,
+            axis=1,
+        )
+        pd.testing.assert_series_equal(series, df[colname_list].sum(axis=1))
+        series = Conv.apply_function(
+            colname_list,
+            target_column=None,
+            function=np.add,
+            inplace=False,
+            return_series=True,
+            vectorized=True,
+            jobs=2,
+        )
+        pd.testing.assert_series_equal(series, df[colname_list].sum(axis=1))
+        with self.assertRaises(ValueError):
+            Conv.apply_function(colname_list, function=sum,
+                                target_column=None, inplace=False, jobs=2)
+
     def test_add_column(self):
         """ensure add_column appends new column to self.df"""
         colname_list = ['col1', 'col2', 'col3']
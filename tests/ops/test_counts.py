@@ -0,0 +1,123 @@
+"""
+Unittests for basedata.ops.counts submodule
+"""
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from basedata.ops.counts import ExactCounter, HyperLogLog, SpaceSaving,\
+    count_chunks, count_series
+
+
+def make_skewed_series(rows=20000, seed=0):
+    """returns series of string codes with a few heavy hitters"""
+    rng = np.random.default_rng(seed)
+    series = pd.Series(
+        (rng.zipf(1.5, rows) % 5000).astype(str),
+        name='code',
+    )
+    series[::20] = np.nan
+    return series
+
+
+class ExactCounterTests(TestCase):
+    """unittests for counts.ExactCounter class"""
+
+    def test_count_series_matches_value_counts(self):
+        """ensure chunked counts equal value_counts of the whole series"""
+        series = make_skewed_series()
+        counts = count_series(series, ExactCounter(), chunksize=3000).result()
+        expected = series.value_counts(dropna=False)
+        self.assertEqual(counts.name, 'code')
+        self.assertEqual(len(counts), len(expected))
+        self.assertTrue((counts.reindex(expected.index) == expected).all())
+
+    def test_merge(self):
+        """ensure partial counts of separate chunks merge exactly"""
+        series = make_skewed_series()
+        first, second = ExactCounter(dropna=True), ExactCounter(dropna=True)
+        first.update(series.iloc[:5000])
+        second.update(series.iloc[5000:])
+        first.merge(second)
+        pd.testing.assert_series_equal(
+            first.result().sort_index(),
+            series.value_counts().sort_index(),
+        )
+        self.assertEqual(first.total, len(series))
+
+
+class SpaceSavingTests(TestCase):
+    """unittests for counts.SpaceSaving class"""
+
+    def test_error_bound(self):
+        """ensure estimates bound true counts within the stated errors"""
+        series = make_skewed_series()
+        counter = count_series(series, SpaceSaving(k=50), chunksize=1000)
+        counts = counter.result()
+        expected = series.value_counts(dropna=False)
+        overestimate = counts - expected.reindex(counts.index)
+        self.assertEqual(len(counts), 50)
+        self.assertTrue((overestimate >= 0).all())
+        self.assertTrue(
+            (overestimate <= counter.errors.reindex(counts.index)).all()
+        )
+        self.assertTrue((counter.errors <= counter.error_bound).all())
+        heavy = expected[expected > counter.error_bound].index
+        self.assertTrue(heavy.isin(counts.index).all())
+
+    def test_merge(self):
+        """ensure merged summaries keep the heavy hitters of every chunk"""
+        series = make_skewed_series()
+        counters = [
+            count_series(series.iloc[i::3], SpaceSaving(k=50), 1000)
+            for i in range(3)
+        ]
+        for other in counters[1:]:
+            counters[0].merge(other)
+        counts = counters[0].result()
+        expected = series.value_counts(dropna=False)
+        self.assertEqual(counters[0].total, len(series))
+        self.assertTrue((counts >= expected.reindex(counts.index)).all())
+        self.assertEqual(list(counts.index[:3]), list(expected.index[:3]))
+
+
+class HyperLogLogTests(TestCase):
+    """unittests for counts.HyperLogLog class"""
+
+    def test_small_cardinality(self):
+        """ensure small distinct counts are estimated almost exactly"""
+        counter = HyperLogLog()
+        counter.update(pd.Series(np.arange(100)).astype(str))
+        counter.update(pd.Series([np.nan, '5']))
+        self.assertEqual(counter.result(), 100)
+
+    def test_large_cardinality_merge(self):
+        """ensure merged estimates are within 4 standard errors"""
+        first, second = HyperLogLog(precision=12), HyperLogLog(precision=12)
+        first.update(pd.Series(np.arange(0, 150000)))
+        second.update(pd.Series(np.arange(100000, 300000)))
+        first.merge(second)
+        self.assertLess(
+            abs(first.result() / 300000 - 1),
+            4 * first.relative_error,
+        )
+        with self.assertRaises(ValueError):
+            first.merge(HyperLogLog(precision=10))
+
+    def test_invalid_precision(self):
+        """ensure unsupported precisions raise ValueError"""
+        with self.assertRaises(ValueError):
+            HyperLogLog(precision=20)
+
+
+class CountChunksTests(TestCase):
+    """unittests for counts.count_chunks function"""
+
+    def test_count_chunks_jobs(self):
+        """ensure chunks counted in worker processes merge exactly"""
+        series = make_skewed_series()
+        chunks = [series.iloc[i:i + 4000] for i in range(0, len(series), 4000)]
+        counts = count_chunks(chunks, ExactCounter(), jobs=2).result()
+        expected = series.value_counts(dropna=False)
+        self.assertTrue((counts.reindex(expected.index) == expected).all())
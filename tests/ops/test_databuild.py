@@ -74,12 +74,16 @@ def make_dataframe(dicts_list):
 
 
 def save_dataframe(dataframe, filename, **to_kwargs):
-    """saves df to file, type is either csv or xlsx based on extension"""
+    """saves df to file, type is csv, excel, or columnar based on extension"""
     _, ext = os.path.splitext(filename)
     if ext == '.csv':
         dataframe.to_csv(filename, index=False, **to_kwargs)
     elif ext in ('.xls', '.xlsx'):
         dataframe.to_excel(filename, index=False, **to_kwargs)
+    elif ext == '.parquet':
+        dataframe.to_parquet(filename, index=False, **to_kwargs)
+    elif ext in ('.feather', '.arrow'):
+        dataframe.to_feather(filename, **to_kwargs)
 
 
 def make_simple_dataframe():
@@ -0,0 +1,84 @@
+"""
+Unittests for basedata.ops.dates submodule
+"""
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from basedata.ops import BaseDataOps
+from basedata.ops.dates import detect_formats, format_pattern,\
+    parse_datetimes
+from test_databuild import make_dirty_datetime_dataframe
+
+
+keycol = 'test'
+
+
+class DatesFunctionsTests(TestCase):
+    """unittests for functions located in dates submodule"""
+
+    def test_format_pattern(self):
+        """ensure format patterns match only exact strings"""
+        pattern = format_pattern('%Y-%m-%d')
+        self.assertTrue(pattern.fullmatch('2010-1-05'))
+        self.assertFalse(pattern.fullmatch('2010-10-10 10:00'))
+
+    def test_detect_formats(self):
+        """ensure formats are ordered by the share of values they parse"""
+        values = np.array(
+            ['13/01/2010', '14/01/2010', '01/15/2010', '2010-01-01', 'test'],
+            dtype=object,
+        )
+        self.assertEqual(
+            detect_formats(values),
+            ['%d/%m/%Y', '%Y-%m-%d', '%m/%d/%Y'],
+        )
+
+    def test_parse_datetimes(self):
+        """ensure mixed values are parsed and reported by format"""
+        series = pd.Series(
+            ['2010-10-10', '2010-10-10', '10/11/2010', 0, 'test', np.nan]
+        )
+        result, report = parse_datetimes(series, epoch_unit='s')
+        self.assertEqual(
+            result[:4].tolist(),
+            [pd.Timestamp('2010-10-10')] * 2
+            + [pd.Timestamp('2010-10-11'), pd.Timestamp('1970-01-01')],
+        )
+        self.assertTrue(result[4:].isnull().all())
+        self.assertEqual(
+            report['rows'].to_dict(),
+            {'%Y-%m-%d': 2, '%m/%d/%Y': 1, 'epoch': 1, 'unparsed': 1,
+             'missing': 1},
+        )
+
+    def test_parse_datetimes_timezones(self):
+        """ensure values holding timezones are not combined"""
+        series = pd.Series(['2010-10-10T10:00:00+01:00', '2010-10-10'])
+        self.assertIsNone(parse_datetimes(series))
+
+
+class DatesOperationsTests(TestCase):
+    """unittests for BaseDataOps datetime conversions"""
+
+    def test_to_datetime_matches_pandas(self):
+        """ensure to_datetime matches pandas.to_datetime and saves report"""
+        df = make_dirty_datetime_dataframe(keycol)
+        Base = BaseDataOps.from_object(df)
+        Base.to_datetime(keycol)
+        self.assertEqual(
+            pd.testing.assert_series_equal(
+                pd.to_datetime(df[keycol], errors='coerce'),
+                Base.df[keycol],
+            ),
+            None,
+        )
+        self.assertEqual(Base.dateformats[keycol]['rows'].sum(), len(df))
+
+    def test_to_datetime_categorical(self):
+        """ensure categorical columns stay categorical"""
+        df = pd.DataFrame({keycol: ['2010-10-10', '2011-11-11'] * 5})
+        Base = BaseDataOps.from_object(df.astype('category'))
+        Base.to_datetime(keycol)
+        self.assertEqual(Base.df[keycol].dtype, 'category')
@@ -5,6 +5,7 @@ import os
 from unittest import TestCase
 from tempfile import TemporaryDirectory
 
+import numpy as np
 import pandas as pd
 
 from basedata.ops.ids import DedupeMixin, ValidIDsMixin
@@ -127,6 +128,21 @@ class ValidIDsMixinTests(TestCase):
         series = Valid.strip_nonnumeric(keycol, return_series=True)
         self.assertIsInstance(series, pd.Series)
 
+    def test_strip_nonnumeric_column_list(self):
+        """ensure strip_nonnumeric converts a list of columns in parallel"""
+        Valid = self.create_ValidIDs_class()
+        Valid.df['other'] = Valid.df[keycol].copy()
+        expected = Valid.strip_nonnumeric(
+            keycol, inplace=False, return_series=True,
+        )
+        df = Valid.strip_nonnumeric([keycol, 'other'], jobs=2,
+                                    return_series=True)
+        self.assertEqual(list(df.columns), [keycol, 'other'])
+        pd.testing.assert_series_equal(Valid.df[keycol], expected)
+        pd.testing.assert_series_equal(
+            Valid.df['other'], expected, check_names=False,
+        )
+
     def test_report_offlenIDs(self):
         """ensure report_offlenIDs returns accurate value_counts series"""
         Valid = self.create_ValidIDs_class()
@@ -157,6 +173,64 @@ class ValidIDsMixinTests(TestCase):
             return_series=True)
         self.assertIsInstance(series, pd.Series)
 
+    def test_offlenIDs_numeric(self):
+        """ensure numeric ID lengths are counted as integer digits"""
+        Valid = ValidIDsMixin()
+        Valid.df = pd.DataFrame({
+            'ints': [12345678, -1234567, 123, 99999999],
+            'floats': [12345678.0, np.nan, 1234567.5, 99999999.0],
+        })
+        self.assertEqual(
+            list(Valid.report_offlenIDs('ints', target_len=8).index),
+            [123],
+        )
+        self.assertEqual(
+            Valid.report_offlenIDs('floats', target_len=8).sum(),
+            4,
+        )
+        self.assertEqual(
+            Valid.report_offlenIDs(
+                'floats', target_len=8, integral_floats=True,
+            ).sum(),
+            2,
+        )
+        series = Valid.remove_offlenIDs(
+            'floats', target_len=8, inplace=False, return_series=True,
+        )
+        self.assertTrue(series.isnull().all())
+        series = Valid.remove_offlenIDs(
+            'floats', target_len=8, inplace=False, return_series=True,
+            integral_floats=True,
+        )
+        self.assertEqual(series.tolist()[::3], ['12345678', '99999999'])
+        Valid.remove_offlenIDs('ints', target_len=8, val_new='bad')
+        self.assertEqual(
+            Valid.df['ints'].tolist(),
+            ['12345678', 'bad', 'bad', '99999999'],
+        )
+
+    def test_offlenIDs_floats_baseline(self):
+        """ensure float IDs are measured as written by default"""
+        Valid = ValidIDsMixin()
+        Valid.df = pd.DataFrame({
+            'floats': [12345678.0, np.nan, 1234567.5, 123456.0, 1e20],
+        })
+        report = Valid.df['floats'].loc[
+            Valid.df['floats'].astype(str).str.len() != 10
+        ].value_counts(dropna=False)
+        pd.testing.assert_series_equal(
+            Valid.report_offlenIDs('floats', target_len=10),
+            report,
+        )
+        series = Valid.remove_offlenIDs(
+            'floats', target_len=8, pattern='[0-9.]', val_new='bad',
+            inplace=False, return_series=True,
+        )
+        self.assertEqual(
+            series.tolist(),
+            ['bad', 'bad', 'bad', '123456.0', 'bad'],
+        )
+
     def test_replace_blankIDs(self):
         """ensure blank ids are replaced with values from target column"""
         test_col, test_val, target_len = 'test', 'test', 8
@@ -183,6 +257,37 @@ class ValidIDsMixinTests(TestCase):
         )
         self.assertIsInstance(series, pd.Series)
 
+    def test_replace_blankIDs_coalesce(self):
+        """ensure blank ids are coalesced from columns in order"""
+        Valid = ValidIDsMixin()
+        Valid.df = pd.DataFrame({
+            'primary': ['a', np.nan, np.nan, np.nan],
+            'legacy': ['b', 'b', np.nan, np.nan],
+            'external': ['c', 'c', 'c', np.nan],
+        })
+        Valid.replace_blankIDs('primary', ['legacy', 'external'])
+        self.assertEqual(Valid.df['primary'].tolist()[:3], ['a', 'b', 'c'])
+        self.assertTrue(pd.isnull(Valid.df['primary'][3]))
+        self.assertEqual(
+            Valid.fillcounts['primary'].to_dict(),
+            {'legacy': 1, 'external': 1},
+        )
+
+    def test_replace_blankIDs_categorical(self):
+        """ensure categorical ID and replacement columns are filled"""
+        Valid = ValidIDsMixin()
+        Valid.df = pd.DataFrame({
+            'primary': pd.Categorical(['a', np.nan, np.nan, 'b']),
+            'legacy': pd.Categorical(['x', 'c', 'a', np.nan]),
+            'external': ['e', 'e', 'e', 'e'],
+            'numbers': [1.0, np.nan, np.nan, 2.0],
+        })
+        Valid.replace_blankIDs('primary', ['legacy', 'external'])
+        self.assertEqual(Valid.df['primary'].tolist(), ['a', 'c', 'a', 'b'])
+        self.assertEqual(Valid.df['primary'].dtype, 'category')
+        Valid.replace_blankIDs('numbers', 'legacy')
+        self.assertEqual(Valid.df['numbers'].tolist(), [1.0, 'c', 'a', 2.0])
+
     def test_drop_blankID_rows(self):
         """ensure blankID rows are dropped from dataframe and index reset"""
         target_len = 8
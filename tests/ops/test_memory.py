@@ -0,0 +1,97 @@
+"""
+Unittests for basedata.ops.memory submodule
+"""
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from basedata.ops import BaseDataOps
+from basedata.ops.memory import MemoryMixin, downcast_series,\
+    downcast_dataframe
+from test_databuild import make_dirty_numeric_dataframe
+
+
+def make_mixed_dataframe(n=100):
+    """builds dataframe with int, float, and repetitive string columns"""
+    return pd.DataFrame({
+        'ints': np.arange(n),
+        'floats': np.linspace(0, 1, n),
+        'halves': np.arange(n) / 2,
+        'codes': ['A', 'B', 'C', None] * (n // 4),
+        'strings': [str(i) for i in range(n)],
+    })
+
+
+class MemoryFunctionsTests(TestCase):
+    """unittests for functions located in memory submodule"""
+
+    def test_downcast_series_int(self):
+        """ensure integers are downcast to smallest signed type"""
+        series = downcast_series(pd.Series([-1, 0, 120]))
+        self.assertEqual(series.dtype, np.int8)
+
+    def test_downcast_series_float(self):
+        """ensure floats are downcast only when lossless"""
+        df = make_mixed_dataframe()
+        self.assertEqual(downcast_series(df['floats']).dtype, np.float64)
+        self.assertEqual(downcast_series(df['halves']).dtype, np.float32)
+
+    def test_downcast_series_strings(self):
+        """ensure only repetitive string columns become categoricals"""
+        df = make_mixed_dataframe()
+        self.assertEqual(downcast_series(df['codes']).dtype, 'category')
+        self.assertEqual(downcast_series(df['strings']).dtype, object)
+        mixed = make_dirty_numeric_dataframe()['test']
+        self.assertIs(downcast_series(mixed, categorical_ratio=1), mixed)
+
+    def test_downcast_dataframe(self):
+        """ensure values are unchanged and memory report is accurate"""
+        df = make_mixed_dataframe()
+        df_test, report = downcast_dataframe(df)
+        self.assertEqual(
+            pd.testing.assert_frame_equal(
+                df, df_test,
+                check_dtype=False,
+                check_categorical=False,
+            ),
+            None,
+        )
+        self.assertCountEqual(report.index, df.columns)
+        self.assertTrue((report['bytes_after'] <= report['bytes_before']).all())
+        self.assertTrue(
+            np.shares_memory(df['strings'].values, df_test['strings'].values)
+        )
+
+    def test_downcast_dataframe_columns(self):
+        """ensure only specified columns are converted"""
+        df = make_mixed_dataframe()
+        df_test, report = downcast_dataframe(df, columns=['ints'])
+        self.assertEqual(list(report.index), ['ints'])
+        self.assertEqual(df_test['codes'].dtype, object)
+
+
+class MemoryMixinTests(TestCase):
+    """unittests for memory.MemoryMixin class"""
+
+    def test_optimize_memory(self):
+        """ensure optimize_memory converts self.df and saves report"""
+        Memory = MemoryMixin()
+        Memory.df = make_mixed_dataframe()
+        report = Memory.optimize_memory()
+        self.assertIs(report, Memory.memory_report)
+        self.assertEqual(Memory.df['ints'].dtype, np.int8)
+
+    def test_from_object_optimize_dtypes(self):
+        """ensure from_object optimize_dtypes converts input df"""
+        Base = BaseDataOps.from_object(
+            make_mixed_dataframe(),
+            copy_input=True,
+            optimize_dtypes=True,
+        )
+        self.assertEqual(Base.df['codes'].dtype, 'category')
+        self.assertEqual(Base.input_df['codes'].dtype, 'category')
+        self.assertIsInstance(Base.memory_report, pd.DataFrame)
+        self.assertFalse(hasattr(BaseDataOps.from_object(
+            make_mixed_dataframe()
+        ), 'memory_report'))
@@ -0,0 +1,69 @@
+"""
+Unittests for basedata.ops.numeric submodule
+"""
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from basedata.ops.numeric import number_pattern, parse_number,\
+    parse_numbers
+
+
+class NumericFunctionsTests(TestCase):
+    """unittests for functions located in numeric submodule"""
+
+    def test_parse_number(self):
+        """ensure separators, currency, percent, and parentheses are parsed"""
+        pattern = number_pattern()
+        values = ['12,400', '15,987.00', '$1,234.50', '(1,234)', '-$3',
+                  '12.5%', '.5']
+        self.assertEqual(
+            [parse_number(val, pattern) for val in values],
+            [12400.0, 15987.0, 1234.5, -1234.0, -3.0, 0.125, 0.5],
+        )
+
+    def test_parse_number_invalid(self):
+        """ensure malformed numbers are returned as numpy.nan"""
+        pattern = number_pattern()
+        for val in ['', 'test', '(5', '1,2,3', '1234,567', '$', '(-5)',
+                    '(+5)', '-$-5']:
+            self.assertTrue(np.isnan(parse_number(val, pattern)), val)
+
+    def test_parse_numbers_separators(self):
+        """ensure thousands and decimal separators may be swapped"""
+        series = parse_numbers(
+            pd.Series(['1.234,5', '(2.000)', '1,5%']),
+            thousands='.',
+            decimal=',',
+        )
+        self.assertEqual(series.tolist(), [1234.5, -2000.0, 0.015])
+
+    def test_parse_numbers_mixed(self):
+        """ensure plain numbers and non-string values are converted"""
+        series = parse_numbers(
+            pd.Series(['1e5', 7, 2.5, None, True, '12,400', '1_000'],
+                      dtype=object)
+        )
+        np.testing.assert_array_equal(
+            series.to_numpy(),
+            [1e5, 7.0, 2.5, np.nan, np.nan, 12400.0, np.nan],
+        )
+        self.assertTrue(np.isnan(
+            pd.to_numeric(pd.Series(['1_000']), errors='coerce')[0]
+        ))
+
+    def test_parse_numbers_numeric_unchanged(self):
+        """ensure numeric series are returned unchanged"""
+        series = pd.Series([1, 2, 3])
+        self.assertIs(parse_numbers(series), series)
+
+    def test_parse_numbers_categorical(self):
+        """ensure categorical series are converted to floats"""
+        series = parse_numbers(
+            pd.Series(['$1', '(2)', '$1', np.nan], dtype='category')
+        )
+        self.assertEqual(series.dtype, np.float64)
+        np.testing.assert_array_equal(
+            series.to_numpy(), [1.0, -2.0, 1.0, np.nan]
+        )
@@ -0,0 +1,194 @@
+"""
+Unittests for basedata.ops.plan submodule
+"""
+from unittest import TestCase
+
+import pandas as pd
+
+from basedata.ops import BaseDataOps
+from basedata.ops.plan import LazyDataOps, OperationPlan, describe_call,\
+    is_plan_operation
+from test_databuild import make_dirty_ids_dataframe
+
+
+keycol = 'ids'
+
+
+class PlanFunctionsTests(TestCase):
+    """unittests for misc functions located in plan submodule"""
+
+    def test_is_plan_operation(self):
+        """ensure only methods transforming self.df can be recorded"""
+        self.assertTrue(is_plan_operation(BaseDataOps, 'substitute_chars'))
+        self.assertTrue(is_plan_operation(BaseDataOps, 'drop_dupes'))
+        self.assertFalse(is_plan_operation(BaseDataOps, 'check_nonnumeric'))
+        self.assertFalse(is_plan_operation(BaseDataOps, 'lazy'))
+
+    def test_describe_call_reads_writes(self):
+        """ensure describe_call identifies columns read and written"""
+        step = describe_call(
+            BaseDataOps,
+            'replace_blankIDs',
+            (keycol, 'other'),
+            {'target_column': 'new'},
+        )
+        self.assertEqual(step.reads, {keycol, 'other'})
+        self.assertEqual(step.writes, {'new'})
+        self.assertFalse(step.barrier)
+
+    def test_describe_call_column_list(self):
+        """ensure describe_call identifies lists of columns"""
+        step = describe_call(
+            BaseDataOps,
+            'to_numeric',
+            (['a', 'b'],),
+            {'target_column': ['c', 'd']},
+        )
+        self.assertEqual(step.reads, {'a', 'b'})
+        self.assertEqual(step.writes, {'c', 'd'})
+
+    def test_describe_call_str_column_list(self):
+        """ensure a str column_list is read as a single column"""
+        step = describe_call(BaseDataOps, 'apply_function',
+                             (keycol, len, 'b'), {})
+        self.assertEqual(step.reads, {keycol})
+
+    def test_describe_call_var_kwargs(self):
+        """ensure describe_call flattens method **kwargs into arguments"""
+        step = describe_call(
+            BaseDataOps,
+            'apply_function',
+            (['a'], len, 'b'),
+            {'axis': 1},
+        )
+        self.assertEqual(step.arguments['axis'], 1)
+        self.assertEqual(step.writes, {'b'})
+
+
+class OperationPlanTests(TestCase):
+    """unittests for plan.OperationPlan class"""
+
+    def test_optimize_fuses_column_steps(self):
+        """ensure consecutive steps on one column are fused"""
+        plan = OperationPlan(BaseDataOps)
+        plan.add('substitute_chars', (keycol, '[-]', ''), {})
+        plan.add('add_column', ('other', 1), {})
+        plan.add('strip_nonnumeric', (keycol,), {})
+        groups = plan.optimize()
+        self.assertEqual(len(groups), 2)
+        self.assertEqual(
+            [step.name for step in groups[0]],
+            ['substitute_chars', 'strip_nonnumeric'],
+        )
+
+    def test_optimize_drops_overwritten_steps(self):
+        """ensure steps overwritten before they are read are dropped"""
+        plan = OperationPlan(BaseDataOps)
+        plan.add('add_column', ('other', 1), {})
+        plan.add('to_numeric', (keycol,), {'inplace': False})
+        plan.add('add_column', ('other', 2), {})
+        groups = plan.optimize()
+        self.assertEqual(len(groups), 1)
+        self.assertEqual(groups[0][0].arguments['value'], 2)
+
+    def test_optimize_keeps_read_steps(self):
+        """ensure steps read by later steps are kept"""
+        plan = OperationPlan(BaseDataOps)
+        plan.add('add_column', ('other', 1), {})
+        plan.add('replace_blankIDs', (keycol, 'other'), {})
+        plan.add('add_column', ('other', 2), {})
+        self.assertEqual(len(plan.optimize()), 3)
+
+    def test_optimize_str_column_list_not_reordered(self):
+        """ensure column steps are not grouped across a step reading them"""
+        plan = OperationPlan(BaseDataOps)
+        plan.add('substitute_chars', (keycol, '[-]', ''), {})
+        plan.add('apply_function', (keycol, len, 'other'), {})
+        plan.add('strip_nonnumeric', (keycol,), {})
+        self.assertEqual(
+            [[step.name for step in group] for group in plan.optimize()],
+            [['substitute_chars'], ['apply_function'], ['strip_nonnumeric']],
+        )
+
+    def test_add_return_series_fail(self):
+        """ensure steps returning a series cannot be recorded"""
+        plan = OperationPlan(BaseDataOps)
+        with self.assertRaises(ValueError):
+            plan.add('to_numeric', (keycol,), {'return_series': True})
+
+    def test_explain(self):
+        """ensure explain describes fused and dropped steps"""
+        plan = OperationPlan(BaseDataOps)
+        plan.add('substitute_chars', (keycol, '[-]', ''), {})
+        plan.add('strip_nonnumeric', (keycol,), {})
+        plan.add('to_numeric', (keycol,), {'inplace': False})
+        explain = plan.explain()
+        self.assertIn("steps on column 'ids', run against a single column",
+                      explain)
+        self.assertIn('1 steps dropped as unused', explain)
+
+
+class LazyDataOpsTests(TestCase):
+    """unittests for plan.LazyDataOps class"""
+
+    def test_lazy_returns_lazydataops(self):
+        """ensure lazy invokes LazyDataOps without changing self.df"""
+        df = make_dirty_ids_dataframe(keycol)
+        Base = BaseDataOps.from_object(df)
+        lazy = Base.lazy().strip_nonnumeric(keycol)
+        self.assertIsInstance(lazy, LazyDataOps)
+        self.assertEqual(
+            pd.testing.assert_frame_equal(df, Base.df),
+            None,
+        )
+
+    def test_lazy_invalid_operation(self):
+        """ensure non-transforming methods cannot be recorded"""
+        Base = BaseDataOps.from_object(make_dirty_ids_dataframe(keycol))
+        with self.assertRaises(AttributeError):
+            Base.lazy().report_values(keycol)
+
+    def test_collect_matches_eager(self):
+        """ensure collected plan matches the same steps run eagerly"""
+        df = make_dirty_ids_dataframe(keycol)
+        Lazy = BaseDataOps.from_object(df)
+        lazy = Lazy.lazy()
+        lazy.substitute_chars(keycol, '[ ]', '')
+        lazy.add_column('other', 'x')
+        lazy.strip_nonnumeric(keycol)
+        lazy.remove_offlenIDs(keycol, target_len=8)
+        lazy.replace_blankIDs(keycol, 'other')
+        lazy.drop_blankID_rows(keycol)
+        Lazy = lazy.collect()
+
+        Eager = BaseDataOps.from_object(df)
+        Eager.substitute_chars(keycol, '[ ]', '')
+        Eager.add_column('other', 'x')
+        Eager.strip_nonnumeric(keycol)
+        Eager.remove_offlenIDs(keycol, target_len=8)
+        Eager.replace_blankIDs(keycol, 'other')
+        Eager.drop_blankID_rows(keycol)
+        self.assertEqual(
+            pd.testing.assert_frame_equal(Lazy.df, Eager.df),
+            None,
+        )
+        self.assertEqual(lazy.plan.steps, [])
+
+    def test_collect_saves_dateformats(self):
+        """ensure date format reports of fused to_datetime steps are saved"""
+        df = pd.DataFrame({keycol: ['2010/10/10', '2011/11/11', 'x'] * 3})
+        Lazy = BaseDataOps.from_object(df)
+        lazy = Lazy.lazy()
+        lazy.substitute_chars(keycol, '[/]', '-')
+        lazy.to_datetime(keycol)
+        Lazy = lazy.collect()
+
+        Eager = BaseDataOps.from_object(df)
+        Eager.substitute_chars(keycol, '[/]', '-')
+        Eager.to_datetime(keycol)
+        self.assertEqual(
+            pd.testing.assert_frame_equal(
+                Lazy.dateformats[keycol], Eager.dateformats[keycol],
+            ),
+            None,
+        )
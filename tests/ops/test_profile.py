@@ -0,0 +1,110 @@
+"""
+Unittests for basedata.ops.profile submodule
+"""
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from basedata.ops import BaseDataOps
+from basedata.ops.profile import ProfileMixin, profile_series, value_lengths
+from test_databuild import make_dirty_numeric_dataframe
+
+
+keycol = 'test'
+
+
+def make_profile_dataframe():
+    """builds dataframe with ID, date string, float, and code columns"""
+    return pd.DataFrame({
+        'ids': ['12345678', '1234567', '12345678', 'A1234567', None, 'x'],
+        'dates': ['2010-10-10', '2010-10-11', 'test', None, '2010-10-10',
+                  '2011-01-01'],
+        'floats': [12345678.0, 1.5, np.nan, 12345678.0, 2.0, 3.0],
+        'codes': pd.Categorical(['a', 'b', 'a', 'a', None, 'b']),
+    })
+
+
+class ProfileFunctionsTests(TestCase):
+    """unittests for functions located in profile submodule"""
+
+    def test_value_lengths(self):
+        """ensure lengths are measured as by report_offlenIDs"""
+        np.testing.assert_array_equal(
+            value_lengths(pd.Series([12345678.0, 1.5, -12.0])),
+            [10, 3, 5],
+        )
+        np.testing.assert_array_equal(
+            value_lengths(pd.Series(['abc', 12, None], dtype=object)),
+            [3, 2, 4],
+        )
+
+    def test_profile_series_ids(self):
+        """ensure ID column signals match the per-method reports"""
+        series = make_profile_dataframe()['ids']
+        profile = profile_series(series)
+        self.assertEqual(profile['rows'], 6)
+        self.assertEqual(profile['nulls'], 1)
+        self.assertEqual(profile['cardinality'], 4)
+        self.assertEqual(profile['duplicate_keys'], 1)
+        self.assertEqual(profile['duplicate_rows'], 2)
+        self.assertAlmostEqual(profile['nonnumeric_share'], 0.4)
+        self.assertEqual(profile['lengths'], {1: 1, 7: 1, 8: 3})
+        self.assertEqual(
+            (profile['min_length'], profile['max_length']), (1, 8),
+        )
+
+    def test_profile_series_dates(self):
+        """ensure non-datetime shares exclude missing values"""
+        profile = profile_series(make_profile_dataframe()['dates'])
+        self.assertAlmostEqual(profile['nondatetime_share'], 0.2)
+        self.assertEqual(profile['nonnumeric_share'], 1.0)
+
+    def test_profile_series_mixed_types(self):
+        """ensure equal values of different types are profiled separately"""
+        series = pd.Series([1, '1', 1.0, True, None], dtype=object)
+        profile = profile_series(series)
+        self.assertEqual(profile['cardinality'], 4)
+        self.assertEqual(profile['duplicate_keys'], 0)
+        self.assertAlmostEqual(profile['nonnumeric_share'], 0.25)
+        self.assertEqual(profile['lengths'], {1: 2, 3: 1, 4: 1})
+        profile = profile_series(pd.Series(['a', 0.0, -0.0], dtype=object))
+        self.assertEqual(profile['cardinality'], 3)
+        self.assertEqual(profile['lengths'], {1: 1, 3: 1, 4: 1})
+
+        Base = BaseDataOps(pd.DataFrame({keycol: series}), False)
+        check = Base.check_nonnumeric(keycol, dropna=True)
+        self.assertEqual(check.sum() / series.notnull().sum(), 0.25)
+        offlen = Base.report_offlenIDs(keycol, target_len=4, dropna=True)
+        self.assertEqual(offlen.sum(), 3)
+
+    def test_profile_series_empty(self):
+        """ensure shares of columns without values are missing"""
+        profile = profile_series(pd.Series([None, None], dtype=object))
+        self.assertEqual(profile['nulls'], 2)
+        self.assertTrue(np.isnan(profile['nonnumeric_share']))
+        self.assertEqual(profile['lengths'], {})
+
+
+class ProfileMixinTests(TestCase):
+    """unittests for ProfileMixin class methods"""
+
+    def test_profile(self):
+        """ensure profile reports every column and saves the report"""
+        Profile = ProfileMixin()
+        Profile.df = make_profile_dataframe()
+        report = Profile.profile(jobs=2)
+        self.assertIs(report, Profile.profile_report)
+        self.assertEqual(list(report.index), list(Profile.df.columns))
+        self.assertEqual(report.loc['floats', 'nonnumeric_share'], 0)
+        self.assertEqual(report.loc['codes', 'duplicate_rows'], 5)
+
+    def test_profile_matches_checks(self):
+        """ensure profile counts the values reported by check_nonnumeric"""
+        Base = BaseDataOps(make_dirty_numeric_dataframe(keycol), False)
+        report = Base.profile([keycol])
+        check = Base.check_nonnumeric(keycol, dropna=True)
+        self.assertAlmostEqual(
+            report.loc[keycol, 'nonnumeric_share'],
+            check.sum() / Base.df[keycol].notnull().sum(),
+        )
@@ -0,0 +1,159 @@
+"""
+Unittests for basedata.ops.shared submodule
+"""
+import os
+import sys
+from unittest import TestCase, mock
+
+import numpy as np
+import pandas as pd
+
+from basedata.ops import BaseDataOps
+from basedata.ops.shared import (
+    SharedSeries,
+    import_shared_memory,
+    is_shared_operation,
+    share_series,
+)
+from test_databuild import make_dirty_numeric_dataframe
+
+
+def list_shared_blocks():
+    """lists the names of shared memory blocks, where they can be listed"""
+    if not os.path.isdir('/dev/shm'):
+        return set()
+    return set(os.listdir('/dev/shm'))
+
+
+def make_shared_dataframe():
+    """builds dataframe with string, float, datetime, and mixed columns"""
+    return pd.DataFrame({
+        'ids': ['1x2', 'a34', None, '5-6', 'é78', ''] * 3,
+        'floats': ['1.5', '2', 'x', None, '-3', '4e2'] * 3,
+        'values': np.arange(18, dtype=np.float64),
+        'dates': pd.date_range('2010-10-10', periods=18),
+        'mixed': [1, 'a', None, 2.5, 'b', 3] * 3,
+    })
+
+
+class SharedFunctionsTests(TestCase):
+    """unittests for functions located in shared submodule"""
+
+    def test_import_shared_memory_missing(self):
+        """ensure run_shared fails clearly without shared_memory support"""
+        import multiprocessing.shared_memory
+        saved = multiprocessing.shared_memory
+        del multiprocessing.shared_memory
+        try:
+            with mock.patch.dict(
+                sys.modules, {'multiprocessing.shared_memory': None},
+            ):
+                with self.assertRaises(ImportError):
+                    import_shared_memory()
+                Base = BaseDataOps(make_shared_dataframe(), False)
+                with self.assertRaises(ImportError):
+                    Base.run_shared('strip_nonnumeric', 'ids')
+        finally:
+            multiprocessing.shared_memory = saved
+
+    def setUp(self):
+        """set up blocks listed before each test"""
+        self.blocks = list_shared_blocks()
+
+    def tearDown(self):
+        """ensure no shared memory blocks are leaked by the test"""
+        self.assertEqual(list_shared_blocks(), self.blocks)
+
+    def test_share_series(self):
+        """ensure shared series are read back by row range"""
+        df = make_shared_dataframe()
+        kinds = {
+            'ids': 'strings',
+            'floats': 'strings',
+            'values': 'array',
+            'dates': 'array',
+            'mixed': 'pickled',
+        }
+        for column, kind in kinds.items():
+            descriptor = share_series(df[column])
+            self.assertEqual(descriptor['kind'], kind)
+            shared = SharedSeries(descriptor)
+            values = shared.values(4, 11)
+            pd.testing.assert_series_equal(
+                pd.Series(values, index=range(4, 11), name=column),
+                df[column].iloc[4:11],
+            )
+            del values
+            shared.unlink()
+
+    def test_is_shared_operation(self):
+        """ensure only single column conversions can be run"""
+        self.assertTrue(is_shared_operation(BaseDataOps, 'to_numeric'))
+        self.assertTrue(is_shared_operation(BaseDataOps, 'strip_nonnumeric'))
+        for name in ['drop_dupes', 'drop_blankID_rows', 'map_column_names',
+                     'add_column', 'report_dupes', 'apply_function']:
+            self.assertFalse(is_shared_operation(BaseDataOps, name))
+
+
+class SharedMemoryMixinTests(TestCase):
+    """unittests for SharedMemoryMixin methods"""
+
+    def setUp(self):
+        """set up serial and shared instances of the same dataframe"""
+        self.blocks = list_shared_blocks()
+        self.serial = BaseDataOps(make_shared_dataframe(), False)
+        self.shared = BaseDataOps(make_shared_dataframe(), False)
+
+    def tearDown(self):
+        """ensure no shared memory blocks are leaked by the test"""
+        self.assertEqual(list_shared_blocks(), self.blocks)
+
+    def test_run_shared_columns(self):
+        """ensure columns converted in parallel match serial conversions"""
+        self.serial.to_numeric(['floats', 'values', 'mixed'])
+        self.shared.run_shared('to_numeric', ['floats', 'values', 'mixed'])
+        pd.testing.assert_frame_equal(self.shared.df, self.serial.df)
+
+    def test_run_shared_split_rows(self):
+        """ensure row ranges converted in parallel match serial conversions"""
+        self.serial.strip_nonnumeric(['ids', 'floats'])
+        self.shared.run_shared(
+            'strip_nonnumeric', ['ids', 'floats'], jobs=4, split_rows=True,
+        )
+        pd.testing.assert_frame_equal(self.shared.df, self.serial.df)
+
+    def test_run_shared_target_column(self):
+        """ensure results are written to their target columns"""
+        self.serial.strip_nonnumeric('ids', target_column='new_ids')
+        self.serial.to_numeric('floats', target_column='new_floats')
+        self.shared.run_shared('strip_nonnumeric', 'ids', split_rows=True,
+                               target_column='new_ids')
+        self.shared.run_shared('to_numeric', ['floats'], split_rows=True,
+                               target_column=['new_floats'])
+        pd.testing.assert_frame_equal(self.shared.df, self.serial.df)
+
+    def test_run_shared_dirty_numeric(self):
+        """ensure dirty numeric columns convert as they do serially"""
+        df = make_dirty_numeric_dataframe()
+        serial = BaseDataOps(df.copy(), False)
+        shared = BaseDataOps(df.copy(), False)
+        columns = list(serial.df.columns)
+        serial.to_numeric(columns)
+        shared.run_shared('to_numeric', columns, jobs=3, split_rows=True)
+        pd.testing.assert_frame_equal(shared.df, serial.df)
+
+    def test_run_shared_tracked(self):
+        """ensure tracked changes are recorded for each written column"""
+        tracked = BaseDataOps(make_shared_dataframe(), 'track')
+        tracked.run_shared('to_numeric', ['floats'], split_rows=True)
+        pd.testing.assert_frame_equal(
+            tracked.input_df, make_shared_dataframe(),
+        )
+
+    def test_run_shared_invalid(self):
+        """ensure rows removing and non-column operations are rejected"""
+        with self.assertRaises(ValueError):
+            self.shared.run_shared('drop_blankID_rows', 'ids')
+        with self.assertRaises(ValueError):
+            self.shared.run_shared('to_numeric', ['ids', 'floats'],
+                                   target_column=['new_ids'])
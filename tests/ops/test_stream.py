@@ -0,0 +1,139 @@
+"""
+Unittests for basedata.ops.stream submodule
+"""
+import os
+from unittest import TestCase
+from tempfile import TemporaryDirectory
+
+import pandas as pd
+
+from basedata.ops import BaseDataOps
+from basedata.ops.counts import HyperLogLog
+from basedata.ops.stream import ChunkedPipeline, is_chunk_operation
+from test_databuild import make_dirty_ids_dataframe, save_dataframe
+
+
+keycol = 'ids'
+
+
+class ChunkedPipelineTests(TestCase):
+    """unittests for stream.ChunkedPipeline class"""
+
+    def test_is_chunk_operation(self):
+        """ensure only chunk-safe methods are accepted"""
+        self.assertTrue(is_chunk_operation(BaseDataOps, 'strip_nonnumeric'))
+        self.assertTrue(is_chunk_operation(BaseDataOps, 'add_column'))
+        self.assertFalse(is_chunk_operation(BaseDataOps, 'drop_dupes'))
+        self.assertFalse(is_chunk_operation(BaseDataOps, 'report_values'))
+        self.assertFalse(is_chunk_operation(BaseDataOps, '_check_dupes'))
+
+    def test_stream_file_returns_pipeline(self):
+        """ensure stream_file invokes a ChunkedPipeline"""
+        with TemporaryDirectory() as tmp:
+            fp = os.path.join(tmp, 'test.csv')
+            save_dataframe(make_dirty_ids_dataframe(keycol), fp)
+            pipeline = BaseDataOps.stream_file(fp, chunksize=3)
+            self.assertIsInstance(pipeline, ChunkedPipeline)
+
+    def test_stream_file_fail(self):
+        """ensure stream_file fails elegantly with wrong filetype read"""
+        with self.assertRaises(TypeError):
+            BaseDataOps.stream_file('test.xlsx')
+
+    def test_record_invalid_operation(self):
+        """ensure non chunk-safe methods cannot be recorded"""
+        with TemporaryDirectory() as tmp:
+            fp = os.path.join(tmp, 'test.csv')
+            save_dataframe(make_dirty_ids_dataframe(keycol), fp)
+            pipeline = BaseDataOps.stream_file(fp)
+            with self.assertRaises(AttributeError):
+                pipeline.drop_dupes(keycol, [0])
+
+    def test_to_file_matches_in_memory(self):
+        """ensure chunked output matches the same steps run in memory"""
+        with TemporaryDirectory() as tmp:
+            fp = os.path.join(tmp, 'test.csv')
+            fp_save = os.path.join(tmp, 'test_save.csv')
+            fp_test = os.path.join(tmp, 'test_test.csv')
+            save_dataframe(make_dirty_ids_dataframe(keycol), fp)
+
+            pipeline = BaseDataOps.stream_file(fp, chunksize=3, dtype=str)
+            pipeline.strip_nonnumeric(keycol).drop_blankID_rows(keycol)
+            n_rows = pipeline.to_file(fp_save)
+
+            Base = BaseDataOps.from_file(fp, dtype=str)
+            Base.strip_nonnumeric(keycol)
+            Base.drop_blankID_rows(keycol)
+            Base.to_file(fp_test)
+
+            df_save, df_test = pd.read_csv(fp_save), pd.read_csv(fp_test)
+            self.assertEqual(n_rows, len(df_test))
+            self.assertEqual(
+                pd.testing.assert_frame_equal(df_save, df_test),
+                None,
+            )
+
+    def test_to_file_header_encoding(self):
+        """ensure header and encoding args apply to the whole target file"""
+        df = pd.DataFrame({'ids': ['1', '2', '3', '4'],
+                           'names': ['é', 'ü', 'ø', 'ß']})
+        with TemporaryDirectory() as tmp:
+            fp = os.path.join(tmp, 'test.csv')
+            fp_save = os.path.join(tmp, 'test_save.csv')
+            df.to_csv(fp, index=False)
+            pipeline = BaseDataOps.stream_file(fp, chunksize=3, dtype=str)
+            pipeline.to_file(fp_save, header=['id', 'name'],
+                             encoding='latin-1')
+            with open(fp_save, 'rb') as f:
+                self.assertEqual(
+                    f.read(),
+                    df.to_csv(index=False, header=['id', 'name'])
+                    .encode('latin-1'),
+                )
+            pipeline.to_file(fp_save, header=False)
+            self.assertEqual(len(pd.read_csv(fp_save, header=None)), 4)
+
+    def test_to_file_compressed(self):
+        """ensure compressed input is read and compressed output written"""
+        df = make_dirty_ids_dataframe(keycol)
+        with TemporaryDirectory() as tmp:
+            fp = os.path.join(tmp, 'test.csv.gz')
+            df.to_csv(fp, index=False)
+            pipeline = BaseDataOps.stream_file(fp, chunksize=3, dtype=str)
+            pipeline.strip_nonnumeric(keycol)
+            for filename, kwargs in [
+                ('test_save.csv.gz', {}),
+                ('test_save.csv', {'compression': 'bz2'}),
+            ]:
+                fp_save = os.path.join(tmp, filename)
+                n_rows = pipeline.to_file(fp_save, **kwargs)
+                df_save = pd.read_csv(
+                    fp_save, dtype=str,
+                    compression=kwargs.get('compression', 'infer'),
+                )
+                self.assertEqual(n_rows, len(df))
+                self.assertEqual(
+                    df_save[keycol].tolist(),
+                    pipeline.apply_steps(pd.read_csv(fp, dtype=str))[keycol]
+                    .tolist(),
+                )
+            with self.assertRaises(ValueError):
+                pipeline.to_file(os.path.join(tmp, 'test_save.csv.xz'))
+
+    def test_count_values(self):
+        """ensure count_values counts transformed values chunk by chunk"""
+        df = make_dirty_ids_dataframe(keycol)
+        with TemporaryDirectory() as tmp:
+            fp = os.path.join(tmp, 'test.csv')
+            save_dataframe(df, fp)
+            pipeline = BaseDataOps.stream_file(fp, chunksize=3,
+                                               dtype={keycol: str})
+            pipeline.strip_nonnumeric(keycol)
+            counts = pipeline.count_values(keycol).result()
+            Base = BaseDataOps.from_file(fp, dtype={keycol: str})
+            Base.strip_nonnumeric(keycol)
+            distinct = pipeline.count_values(keycol, HyperLogLog()).result()
+        expected = Base.df[keycol].value_counts(dropna=False)
+        self.assertEqual(len(counts), len(expected))
+        self.assertTrue((counts.reindex(expected.index) == expected).all())
+        self.assertEqual(distinct, Base.df[keycol].nunique())
@@ -0,0 +1,105 @@
+"""
+Unittests for basedata.ops.tracking submodule
+"""
+from unittest import TestCase
+
+import pandas as pd
+
+from basedata.ops import BaseDataOps
+from basedata.ops.tracking import ChangeTracker
+from test_databuild import make_dirty_ids_dataframe, make_twocol_dataframe
+
+
+keycol = 'ids'
+
+
+def make_tracked_dataframe():
+    """builds dirty ids dataframe with a second untouched column"""
+    df = make_dirty_ids_dataframe(keycol)
+    df['other'] = range(len(df))
+    return df
+
+
+class ChangeTrackerTests(TestCase):
+    """unittests for tracking.ChangeTracker class"""
+
+    def test_rebuild_unchanged(self):
+        """ensure unchanged dataframe is rebuilt without recorded changes"""
+        df = make_twocol_dataframe()
+        Tracker = ChangeTracker(df)
+        self.assertEqual(
+            pd.testing.assert_frame_equal(df, Tracker.rebuild(df)),
+            None,
+        )
+        self.assertEqual(Tracker.memory_usage(), 0)
+
+    def test_record_columns_once(self):
+        """ensure only the first overwrite of a column is saved"""
+        df = make_twocol_dataframe()
+        original = df['col1'].tolist()
+        Tracker = ChangeTracker(df)
+        Tracker.record_columns(df, ['col1', 'new'])
+        df['col1'] = 0
+        Tracker.record_columns(df, ['col1'])
+        self.assertEqual(list(Tracker.snapshots), ['col1'])
+        self.assertEqual(Tracker.snapshots['col1'].tolist(), original)
+
+
+class TrackedOperationsTests(TestCase):
+    """unittests for BaseDataOps copy_input='track' mode"""
+
+    def test_input_df_not_tracked(self):
+        """ensure input_df is unavailable when changes are not tracked"""
+        Base = BaseDataOps.from_object(make_tracked_dataframe())
+        with self.assertRaises(AttributeError):
+            Base.input_df
+
+    def test_input_df_rebuilt(self):
+        """ensure input_df is rebuilt after columns and rows change"""
+        df = make_tracked_dataframe()
+        Base = BaseDataOps.from_object(df, copy_input='track')
+        Base.strip_nonnumeric(keycol)
+        Base.map_column_names({'other': 'renamed'})
+        Base.apply_function(['renamed'], lambda x: x * 2, 'renamed')
+        Base.add_column('new', 1)
+        Base.remove_offlenIDs(keycol, target_len=8)
+        Base.drop_blankID_rows(keycol)
+        Base.drop_dupes(keycol, [len(Base.df) - 1])
+        self.assertEqual(len(Base.tracker.snapshots), 2)
+        self.assertEqual(
+            pd.testing.assert_frame_equal(df, Base.input_df),
+            None,
+        )
+
+    def test_input_df_rebuilt_after_failure(self):
+        """ensure changes recorded for a failed method call are discarded"""
+        df = make_tracked_dataframe()
+        Base = BaseDataOps.from_object(df, copy_input='track')
+        with self.assertRaises(KeyError):
+            Base.drop_dupes(keycol, [0, len(df) + 99])
+        self.assertEqual(len(Base.df), len(df))
+        self.assertEqual(
+            pd.testing.assert_frame_equal(df, Base.input_df),
+            None,
+        )
+
+    def test_input_df_rebuilt_lazy(self):
+        """ensure fused lazy steps are tracked"""
+        df = make_tracked_dataframe()
+        Base = BaseDataOps.from_object(df, copy_input='track')
+        lazy = Base.lazy()
+        lazy.substitute_chars(keycol, '[ ]', '')
+        lazy.strip_nonnumeric(keycol)
+        lazy.collect()
+        self.assertEqual(
+            pd.testing.assert_frame_equal(df, Base.input_df),
+            None,
+        )
+
+    def test_tracker_memory_scales_with_changes(self):
+        """ensure untouched columns are never saved by the tracker"""
+        df = make_tracked_dataframe()
+        Base = BaseDataOps.from_object(df, copy_input='track')
+        Base.to_numeric('other')
+        self.assertEqual(list(Base.tracker.snapshots), ['other'])
+        self.assertEqual(Base.tracker.removed, [])
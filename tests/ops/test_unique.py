@@ -0,0 +1,140 @@
+"""
+Unittests for basedata.ops.unique submodule
+"""
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from basedata.ops import unique
+from basedata.ops import BaseDataOps
+from basedata.ops.unique import apply_unique, factorize_values,\
+    use_unique_values
+from test_databuild import make_dirty_ids_dataframe
+
+
+keycol = 'ids'
+
+
+def make_repetitive_series(n=20000):
+    """builds series of n rows holding few distinct dirty values"""
+    values = np.array(['1-23', '4 56', None, 'abc', 12], dtype=object)
+    return pd.Series(values[np.arange(n) % len(values)], name=keycol)
+
+
+class UniqueFunctionsTests(TestCase):
+    """unittests for functions located in unique submodule"""
+
+    def setUp(self):
+        self.min_rows = unique.UNIQUE_MIN_ROWS
+
+    def tearDown(self):
+        unique.UNIQUE_MIN_ROWS = self.min_rows
+
+    def test_use_unique_values(self):
+        """ensure only repetitive or categorical columns use unique values"""
+        series = make_repetitive_series()
+        self.assertTrue(use_unique_values(series))
+        self.assertFalse(use_unique_values(series[:100]))
+        self.assertTrue(use_unique_values(series[:100].astype('category')))
+        self.assertFalse(use_unique_values(pd.Series(np.arange(20000))))
+        unique.UNIQUE_MIN_ROWS = None
+        self.assertFalse(use_unique_values(series))
+
+    def test_apply_unique(self):
+        """ensure function is called once per distinct value and missing"""
+        series = make_repetitive_series()
+        series.index = np.arange(len(series)) % 7
+        calls = []
+
+        def function(values):
+            calls.append(len(values))
+            return values.astype(str).str.upper()
+
+        result = apply_unique(series, function)
+        self.assertEqual(calls, [4, len(series) // 5])
+        self.assertEqual(
+            result.tolist(),
+            series.astype(str).str.upper().tolist(),
+        )
+        self.assertTrue(result.index.equals(series.index))
+
+    def test_factorize_values(self):
+        """ensure equal values of different types are encoded separately"""
+        series = pd.Series([1, '1', 1.0, True, None, 1, np.nan, True])
+        codes, uniques = factorize_values(series)
+        self.assertEqual(codes.tolist(), [0, 1, 2, 3, -1, 0, -1, 3])
+        self.assertEqual(
+            [type(val) for val in uniques],
+            [int, str, float, bool],
+        )
+        codes, uniques = factorize_values(pd.Series([0.0, -0.0, 0.0]))
+        self.assertEqual(codes.tolist(), [0, 1, 0])
+        codes, uniques = factorize_values(
+            pd.Series(['a', 0.0, -0.0, 0, -0.0, None], dtype=object)
+        )
+        self.assertEqual(codes.tolist(), [0, 1, 2, 3, 2, -1])
+        self.assertEqual(str(uniques[2]), '-0.0')
+
+    def test_apply_unique_categorical(self):
+        """ensure categorical columns stay categorical"""
+        series = make_repetitive_series(100).astype('category')
+        result = apply_unique(series, lambda values: values.astype(str))
+        self.assertEqual(result.dtype, 'category')
+        self.assertEqual(
+            result.astype(object).tolist(),
+            series.astype(str).tolist(),
+        )
+
+
+class UniqueOperationsTests(TestCase):
+    """unittests for BaseDataOps methods run once per distinct value"""
+
+    def test_unique_results_match(self):
+        """ensure results match those of the per row transformation"""
+        df = pd.concat([make_dirty_ids_dataframe(keycol)] * 2000,
+                       ignore_index=True)
+        min_rows = unique.UNIQUE_MIN_ROWS
+        results = []
+        try:
+            for unique.UNIQUE_MIN_ROWS in (None, 0):
+                Base = BaseDataOps.from_object(df)
+                Base.strip_nonnumeric(keycol)
+                Base.remove_offlenIDs(keycol)
+                Base.map_values(keycol, {'12345678': 'dupe'})
+                results.append(Base.df[keycol])
+        finally:
+            unique.UNIQUE_MIN_ROWS = min_rows
+        self.assertEqual(
+            pd.testing.assert_series_equal(*results),
+            None,
+        )
+
+    def test_unique_mixed_types_match(self):
+        """ensure equal values of different types are transformed apart"""
+        values = np.array([1, 1.0, True, '1', None, 12345678, 12345678.0,
+                           '1,234', 1.5, -0.0, 0.0], dtype=object)
+        df = pd.DataFrame({
+            keycol: values[np.arange(unique.UNIQUE_MIN_ROWS) % len(values)],
+        })
+        min_rows = unique.UNIQUE_MIN_ROWS
+        results = []
+        try:
+            for unique.UNIQUE_MIN_ROWS in (None, min_rows):
+                Base = BaseDataOps.from_object(df)
+                Base.substitute_chars(keycol, '[.]', '_',
+                                      target_column='sub')
+                Base.remove_offlenIDs(keycol, target_column='offlen')
+                Base.parse_numeric(keycol, target_column='numeric')
+                results.append(Base.df)
+        finally:
+            unique.UNIQUE_MIN_ROWS = min_rows
+        self.assertEqual(
+            results[1]['sub'].tolist()[:11],
+            ['1', '1_0', 'True', '1', 'None', '12345678', '12345678_0',
+             '1,234', '1_5', '-0_0', '0_0'],
+        )
+        self.assertEqual(
+            pd.testing.assert_frame_equal(*results),
+            None,
+        )
@@ -0,0 +1,152 @@
+"""
+Unittests for basedata.ops.writers submodule
+"""
+import bz2
+import gzip
+import os
+from unittest import TestCase
+from tempfile import TemporaryDirectory
+
+import pandas as pd
+
+from basedata.ops import BaseDataOps
+from basedata.ops.writers import compress_block, infer_compression,\
+    is_block_compression, write_csv_blocks
+from test_databuild import make_dirty_numeric_dataframe, make_dataframe,\
+    make_id_dict
+
+
+def make_large_dataframe(n=1000):
+    """builds dataframe with enough rows to be written in several blocks"""
+    return make_dataframe([
+        make_id_dict(n=n, keyname='col1'),
+        make_id_dict(n=n, keyname='col2'),
+    ])
+
+
+class WritersFunctionsTests(TestCase):
+    """unittests for functions located in writers submodule"""
+
+    def test_infer_compression(self):
+        """ensure compression type is inferred from extension"""
+        self.assertEqual(infer_compression('test.csv.gz'), 'gzip')
+        self.assertEqual(infer_compression('test.csv.bz2'), 'bz2')
+        self.assertEqual(infer_compression('test.csv.zst'), 'zstd')
+        self.assertIsNone(infer_compression('test.csv'))
+
+    def test_is_block_compression(self):
+        """ensure only gzip, bz2, zstd, and no compression are written"""
+        self.assertTrue(is_block_compression('test.csv.gz'))
+        self.assertTrue(is_block_compression('test.csv'))
+        self.assertTrue(is_block_compression('test.csv', 'bz2'))
+        self.assertTrue(is_block_compression('test.csv.gz', None))
+        self.assertFalse(is_block_compression('test.csv.xz'))
+        self.assertFalse(is_block_compression('test.csv.tar.gz'))
+        self.assertFalse(is_block_compression('test.csv', 'zip'))
+        self.assertFalse(
+            is_block_compression('test.csv', {'method': 'gzip'}),
+        )
+
+    def test_compress_block(self):
+        """ensure compressed blocks decompress to the input bytes"""
+        data = b'col1,col2\n1,2\n'
+        self.assertEqual(gzip.decompress(compress_block(data, 'gzip')), data)
+        self.assertEqual(bz2.decompress(compress_block(data, 'bz2')), data)
+        self.assertEqual(compress_block(data, None), data)
+        with self.assertRaises(ValueError):
+            compress_block(data, 'lzma')
+
+    def test_write_csv_blocks_matches_to_csv(self):
+        """ensure decompressed output matches single-threaded to_csv"""
+        df = make_large_dataframe()
+        csv_test = df.to_csv(index=False)
+        with TemporaryDirectory() as tmp:
+            for name, open_func in (('test.csv.gz', gzip.open),
+                                    ('test.csv.bz2', bz2.open),
+                                    ('test.csv', open)):
+                fp = os.path.join(tmp, name)
+                write_csv_blocks(df, fp, jobs=3, block_size=99)
+                with open_func(fp, 'rt', newline='') as f:
+                    self.assertEqual(f.read(), csv_test)
+
+    def test_write_csv_blocks_header_encoding(self):
+        """ensure header and encoding args apply to the whole file"""
+        df = make_large_dataframe()
+        df['col3'] = 'é'
+        header = ['a', 'b', 'c']
+        with TemporaryDirectory() as tmp:
+            fp = os.path.join(tmp, 'test.csv.gz')
+            write_csv_blocks(df, fp, jobs=2, block_size=99, header=header,
+                             encoding='latin-1')
+            with gzip.open(fp, 'rb') as f:
+                self.assertEqual(
+                    f.read(),
+                    df.to_csv(index=False, header=header).encode('latin-1'),
+                )
+            write_csv_blocks(df, fp, block_size=99, header=False)
+            with gzip.open(fp, 'rt') as f:
+                self.assertEqual(f.read(), df.to_csv(index=False,
+                                                     header=False))
+
+    def test_write_csv_blocks_empty(self):
+        """ensure empty dataframe is written with its header"""
+        df = make_large_dataframe().iloc[:0]
+        with TemporaryDirectory() as tmp:
+            fp = os.path.join(tmp, 'test.csv.gz')
+            write_csv_blocks(df, fp)
+            with gzip.open(fp, 'rt') as f:
+                self.assertEqual(f.read(), ','.join(df.columns) + '\n')
+
+
+class CompressedToFileTests(TestCase):
+    """unittests for compressed BaseDataClass.to_file output"""
+
+    def test_to_file_compressed_roundtrip(self):
+        """ensure compressed csv is written and read back by from_file"""
+        df_test = make_large_dataframe()
+        with TemporaryDirectory() as tmp:
+            fp = os.path.join(tmp, 'test.csv.gz')
+            BaseDataOps.from_object(df_test).to_file(fp, jobs=2)
+            df_read = BaseDataOps.from_file(fp).df
+            self.assertEqual(
+                pd.testing.assert_frame_equal(df_test, df_read),
+                None,
+            )
+
+    def test_to_file_to_csv_compression(self):
+        """ensure compression types not written in blocks use to_csv"""
+        df_test = make_large_dataframe()
+        with TemporaryDirectory() as tmp:
+            for filename, compression in [
+                ('test.csv.xz', None),
+                ('test.csv', 'xz'),
+                ('test.csv.zip', None),
+                ('test.csv', 'zip'),
+                ('test.csv.gz', {'method': 'gzip', 'compresslevel': 1}),
+            ]:
+                fp = os.path.join(tmp, filename)
+                kwargs = {'compression': compression} if compression else {}
+                BaseDataOps.from_object(df_test).to_file(fp, **kwargs)
+                df_read = pd.read_csv(
+                    fp, compression=kwargs.get('compression', 'infer'),
+                )
+                self.assertEqual(
+                    pd.testing.assert_frame_equal(df_test, df_read),
+                    None,
+                )
+                os.remove(fp)
+
+    def test_to_file_background(self):
+        """ensure background write saves self.df as of the to_file call"""
+        df_test = make_dirty_numeric_dataframe()
+        with TemporaryDirectory() as tmp:
+            fp = os.path.join(tmp, 'test.csv.bz2')
+            Base = BaseDataOps.from_object(df_test)
+            future = Base.to_file(fp, background=True)
+            Base.to_numeric('test')
+            future.result()
+            df_read = pd.read_csv(fp, keep_default_na=False)
+            self.assertEqual(
+                df_read['test'].astype(str).tolist(),
+                df_test['test'].fillna('').astype(str).tolist(),
+            )